@@ -1,300 +1,234 @@
 import numpy as np
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, g, make_response, render_template, jsonify, request, stream_with_context, url_for
 from t_plane.core.tau_plane import TauPlane
+from t_plane.core.adaptive import adaptive_sample
+from t_plane.core.expression import compile_expression, normalize_expression
+from t_plane.core.parallel import EvaluationCancelled, GridEvaluator, SharedGrid
+from t_plane.analysis.argument_principle import locate_zeros_and_poles
 from t_plane.analysis.riemann import RiemannAnalysis
-import math
-import re
-import ast
-from sympy import symbols, diff, sympify, solve, roots, series, lambdify
-from sympy.abc import z
-from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application
+from t_plane.analysis.zeta import zeta
+from t_plane.analysis.zeros import estimated_zero_count
+from t_plane.interactive.admission import AdmissionController, Overloaded
+from t_plane.interactive.analysis_service import AnalysisService
+from t_plane.interactive.cancellation import ClientRequests
+from t_plane.interactive.coalescing import SingleFlight
+from t_plane.interactive.encoding import BINARY_MIMETYPE, encode_binary, sse_event, to_jsonable
+from t_plane.interactive.metrics import NULL_TIMER, PlotMetrics
+from t_plane.interactive.progressive import progressive_evaluate, refinement_strides
+from t_plane.visualization.coloring import domain_coloring_values
+from t_plane.visualization.image import encode_image
+from t_plane.interactive.viewport import ViewportCache
+from t_plane.interactive.tiles import (TILE_SIZE, BASE_TILE_SPAN, MAX_ZOOM, ZETA_HASH,
+                                      FunctionRegistry, TileCache, tile_axes)
+import os
+from functools import partial, wraps
 # We might need to adapt the plotter or create a new one for web use
 # from t_plane.visualization.plotter import TauPlotter 
-import mpmath as mp
 import traceback
 
 app = Flask(__name__)
 
 # Initialize core components (adjust delta as needed)
 tau_plane_instance = TauPlane(delta=1e-3) 
-riemann_analyzer = RiemannAnalysis(tau_plane_instance)
-# plotter_instance = TauPlotter(tau_plane_instance) # Keep for now, might adapt
+# Optional precomputed zero table (python -m t_plane.analysis.zero_table)
+riemann_analyzer = RiemannAnalysis(tau_plane_instance,
+                                   zero_table=os.environ.get('TAU_PLANE_ZERO_TABLE') or None)
 
-@app.route('/')
-def index():
-    """Serve the main HTML page."""
-    return render_template('index.html')
+# Rendered tiles, bounded by a memory budget (TAU_PLANE_TILE_CACHE_MB)
+tile_cache = TileCache(max_bytes=int(os.environ.get('TAU_PLANE_TILE_CACHE_MB', 256)) * 1024 * 1024)
+tile_functions = FunctionRegistry()
+
+# Last grid per view for incremental pans (TAU_PLANE_VIEWPORT_CACHE_MB)
+viewport_cache = ViewportCache(max_bytes=int(os.environ.get('TAU_PLANE_VIEWPORT_CACHE_MB', 128)) * 1024 * 1024)
+
+# Largest number of Riemann zeros drawn on a zeta plot
+MAX_OVERLAY_ZEROS = 10000
+
+# Zero windows above this height are only served from a zero table
+MAX_COMPUTED_ZERO_T = 1e7
+
+# Largest edge length in pixels of /api/plot_image
+MAX_IMAGE_POINTS = 4096
+
+# Most jobs accepted by one /api/plot_batch request
+MAX_BATCH_JOBS = 16
+
+# Largest grid edge of /api/plot_batch; every job's grids are held until serialization
+MAX_BATCH_POINTS = 1000
+
+# Value grids a plot result can carry
+VALUE_FIELDS = ('phase', 'magnitude', 'log_magnitude', 'real_part', 'imag_part')
+PLOT_TYPES = ('zeta', 'general_func', 'simple_func')
+PLANES = ('tau_plane', 'z_plane', 'w_plane')
+
+# Symbolic analysis runs in worker processes with a hard per-request time limit
+analysis_service = AnalysisService(
+    max_workers=int(os.environ.get('TAU_PLANE_ANALYSIS_WORKERS', 2)),
+    timeout=float(os.environ.get('TAU_PLANE_ANALYSIS_TIMEOUT', 10.0)))
 
-def analyze_function(function_str, is_zeta=False):
+# Full-grid evaluation is split into row blocks across worker processes
+# (TAU_PLANE_EVAL_WORKERS, default: all CPUs; TAU_PLANE_EVAL_BACKEND 'process' or 'thread')
+grid_evaluator = GridEvaluator(
+    workers=int(os.environ.get('TAU_PLANE_EVAL_WORKERS', 0)) or None,
+    backend=os.environ.get('TAU_PLANE_EVAL_BACKEND', 'process'))
+
+# Per-stage timings of /api/plot_data, sent as a Server-Timing header and
+# aggregated for /metrics (TAU_PLANE_METRICS=0 turns both off)
+plot_metrics = PlotMetrics(enabled=os.environ.get('TAU_PLANE_METRICS', '1') != '0')
+
+# Concurrent requests per class of work, so slow zeta or SymPy requests
+# cannot starve cheap plots; excess requests queue, then get 503
+admission_controller = AdmissionController(
+    limits={
+        'plot': int(os.environ.get('TAU_PLANE_PLOT_CONCURRENCY', 8)),
+        'zeta': int(os.environ.get('TAU_PLANE_ZETA_CONCURRENCY', 2)),
+        'analysis': int(os.environ.get('TAU_PLANE_ANALYSIS_CONCURRENCY', 2)),
+    },
+    queue_size=int(os.environ.get('TAU_PLANE_QUEUE_SIZE', 32)),
+    max_wait=float(os.environ.get('TAU_PLANE_QUEUE_TIMEOUT', 30.0)))
+
+def admitted(work_class):
     """
-    Perform mathematical analysis on a function to find critical points,
-    singularities, and other properties.
+    Run a view only once admission_controller grants it a slot.
     
     Args:
-        function_str: String representation of the function to analyze
-        is_zeta: Boolean indicating whether the function is the Riemann Zeta function
-        
-    Returns:
-        A dictionary containing analysis results
+        work_class: Called with the view's arguments (inside the request
+            context) to name the class of work: 'plot', 'zeta' or 'analysis'
+    
+    Rejected requests get 503 with a Retry-After header. Admitted responses
+    report the time spent queued in X-Queue-Wait (milliseconds) and as the
+    'queue' Server-Timing entry. Streamed responses keep their slot until
+    the stream closes.
     """
-    if is_zeta:
-        # Special analysis for the Riemann Zeta function
-        return analyze_zeta_function()
+    def decorator(view):
+        @wraps(view)
+        def wrapper(**kwargs):
+            try:
+                admission = admission_controller.acquire(work_class(**kwargs))
+            except Overloaded as e:
+                response = jsonify({'error': str(e)})
+                response.status_code = 503
+                response.headers['Retry-After'] = str(e.retry_after)
+                return response
+            try:
+                response = make_response(view(**kwargs))
+            except BaseException:
+                admission.release()
+                raise
+            if response.is_streamed:
+                response.call_on_close(admission.release)
+            else:
+                admission.release()
+            response.headers['X-Queue-Wait'] = f"{admission.wait * 1e3:.2f}"
+            response.headers.add('Server-Timing', f"queue;dur={admission.wait * 1e3:.2f}")
+            return response
+        return wrapper
+    return decorator
+
+# Identical plot requests in flight at the same time share one computation
+plot_flights = SingleFlight()
+
+def coalesced(view):
+    """
+    Serve concurrent identical requests to a view from one computation.
     
-    try:
-        # Set up SymPy for parsing with implicit multiplication
-        transformations = standard_transformations + (implicit_multiplication_application,)
-        
-        # Convert to a format SymPy can parse
-        sympy_str = (function_str
-            .replace('^', '**')
-            .replace('sin', 'sin')  # Already in SymPy format
-            .replace('cos', 'cos')  # Already in SymPy format
-            .replace('tan', 'tan')  # Already in SymPy format
-            .replace('exp', 'exp')  # Already in SymPy format
-            .replace('log', 'log')  # Already in SymPy format
-            .replace('sqrt', 'sqrt')  # Already in SymPy format
-            .replace('pi', 'pi')     # Already in SymPy format
-            .replace('e', 'E')       # Convert to SymPy's E
-        )
-        
-        # Parse the expression
-        expr = parse_expr(sympy_str, transformations=transformations)
-        
-        # Calculate the derivative
-        derivative = diff(expr, z)
-        second_derivative = diff(derivative, z)
-        
-        # Find critical points (where derivative = 0)
-        critical_points = []
-        try:
-            solutions = list(roots(derivative, z))
-            if not solutions:
-                solutions = solve(derivative, z)
-            
-            # Convert solutions to a list of complex numbers
-            for sol in solutions:
-                if sol.is_real:
-                    z_value = complex(float(sol), 0)
-                else:
-                    z_value = complex(float(sol.as_real_imag()[0]), float(sol.as_real_imag()[1]))
-                
-                # Determine point type (maximum, minimum, saddle, etc.)
-                try:
-                    # Calculate second derivative at this point
-                    second_deriv_val = complex(second_derivative.subs(z, sol))
-                    
-                    if second_deriv_val.real > 0:
-                        point_type = "Minimum"
-                    elif second_deriv_val.real < 0:
-                        point_type = "Maximum"
-                    else:
-                        point_type = "Saddle point or inflection"
-                except:
-                    point_type = "Unknown"
-                
-                # Convert z back to tau space
-                tau_value = 1.0 / z_value if z_value != 0 else None
-                
-                if tau_value is not None:
-                    critical_points.append({
-                        'z_real': z_value.real,
-                        'z_imag': z_value.imag,
-                        'tau_real': tau_value.real if not math.isinf(tau_value.real) else 0,
-                        'tau_imag': tau_value.imag if not math.isinf(tau_value.imag) else 0,
-                        'type': point_type,
-                        'function_value': str(expr.subs(z, sol))
-                    })
-        except Exception as e:
-            print(f"Error finding critical points: {e}")
-            pass  # Critical points analysis failed
-        
-        # Find domain properties (singularities, branch points)
-        domain_properties = {
-            'description': 'Complex analytic function',
-            'singularities': 'None detected',
-            'branch_points': 'None detected',
-            'domain': 'Entire complex plane',
-            'growth_rate': 'Undetermined'
-        }
-        
-        # Check for potential singularities
-        try:
-            # Look for division by expressions that could be zero
-            if '/' in function_str:
-                domain_properties['description'] = 'Meromorphic function with possible poles'
-                domain_properties['singularities'] = 'Potential poles where denominator = 0'
-                domain_properties['domain'] = 'Complex plane excluding singularities'
-            
-            # Check for logarithms or fractional powers that could create branch cuts
-            if 'log' in function_str or 'sqrt' in function_str or re.search(r'\^\s*\d*\.\d+', function_str):
-                if 'log' in function_str:
-                    domain_properties['description'] = 'Function with logarithmic branch cut'
-                    domain_properties['branch_points'] = 'At z = 0 extending to -∞'
-                    domain_properties['domain'] = 'Complex plane excluding branch cut'
-                elif 'sqrt' in function_str:
-                    domain_properties['description'] = 'Function with square root branch cut'
-                    domain_properties['branch_points'] = 'Present (specific points not calculated)'
-                    domain_properties['domain'] = 'Complex plane excluding branch cut'
-            
-            # Determine growth rate for polynomial-like functions
-            if all(term not in function_str for term in ['sin', 'cos', 'tan', 'exp', 'log']):
-                try:
-                    # Check if function resembles a polynomial (by examining highest power)
-                    degree = 0
-                    if 'z**' in sympy_str:
-                        powers = re.findall(r'z\*\*(\d+)', sympy_str)
-                        if powers:
-                            degree = max(int(p) for p in powers)
-                    
-                    if degree > 0:
-                        domain_properties['growth_rate'] = f"O(|z|^{degree}) as |z| → ∞"
-                    else:
-                        domain_properties['growth_rate'] = "Bounded or sublinear growth"
-                except:
-                    pass
-            elif 'exp' in function_str:
-                domain_properties['growth_rate'] = "Exponential growth"
-        except Exception as e:
-            print(f"Error analyzing domain: {e}")
-            pass  # Domain analysis failed
-        
-        # Function series expansion
-        try:
-            # Get Taylor series around z=0 (up to order 5)
-            taylor_series = series(expr, z, 0, 5).removeO()
-            domain_properties['series_expansion'] = str(taylor_series)
-            
-            # Get Laurent series for functions with singularity at z=0
-            if '/' in function_str and 'z' in function_str.split('/')[1]:
-                from sympy import Laurent
-                try:
-                    laurent_series = series(expr, z, 0, n=None)
-                    domain_properties['laurent_expansion'] = str(laurent_series)
-                except:
-                    pass
-        except Exception as e:
-            print(f"Error calculating series: {e}")
-            domain_properties['series_expansion'] = "Could not compute Taylor series"
-        
-        # Check special values and limits
-        special_values = {}
-        try:
-            special_values['at_zero'] = str(expr.subs(z, 0)) if '/' not in function_str or 'z' not in function_str.split('/')[1] else "Undefined (singularity)"
-            special_values['at_one'] = str(expr.subs(z, 1))
-            special_values['at_i'] = str(expr.subs(z, 1j))
-            
-            # Add limits for more context
-            from sympy import limit, oo
-            if '/' in function_str:
-                # Try to compute limit at infinity
-                try:
-                    lim_inf = limit(expr, z, oo)
-                    special_values['limit_at_infinity'] = str(lim_inf)
-                except:
-                    special_values['limit_at_infinity'] = "Could not compute"
-        except Exception as e:
-            print(f"Error calculating special values: {e}")
-            pass
-        
-        # Differential equation information
-        diff_eq_info = {}
-        try:
-            # Check if function satisfies a simple differential equation
-            if 'sin' in function_str:
-                diff_eq_info['note'] = "Function may satisfy y'' + y = 0 (harmonic oscillator equation)"
-            elif 'exp' in function_str:
-                diff_eq_info['note'] = "Function may satisfy y' = y (exponential growth equation)"
-            elif any(fn in function_str for fn in ['tan', 'cot']):
-                diff_eq_info['note'] = "Function may satisfy a nonlinear first-order differential equation"
-        except Exception as e:
-            print(f"Error in differential equation analysis: {e}")
-            pass
+    Requests are identical when they have the same path and the same query
+    parameters in any order, apart from client_id, with the function
+    normalized as by normalize_expression. Followers receive a copy
+    of the leader's serialized response (status, headers and body) marked
+    with X-Coalesced: 1. Apply inside cancellable: each request keeps its own
+    cancel flag, a superseded follower answers 409 at once, and the shared
+    computation stops only when every request waiting on it is superseded;
+    a follower still current when that happens computes afresh. Viewport
+    and progressive requests are never coalesced: the first depends on
+    per-view state, the second is streamed.
+    """
+    @wraps(view)
+    def wrapper(**kwargs):
+        if (request.args.get('viewport', 'false').lower() == 'true'
+                or request.args.get('progressive', 'false').lower() == 'true'):
+            return view(**kwargs)
+        # Spellings of one expression ('z^2', 'z**2') share the flight, as in the compile cache
+        args = [(name, normalize_expression(value) if name == 'function' else value)
+                for name, value in request.args.items(multi=True) if name != 'client_id']
+        key = (request.path, tuple(sorted(args)))
+        own_cancel = g.get('cancel')
         
-        return {
-            'critical_points': critical_points,
-            'domain_properties': domain_properties,
-            'special_values': special_values,
-            'differential_equations': diff_eq_info
-        }
+        def compute(flight_cancel):
+            g.cancel = flight_cancel
+            response = make_response(view(**kwargs))
+            return response.status_code, list(response.headers.items()), response.get_data()
         
-    except Exception as e:
-        print(f"Function analysis failed: {e}")
-        return {
-            'error': f"Analysis failed: {str(e)}",
-            'critical_points': [],
-            'domain_properties': {
-                'description': 'Analysis failed',
-                'singularities': 'Unknown',
-                'branch_points': 'Unknown'
-            }
-        }
+        while True:
+            try:
+                (status, headers, body), shared = plot_flights.do(key, compute, own_cancel)
+            except EvaluationCancelled:
+                return superseded_response()
+            if not (shared and status == SUPERSEDED_STATUS):
+                break
+            if own_cancel is not None and own_cancel.is_set():
+                return superseded_response()
+        response = Response(body, status=status, headers=headers)
+        if shared:
+            response.headers['X-Coalesced'] = '1'
+        return response
+    return wrapper
+
+# The latest request per client_id; a newer one cancels the evaluation of the older
+client_requests = ClientRequests()
+
+# Status of a request cancelled by a newer request of the same client
+SUPERSEDED_STATUS = 409
 
-def analyze_zeta_function():
+def cancellable(view):
     """
-    Special analysis for the Riemann Zeta function.
+    Let a newer request with the same client_id cancel this one.
     
-    Returns:
-        Dictionary containing zeta-specific analysis results
-    """
-    # Define important properties of the Riemann Zeta function
-    critical_points = [
-        {
-            'z_real': -1.0,
-            'z_imag': 0.0,
-            'tau_real': -1.0,
-            'tau_imag': 0.0,
-            'type': 'Extremum',
-            'function_value': '-1/12'
-        }
-    ]
-    
-    domain_properties = {
-        'description': 'Meromorphic function with analytic continuation',
-        'singularities': 'Simple pole at s = 1',
-        'branch_points': 'None',
-        'domain': 'Entire complex plane except s = 1',
-        'growth_rate': 'Various rates in different regions',
-        'series_expansion': 'ζ(s) = 1/s-1 + Σ(-1)^n γ_n/(n!) · (s-1)^n for s near 1',
-        'laurent_expansion': '1/(s-1) + γ + O((s-1))'
-    }
-    
-    special_values = {
-        'at_zero': '-1/2',
-        'at_two': 'π²/6 ≈ 1.645',
-        'at_four': 'π⁴/90 ≈ 1.082',
-        'at_negative_even': '0 (trivial zeros)',
-        'functional_equation': 'ζ(s) = 2^s · π^(s-1) · sin(πs/2) · Γ(1-s) · ζ(1-s)',
-        'critical_line': 'Re(s) = 1/2 is where all non-trivial zeros are conjectured to lie (Riemann Hypothesis)'
-    }
-    
-    important_facts = {
-        'riemann_hypothesis': 'All non-trivial zeros lie on the critical line Re(s) = 1/2',
-        'prime_number_connection': 'Euler product formula: ζ(s) = ∏ᵨ(1 - p^(-s))^(-1)',
-        'analytic_continuation': 'Originally defined for Re(s) > 1, but can be extended to the entire complex plane',
-        'reflection_formula': 'ζ(1-s) = 2^(1-s) · π^(-s) · cos(πs/2) · Γ(s) · ζ(s)',
-        'number_theory': 'Central to the distribution of prime numbers through the Prime Number Theorem',
-        'trivial_zeros': 'At negative even integers: -2, -4, -6, ...',
-        'first_few_zeros': [
-            '1/2 + 14.1347i',
-            '1/2 + 21.0220i',
-            '1/2 + 25.0109i',
-            '1/2 + 30.4249i',
-            '1/2 + 32.9351i'
-        ]
-    }
-    
-    return {
-        'critical_points': critical_points,
-        'domain_properties': domain_properties,
-        'special_values': special_values,
-        'important_facts': important_facts
-    }
+    The request's cancel flag is stored as g.cancel (None without a
+    client_id) for the view to pass to GridEvaluator.evaluate. It is
+    registered on arrival, before admission, so requests supersede each
+    other in the order the client sent them.
+    """
+    @wraps(view)
+    def wrapper(**kwargs):
+        client_id = request.args.get('client_id')
+        if not client_id:
+            g.cancel = None
+            return view(**kwargs)
+        g.cancel = cancel = client_requests.start(client_id)
+        try:
+            response = make_response(view(**kwargs))
+        except BaseException:
+            client_requests.finish(client_id, cancel)
+            raise
+        if response.is_streamed:
+            response.call_on_close(partial(client_requests.finish, client_id, cancel))
+        else:
+            client_requests.finish(client_id, cancel)
+        return response
+    return wrapper
+
+def superseded_response():
+    """Response to a request cancelled by a newer one of the same client."""
+    return jsonify({'error': 'Superseded by a newer request from this client'}), SUPERSEDED_STATUS
+
+def plot_work_class(**kwargs):
+    """Work class of plot requests: zeta plots are far slower than expressions."""
+    return 'zeta' if request.args.get('plot_type') == 'zeta' else 'plot'
+# plotter_instance = TauPlotter(tau_plane_instance) # Keep for now, might adapt
+
+@app.route('/')
+def index():
+    """Serve the main HTML page."""
+    return render_template('index.html')
 
 def evaluate_function(z_values, function_str):
     """
     Safely evaluate a mathematical function string for an array of complex values.
     
+    The string is parsed into a validated AST and compiled once; repeated
+    requests for the same function reuse the cached compiled expression.
+    
     Args:
         z_values: NumPy array of complex values
         function_str: String representation of function using 'z' as variable
@@ -302,44 +236,183 @@ def evaluate_function(z_values, function_str):
     Returns:
         NumPy array of resulting complex values
     """
-    # Sanitize and validate function string for security
-    # Only allow valid math operations and functions
-    if not re.match(r'^[0-9z\s\+\-\*\/\(\)\.\,\^\|\&\!\=\>\<\%\:\~sine\scosine\stan\slog\sexp\sabs\ssqrt\spi\se]+$', 
-                   function_str.replace('sin', 'sine').replace('cos', 'cosine').replace('tan', 'tan')
-                   .replace('sqrt', 'sqrt').replace('log', 'log').replace('exp', 'exp')
-                   .replace('pi', 'pi').replace('e', 'e')):
-        raise ValueError("Invalid function string. Only use z and basic operations.")
-    
-    # Replace caret with power operator
-    function_str = function_str.replace('^', '**')
-    
-    # Create evaluation namespace with all necessary functions
-    namespace = {
-        "np": np,
-        "z_values": z_values,
-        "sin": np.sin,
-        "cos": np.cos,
-        "tan": np.tan,
-        "log": np.log,
-        "exp": np.exp,
-        "sqrt": np.sqrt,
-        "abs": np.abs,
-        "pi": np.pi,
-        "e": np.e
-    }
-    
-    # Replace z with z_values
-    function_str = function_str.replace('z', 'z_values')
+    # Raises ValueError for anything other than z, numbers, basic operators
+    # and the whitelisted math functions
+    compiled = compile_expression(function_str)
     
     try:
         # Evaluate the function with NumPy functions for the array
-        result = eval(function_str, namespace)
-        return result
+        return compiled(z_values)
     except Exception as e:
         raise ValueError(f"Error evaluating function: {str(e)}")
 
+def evaluate_in_plane(plot_type, function_str, plane, tau_values, w_values=None):
+    """
+    Evaluate the selected function over a grid of τ values for one plane.
+    
+    Args:
+        plot_type: 'zeta', 'general_func' or 'simple_func'
+        function_str: Function of z to evaluate (ignored for zeta)
+        plane: 'tau_plane', 'z_plane' or 'w_plane'
+        tau_values: Complex τ grid
+        w_values: Precomputed log(τ) for the w-plane (computed if omitted)
+        
+    Returns:
+        NumPy array of complex function values with the shape of tau_values
+    """
+    if plane == 'w_plane':
+        # In w-plane, w = log(τ) = -log(z), so z = exp(-w)
+        if w_values is None:
+            w_values = np.log(tau_values)
+        z_values = np.exp(-w_values)
+    elif plane == 'tau_plane' or (plane == 'z_plane' and plot_type == 'zeta'):
+        # In τ-plane: τ = 1/z, so z = 1/τ. The zeta z-plane view uses the
+        # same 1/τ transformation for its special coordinate system.
+        # τ = 0 (infinity) evaluates to NaN.
+        z_values = tau_plane_instance.from_tau(tau_values, on_zero='nan')
+    elif plane == 'z_plane':
+        # In z-plane (direct), we evaluate the function directly at tau values
+        # but still exclude the origin (representing infinity)
+        z_values = tau_values
+    else:
+        raise ValueError(f"Unknown plane '{plane}'")
+    return evaluate_z(plot_type, function_str, z_values)
+
+def evaluate_z(plot_type, function_str, z_values):
+    """Evaluate zeta (for plot_type 'zeta') or the function string at z_values."""
+    if plot_type == 'zeta':
+        # Evaluate the Riemann zeta function over the whole grid at once
+        return zeta(z_values)
+    return evaluate_function(z_values, function_str)
+
+def conjugate_symmetric(plot_type, function_str):
+    """
+    Whether f(conj z) = conj f(z) holds for the selected function.
+    
+    True for zeta and for expressions with real coefficients (see
+    CompiledExpression.conjugate_symmetric). Since z = 1/τ, z = τ and
+    w = log τ all commute with conjugation, a τ grid symmetric about the
+    real axis then only needs its upper half evaluated in every plane.
+    """
+    return plot_type == 'zeta' or compile_expression(function_str).conjugate_symmetric
+
+def grid_values(plot_type, function_str, plane, tau_x, tau_y, cancel=None):
+    """
+    Evaluate the selected function on the grid spanned by two axes.
+    
+    The direct z-plane origin is marked as NaN, as in plot_data. cancel is
+    passed on to GridEvaluator.evaluate.
+    
+    Returns:
+        NumPy array of complex function values indexed [y, x]
+    """
+    tau_values = tau_x[np.newaxis, :] + 1j * tau_y[:, np.newaxis]
+    if plane == 'z_plane' and plot_type != 'zeta':
+        tau_values[np.abs(tau_values) < 1e-10] = np.nan
+    return grid_evaluator.evaluate(partial(evaluate_in_plane, plot_type, function_str, plane), tau_values,
+                                   cancel=cancel, conjugate_symmetric=conjugate_symmetric(plot_type, function_str))
+
+def value_fields(func_values, fields=VALUE_FIELDS):
+    """Compute the requested grids (a subset of VALUE_FIELDS) of func_values."""
+    result = {}
+    # Extract phase and magnitude for plotting
+    if 'phase' in fields:
+        result['phase'] = np.angle(func_values)
+    if 'magnitude' in fields or 'log_magnitude' in fields:
+        magnitude = np.abs(func_values)
+        if 'magnitude' in fields:
+            result['magnitude'] = magnitude
+        if 'log_magnitude' in fields:
+            # Take the log of magnitude to better visualize large variations
+            result['log_magnitude'] = np.log10(np.maximum(magnitude, 1e-10))
+    
+    # Extract real and imaginary parts for 2D plotting
+    if 'real_part' in fields:
+        result['real_part'] = np.real(func_values)
+    if 'imag_part' in fields:
+        result['imag_part'] = np.imag(func_values)
+    return result
+
+def add_value_fields(result, func_values):
+    """Add the phase, magnitude and real/imaginary grids of func_values to result."""
+    result.update(value_fields(func_values))
+    return result
+
+def plot_response(result, timer=NULL_TIMER):
+    """
+    Serialize a plot result in the format negotiated by the request.
+    
+    With format=binary the grids are sent as contiguous little-endian
+    buffers (see t_plane.interactive.encoding) that the client can view as
+    typed arrays; the optional dtype argument selects float32 (default) or
+    float64. Otherwise the result is returned as JSON.
+    
+    Serialization stages are recorded on timer ('encode', or 'tolist' and
+    'jsonify').
+    """
+    if request.args.get('format', 'json') == 'binary':
+        payload = encode_binary(result, request.args.get('dtype', 'float32'))
+        timer.lap('encode')
+        return Response(payload, mimetype=BINARY_MIMETYPE)
+    payload = to_jsonable(result)
+    timer.lap('tolist')
+    response = jsonify(payload)
+    timer.lap('jsonify')
+    return response
+
+def add_server_timing(response, timer):
+    """Attach the timer's stages to response as a Server-Timing header."""
+    header = timer.server_timing()
+    if header:
+        response.headers['Server-Timing'] = header
+    return response
+
+def progressive_response(result, plot_type, function_str, plane, tau_values):
+    """
+    Stream a plot as Server-Sent Events, coarse to fine.
+    
+    The first 'level' event carries a ~32×32 subsample of the grid; each
+    following level doubles the resolution, evaluating only the samples
+    not computed before, until the full grid is sent with "final": true.
+    The stream ends early, without an error event, if the request is
+    superseded.
+    """
+    points = tau_values.shape[0]
+    strides = refinement_strides(points)
+    evaluate = partial(evaluate_in_plane, plot_type, function_str, plane)
+    cancel = g.cancel
+    
+    def generate():
+        try:
+            levels = progressive_evaluate(
+                lambda tau: grid_evaluator.evaluate(evaluate, tau, cancel=cancel),
+                tau_values, strides)
+            for level, (stride, values) in enumerate(levels):
+                level_result = {}
+                for key, value in result.items():
+                    if isinstance(value, np.ndarray) and value.ndim == 2:
+                        value = value[::stride, ::stride]
+                    elif isinstance(value, np.ndarray) and key in ('tau_x', 'tau_y'):
+                        value = value[::stride]
+                    level_result[key] = value
+                add_value_fields(level_result, values[::stride, ::stride])
+                level_result.update(level=level, stride=stride, final=stride == 1)
+                yield sse_event('level', level_result)
+        except EvaluationCancelled:
+            return
+        except Exception as e:
+            traceback.print_exc()
+            yield sse_event('error', {'error': str(e)})
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 @app.route('/api/plot_data')
+@cancellable
+@coalesced
+@admitted(plot_work_class)
 def plot_data():
+    timer = plot_metrics.timer()
     try:
         # Get plot parameters from request arguments
         plot_type = request.args.get('plot_type', 'simple_func')
@@ -348,20 +421,36 @@ def plot_data():
         points = int(request.args.get('points', 100))
         liminal_radius = float(request.args.get('liminal_radius', 1.0))  # Analysis radius
         plane = request.args.get('plane', 'tau_plane')  
+        function_str = request.args.get('function', 'z*z')
+        # The y range defaults to the x range (a square view)
+        tau_y_min = float(request.args.get('tau_y_min', tau_min))
+        tau_y_max = float(request.args.get('tau_y_max', tau_max))
+        if request.args.get('sampling', 'uniform') == 'adaptive' and (
+                (tau_y_min, tau_y_max) != (tau_min, tau_max)
+                or request.args.get('viewport', 'false').lower() == 'true'):
+            # The quadtree covers the square [tau_min, tau_max]² only
+            raise ValueError("sampling=adaptive needs a square view: omit tau_y_min, tau_y_max and viewport")
         
         # Create a grid of tau values
         tau_x = np.linspace(tau_min, tau_max, points)
-        tau_y = np.linspace(tau_min, tau_max, points)
+        tau_y = np.linspace(tau_y_min, tau_y_max, points)
+        
+        viewport_key = None
+        if request.args.get('viewport', 'false').lower() == 'true':
+            # A pan of this view reuses the overlapping samples of its previous
+            # grid; the axes are snapped onto that grid's lattice
+            viewport_key = (request.args.get('view_id', ''), plot_type, function_str, plane)
+            tau_x, tau_y = viewport_cache.align(viewport_key, tau_x, tau_y)
         
-        # Create meshgrid for evaluation
-        tau_x_mesh, tau_y_mesh = np.meshgrid(tau_x, tau_y)
-        tau_values = tau_x_mesh + 1j * tau_y_mesh
+        # Broadcast the axes into the complex grid for evaluation
+        tau_values = tau_x[np.newaxis, :] + 1j * tau_y[:, np.newaxis]
         
-        # Replace values very close to the origin (infinity in z-plane) with NaN
-        # This prevents division by zero and creates a clear visual at infinity
-        if plane in ['tau_plane', 'z_plane']:
+        # The origin represents infinity. Where z = 1/τ the transform maps it
+        # to NaN itself; the direct z-plane marks it here for a clear visual.
+        if plane == 'z_plane' and plot_type != 'zeta':
             mask = np.abs(tau_values) < 1e-10
             tau_values[mask] = np.nan
+        timer.lap('grid')
             
         # Calculate the fixed liminal zone radius (always halfway between origin and boundary)
         fixed_liminal_radius = (tau_max - 0) / 2
@@ -375,13 +464,14 @@ def plot_data():
             liminal_zone_mask = np.abs(tau_values) <= fixed_liminal_radius
             
             # Record these masks for the visualization
-            liminal_mask = liminal_zone_mask.astype(int).tolist()
-            analysis_mask = analysis_radius_mask.astype(int).tolist()
+            liminal_mask = liminal_zone_mask.astype(np.uint8)
+            analysis_mask = analysis_radius_mask.astype(np.uint8)
+            timer.lap('masks')
             
         # Initialize result object
         result = {
-            'tau_x': tau_x.tolist(),
-            'tau_y': tau_y.tolist(),
+            'tau_x': tau_x,
+            'tau_y': tau_y,
             'type': plot_type,
             'liminal_radius': liminal_radius,
             'fixed_liminal_radius': fixed_liminal_radius
@@ -404,133 +494,397 @@ def plot_data():
             w_y_mesh = np.imag(w_values) 
             
             # Store w-plane values for plotting
-            result['w_x'] = w_x_mesh.tolist()
-            result['w_y'] = w_y_mesh.tolist()
-            
-            # We need to compute function values in the tau-plane then transform coordinates
-            z_values = None  # Will be defined based on function type
+            result['w_x'] = w_x_mesh
+            result['w_y'] = w_y_mesh
+            timer.lap('w_transform')
         else:
-            # For tau_plane and z_plane, we work directly with tau values
-            z_values = None  # Will be defined based on function type
+            w_values = None
             
-        # Evaluate the appropriate function based on plot_type
         if plot_type == 'zeta':
-            # For zeta function visualization
-            if plane == 'tau_plane' or plane == 'z_plane':
-                # In τ-plane: τ = 1/s, so s = 1/τ
-                z_values = 1 / tau_values
-                
-                # For z_plane, we visualize directly in the tau-plane but use
-                # the direct 1/τ transformation for the special coordinate system
-                
-                # Evaluate Riemann zeta function
-                func_values = np.zeros_like(z_values, dtype=complex)
-                mask = ~np.isnan(z_values)  # Skip NaN values
-                
-                # Use mpmath for high-precision zeta evaluation
-                for i in range(points):
-                    for j in range(points):
-                        if mask[i, j]:
-                            z = complex(z_values[i, j])
-                            if abs(z) < 1e-10:
-                                func_values[i, j] = np.nan + 1j * np.nan
-                            else:
-                                func_values[i, j] = complex(mp.zeta(z))
-
-            elif plane == 'w_plane':
-                # In w-plane, w = log(τ) = -log(s)
-                # So s = exp(-w)
-                z_values = np.exp(-w_values)
-                
-                # Evaluate zeta
-                func_values = np.zeros_like(z_values, dtype=complex)
-                mask = ~np.isnan(z_values)
-                
-                for i in range(points):
-                    for j in range(points):
-                        if mask[i, j]:
-                            z = complex(z_values[i, j])
-                            if abs(z) < 1e-10:
-                                func_values[i, j] = np.nan + 1j * np.nan
-                            else:
-                                func_values[i, j] = complex(mp.zeta(z))
-            
             # Add critical line and zeros to the result for zeta
             num_zeros = int(request.args.get('num_zeros', 5))
+            if not 0 <= num_zeros <= MAX_OVERLAY_ZEROS:
+                raise ValueError(f"num_zeros must be between 0 and {MAX_OVERLAY_ZEROS}")
             t_max_crit = float(request.args.get('t_max_crit', 50.0))
             
+            # Optionally show every zero in a window of heights instead
+            zero_window = None
+            if 'zeros_t_min' in request.args and 'zeros_t_max' in request.args:
+                zero_window = (float(request.args['zeros_t_min']), float(request.args['zeros_t_max']))
+            
             # Add critical line and zeros to the result
-            add_critical_line_and_zeros(result, num_zeros, t_max_crit, plane)
+            add_critical_line_and_zeros(result, num_zeros, t_max_crit, plane, zero_window)
                         
-        elif plot_type == 'general_func':
-            # For custom function visualization
-            function_str = request.args.get('function', 'z*z')
-            
-            if plane == 'tau_plane':
-                # In τ-plane: τ = 1/z, so z = 1/τ
-                z_values = 1 / tau_values
-                # Evaluate the function at z = 1/τ
-                func_values = evaluate_function(z_values, function_str)
-                
-            elif plane == 'z_plane':
-                # In z-plane (direct), we evaluate the function directly at tau values
-                # but still exclude the origin (representing infinity)
-                func_values = evaluate_function(tau_values, function_str)
-                
-            elif plane == 'w_plane':
-                # In w-plane, w = log(τ) = -log(z)
-                # So z = exp(-w)
-                z_values = np.exp(-w_values)
-                func_values = evaluate_function(z_values, function_str)
-            
+        else:
             # Store the function string for reference
             result['function'] = function_str
             
-            # Add function analysis
-            if request.args.get('analyze', 'false').lower() == 'true':
-                result['analysis'] = analyze_function(function_str, plot_type == 'zeta')
-                
-        else:  # 'simple_func' or other
-            # Fallback to a simple function (for testing/default)
-            function_str = request.args.get('function', 'z*z')
+            # Symbolic analysis has its own endpoint, concurrency limit and time limit
+            if plot_type == 'general_func' and request.args.get('analyze', 'false').lower() == 'true':
+                result['analysis_url'] = url_for('analyze', function=function_str)
+        timer.lap('metadata')
+        
+        if request.args.get('progressive', 'false').lower() == 'true':
+            if plot_type != 'zeta':
+                # Report invalid expressions before the stream starts
+                compile_expression(function_str)
+            # Only the setup stages; levels are computed while streaming
+            return add_server_timing(
+                progressive_response(result, plot_type, function_str, plane, tau_values), timer)
+        
+        # Evaluate the appropriate function based on plot_type
+        if request.args.get('sampling', 'uniform') == 'adaptive':
+            # Sample coarsely, refine by quadtree where phase or magnitude vary,
+            # then rasterize onto the requested grid for the renderer
+            budget = int(request.args.get('budget', points * points // 4))
+            quadtree = adaptive_sample(
+                lambda tau: evaluate_in_plane(plot_type, function_str, plane, tau),
+                tau_min, tau_max, budget=budget)
+            _, func_values = quadtree.to_grid(points)
+            func_values[np.isnan(tau_values) | (tau_values == 0)] = np.nan
+            timer.lap('evaluate')
+            
+            cell_x, cell_y, cell_width = quadtree.cells()
+            result['quadtree_x'] = cell_x
+            result['quadtree_y'] = cell_y
+            result['quadtree_width'] = cell_width
+            result['quadtree_phase'] = quadtree.cell_phase()
+            result['quadtree_log_magnitude'] = quadtree.cell_log_magnitude()
+            result['evaluations'] = quadtree.evaluations
             
-            if plane == 'tau_plane':
-                z_values = 1 / tau_values
-                func_values = evaluate_function(z_values, function_str)
-            elif plane == 'z_plane':
-                func_values = evaluate_function(tau_values, function_str)
-            elif plane == 'w_plane':
-                z_values = np.exp(-w_values)
-                func_values = evaluate_function(z_values, function_str)
-                
-            result['function'] = function_str
+            # Add phase, magnitude and real/imaginary parts to the response
+            add_value_fields(result, func_values)
+            timer.lap('fields')
+        elif viewport_key is not None:
+            # Only the strips not covered by the previous grid are evaluated
+            func_values, result['reused_fraction'] = viewport_cache.evaluate(
+                viewport_key, tau_x, tau_y, partial(grid_values, plot_type, function_str, plane, cancel=g.cancel))
+            timer.lap('evaluate')
+            add_value_fields(result, func_values)
+            timer.lap('fields')
+        else:
+            # Workers write their rows straight into the shared output grid;
+            # on a grid symmetric about the real axis only half is evaluated
+            with SharedGrid(tau_values.shape) as output:
+                func_values = grid_evaluator.evaluate(
+                    partial(evaluate_in_plane, plot_type, function_str, plane),
+                    tau_values, out=output, cancel=g.cancel,
+                    conjugate_symmetric=conjugate_symmetric(plot_type, function_str))
+                timer.lap('evaluate')
+                add_value_fields(result, func_values)
+                timer.lap('fields')
         
-        # Extract phase and magnitude for plotting
-        phase = np.angle(func_values)
-        magnitude = np.abs(func_values)
+        if request.args.get('locate_zeros', 'false').lower() == 'true':
+            # Winding numbers of the phase grid, refined and Newton-polished
+            direct = plane == 'z_plane' and plot_type != 'zeta'
+            result['zeros_and_poles'] = locate_zeros_and_poles(
+                partial(evaluate_in_plane, plot_type, function_str, plane),
+                tau_x, tau_y, phase=result['phase'],
+                z_from_tau=(lambda tau: tau) if direct else (lambda tau: 1 / tau))
+            timer.lap('locate')
         
-        # Take the log of magnitude to better visualize large variations
-        log_magnitude = np.log10(np.maximum(magnitude, 1e-10))
+        response = add_server_timing(plot_response(result, timer), timer)
+        plot_metrics.observe(timer, plot_type, plane)
+        return response
+    
+    except EvaluationCancelled:
+        return superseded_response()
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 400
+
+@app.route('/api/plot_image')
+@coalesced
+@admitted(plot_work_class)
+def plot_image():
+    """
+    Domain-colored image of a function: hue from the phase, brightness bands
+    from the magnitude.
+    
+    Takes the plot_type, function, tau_min, tau_max, points and plane
+    ('tau_plane' or 'z_plane') arguments of /api/plot_data, with points being
+    the image size in pixels; format selects 'png' (default) or 'webp'. The
+    top row of the image is τ_y = tau_max.
+    """
+    try:
+        plot_type = request.args.get('plot_type', 'simple_func')
+        function_str = request.args.get('function', 'z*z')
+        tau_min = float(request.args.get('tau_min', -3.0))
+        tau_max = float(request.args.get('tau_max', 3.0))
+        points = int(request.args.get('points', 1000))
+        plane = request.args.get('plane', 'tau_plane')
+        if plane not in ('tau_plane', 'z_plane'):
+            raise ValueError("plot_image supports the tau_plane and z_plane")
+        if not 2 <= points <= MAX_IMAGE_POINTS:
+            raise ValueError(f"points must be between 2 and {MAX_IMAGE_POINTS}")
+        
+        tau_x = np.linspace(tau_min, tau_max, points)
+        tau_values = tau_x[np.newaxis, :] + 1j * tau_x[:, np.newaxis]
+        if plane == 'z_plane' and plot_type != 'zeta':
+            tau_values[np.abs(tau_values) < 1e-10] = np.nan
+        
+        with SharedGrid(tau_values.shape) as output:
+            func_values = grid_evaluator.evaluate(
+                partial(evaluate_in_plane, plot_type, function_str, plane),
+                tau_values, out=output, conjugate_symmetric=conjugate_symmetric(plot_type, function_str))
+            # Grid rows run upwards in τ_y, image rows downwards
+            rgb = domain_coloring_values(func_values)[::-1]
+        payload, mimetype = encode_image(rgb, request.args.get('format', 'png'))
+        return Response(payload, mimetype=mimetype)
+    
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 400
+
+def parse_batch_job(job):
+    """
+    Validate one /api/plot_batch job.
+    
+    Returns:
+        A tuple of (plot_type, function_str, plane, fields)
+    """
+    if not isinstance(job, dict):
+        raise ValueError("Each job must be an object")
+    plot_type = job.get('plot_type', 'general_func')
+    plane = job.get('plane', 'tau_plane')
+    fields = job.get('fields', list(VALUE_FIELDS))
+    if plot_type not in PLOT_TYPES:
+        raise ValueError(f"Unknown plot_type '{plot_type}'")
+    if plane not in PLANES:
+        raise ValueError(f"Unknown plane '{plane}'")
+    if not isinstance(fields, list) or not fields or not set(fields) <= set(VALUE_FIELDS):
+        raise ValueError(f"fields must be a non-empty list of {list(VALUE_FIELDS)}")
+    function_str = None
+    if plot_type != 'zeta':
+        function_str = job.get('function')
+        if not isinstance(function_str, str):
+            raise ValueError("Jobs other than zeta need a function")
+        # Report invalid expressions before any evaluation
+        compile_expression(function_str)
+    return plot_type, function_str, plane, fields
+
+def batch_work_class(**kwargs):
+    """Work class of a batch: 'zeta' if any of its jobs plots zeta."""
+    body = request.get_json(force=True, silent=True)
+    jobs = body.get('jobs') if isinstance(body, dict) else None
+    if isinstance(jobs, list) and any(isinstance(job, dict) and job.get('plot_type') == 'zeta' for job in jobs):
+        return 'zeta'
+    return 'plot'
+
+@app.route('/api/plot_batch', methods=['POST'])
+@admitted(batch_work_class)
+def plot_batch():
+    """
+    Evaluate several functions and planes over one shared τ grid.
+    
+    The JSON body holds the grid (tau_min, tau_max, points and optionally
+    tau_y_min, tau_y_max) and "jobs": a list of objects with plot_type,
+    function (except for zeta), plane and fields (a subset of the value
+    grids; all by default). The grid and its transforms z = 1/τ and
+    w = log τ are computed once, and jobs that need the same function at
+    the same z values share one evaluation.
+    
+    The response has the shared axes (and w_x/w_y if a job uses the
+    w-plane), a "jobs" list describing each job or its error, and each
+    job's grids as top-level "jobs.<index>.<field>" arrays, so that
+    ?format=binary encodes them as buffers.
+    """
+    timer = plot_metrics.timer()
+    try:
+        body = request.get_json(force=True, silent=True)
+        if not isinstance(body, dict) or not isinstance(body.get('jobs'), list):
+            raise ValueError("Expected a JSON object with a list of jobs")
+        jobs = body['jobs']
+        if not 1 <= len(jobs) <= MAX_BATCH_JOBS:
+            raise ValueError(f"A batch must have between 1 and {MAX_BATCH_JOBS} jobs")
+        tau_min = float(body.get('tau_min', -3.0))
+        tau_max = float(body.get('tau_max', 3.0))
+        points = int(body.get('points', 100))
+        if not 2 <= points <= MAX_BATCH_POINTS:
+            raise ValueError(f"points must be between 2 and {MAX_BATCH_POINTS}")
+        tau_x = np.linspace(tau_min, tau_max, points)
+        tau_y = np.linspace(float(body.get('tau_y_min', tau_min)), float(body.get('tau_y_max', tau_max)), points)
+        tau_values = tau_x[np.newaxis, :] + 1j * tau_y[:, np.newaxis]
+        timer.lap('grid')
         
-        # Extract real and imaginary parts for 2D plotting
-        real_part = np.real(func_values)
-        imag_part = np.imag(func_values)
+        result = {'tau_x': tau_x, 'tau_y': tau_y, 'jobs': []}
+        # z values per transform, computed on first use
+        z_grids = {}
         
-        # Add results to the response
-        result['phase'] = phase.tolist()
-        result['magnitude'] = magnitude.tolist()
-        result['log_magnitude'] = log_magnitude.tolist()
-        result['real_part'] = real_part.tolist()
-        result['imag_part'] = imag_part.tolist()
+        def z_values(transform):
+            if transform not in z_grids:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    if transform == 'inverse':
+                        z_grids[transform] = tau_plane_instance.from_tau(tau_values, on_zero='nan')
+                    elif transform == 'direct':
+                        direct = tau_values.copy()
+                        direct[np.abs(direct) < 1e-10] = np.nan
+                        z_grids[transform] = direct
+                    else:
+                        w_values = np.log(tau_values)
+                        result['w_x'] = np.real(w_values)
+                        result['w_y'] = np.imag(w_values)
+                        z_grids[transform] = np.exp(-w_values)
+            return z_grids[transform]
         
-        return jsonify(result)
+        evaluated = {}
+        for index, job in enumerate(jobs):
+            try:
+                plot_type, function_str, plane, fields = parse_batch_job(job)
+                # Same z values as evaluate_in_plane uses for this plane
+                if plane == 'w_plane':
+                    transform = 'log'
+                elif plane == 'z_plane' and plot_type != 'zeta':
+                    transform = 'direct'
+                else:
+                    transform = 'inverse'
+                key = (plot_type, function_str, transform)
+                if key not in evaluated:
+                    evaluated[key] = grid_evaluator.evaluate(
+                        partial(evaluate_z, plot_type, function_str), z_values(transform),
+                        conjugate_symmetric=conjugate_symmetric(plot_type, function_str))
+                for field, grid in value_fields(evaluated[key], fields).items():
+                    result[f'jobs.{index}.{field}'] = grid
+                result['jobs'].append({'plot_type': plot_type, 'function': function_str,
+                                       'plane': plane, 'fields': fields})
+            except ValueError as e:
+                result['jobs'].append({'error': str(e)})
+        timer.lap('evaluate')
         
+        return add_server_timing(plot_response(result, timer), timer)
+    
     except Exception as e:
         traceback.print_exc()
         return jsonify({'error': str(e)}), 400
 
-def add_critical_line_and_zeros(result, num_zeros, t_max, plane='tau_plane'):
-    """Add the critical line and zeros to the result object in the appropriate coordinate system."""
+@app.route('/api/analyze')
+@admitted(lambda **kwargs: 'analysis')
+def analyze():
+    """
+    Symbolic analysis of a function (critical points, domain, series, special values).
+    
+    Runs off the request thread in worker processes, parsing included.
+    Sub-analyses that exceed the time limit are reported as 'timeout' in the
+    'status' field while the finished ones are returned; complete results
+    are cached per normalized expression.
+    """
+    function_str = request.args.get('function', 'z*z')
+    return jsonify(analysis_service.analyze(function_str))
+
+@app.route('/api/tile_function')
+def tile_function():
+    """Register a function for the tile API and return the hash that addresses it."""
+    function_str = request.args.get('function', 'z*z')
+    try:
+        if function_str == 'zeta':
+            key = ZETA_HASH
+        else:
+            # Validate once up front so tile requests never see a bad expression
+            compile_expression(function_str)
+            key = tile_functions.register(normalize_expression(function_str))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify({
+        'hash': key,
+        'tile_size': TILE_SIZE,
+        'base_tile_span': BASE_TILE_SPAN,
+        'max_zoom': MAX_ZOOM
+    })
+
+@app.route('/api/tile/<plane>/<func_hash>/<int:zoom>/<int(signed=True):x>/<int(signed=True):y>')
+@admitted(lambda func_hash, **kwargs: 'zeta' if func_hash == ZETA_HASH else 'plot')
+def tile(plane, func_hash, zoom, x, y):
+    """
+    Serve one fixed-size tile of the τ-, z- or w-plane.
+    
+    Tile (x, y) at a zoom level covers a square of side BASE_TILE_SPAN / 2^zoom
+    in τ (see t_plane.interactive.tiles.tile_axes). Tiles are cached in an LRU
+    cache with a memory budget, so popular views are served without
+    recomputation. The response format is negotiated as for /api/plot_data.
+    """
+    if plane not in ('tau_plane', 'z_plane', 'w_plane'):
+        return jsonify({'error': f"Unknown plane '{plane}'"}), 404
+    
+    if func_hash == ZETA_HASH:
+        plot_type, function_str = 'zeta', None
+    else:
+        plot_type, function_str = 'general_func', tile_functions.lookup(func_hash)
+        if function_str is None:
+            return jsonify({'error': 'Unknown function hash; register it via /api/tile_function'}), 404
+    
+    key = (plane, func_hash, zoom, x, y)
+    result = tile_cache.get(key)
+    if result is None:
+        try:
+            tau_x, tau_y = tile_axes(zoom, x, y)
+            tau_values = tau_x[np.newaxis, :] + 1j * tau_y[:, np.newaxis]
+            
+            result = {'tau_x': tau_x, 'tau_y': tau_y, 'type': plot_type,
+                      'plane': plane, 'zoom': zoom, 'x': x, 'y': y}
+            if function_str is not None:
+                result['function'] = function_str
+            
+            w_values = None
+            if plane == 'w_plane':
+                w_values = np.log(tau_values)
+                result['w_x'] = np.real(w_values).astype(np.float32)
+                result['w_y'] = np.imag(w_values).astype(np.float32)
+            
+            func_values = evaluate_in_plane(plot_type, function_str, plane, tau_values, w_values)
+            add_value_fields(result, func_values)
+            # Cached grids are stored at single precision to double the tile budget
+            with np.errstate(over='ignore'):
+                for field in ('phase', 'magnitude', 'log_magnitude', 'real_part', 'imag_part'):
+                    result[field] = result[field].astype(np.float32)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        tile_cache.put(key, result)
+    
+    response = plot_response(result)
+    # A tile's content is fully determined by its URL
+    response.headers['Cache-Control'] = 'public, max-age=86400'
+    return response
+
+@app.route('/metrics')
+def metrics():
+    """
+    Per-stage /api/plot_data latency histograms in the Prometheus text format.
+    
+    Labelled by stage, plot_type and plane, followed by the admission
+    gauges and counters per work class, the request coalescing counters and
+    the number of superseded requests. With metrics disabled only the
+    histograms are left out.
+    """
+    text = plot_metrics.render() if plot_metrics.enabled else ''
+    text += admission_controller.render() + plot_flights.render() + client_requests.render()
+    return Response(text, mimetype='text/plain; version=0.0.4')
+
+def check_zero_window(t_min, t_max):
+    """
+    Reject a zero window that would be too costly, before any zero is computed.
+    
+    The window must be finite and ordered, hold an estimated
+    MAX_OVERLAY_ZEROS zeros at most, and lie below MAX_COMPUTED_ZERO_T
+    unless the zero table covers it.
+    
+    Raises:
+        ValueError: If the window is invalid or too large
+    """
+    if not (np.isfinite(t_min) and np.isfinite(t_max)) or t_min > t_max:
+        raise ValueError("zeros_t_min and zeros_t_max must be finite with zeros_t_min <= zeros_t_max")
+    table = riemann_analyzer.zero_table
+    if t_max > MAX_COMPUTED_ZERO_T and (table is None or t_max > table.t_max):
+        raise ValueError(f"Zero windows above t = {MAX_COMPUTED_ZERO_T:g} need a zero table covering them")
+    if estimated_zero_count(t_min, t_max) > MAX_OVERLAY_ZEROS:
+        raise ValueError(f"The zero window contains more than {MAX_OVERLAY_ZEROS} zeros")
+
+def add_critical_line_and_zeros(result, num_zeros, t_max, plane='tau_plane', zero_window=None):
+    """
+    Add the critical line and zeros to the result object in the appropriate coordinate system.
+    
+    The zeros are the first num_zeros, or, if zero_window = (t_min, t_max)
+    is given, every zero with t in that window (at most MAX_OVERLAY_ZEROS).
+    """
     # Calculate t values for the critical line
     t_values = np.linspace(0.1, t_max, 1000)
     
@@ -540,13 +894,15 @@ def add_critical_line_and_zeros(result, num_zeros, t_max, plane='tau_plane'):
     # Convert to tau-plane coordinates: tau = 1/s
     tau_critical = 1.0 / s_critical
     
-    # Get approximate zeros from the first few non-trivial zeros
-    # These are the known t-values for the first few non-trivial zeros
-    zero_t_values = [14.1347, 21.0220, 25.0109, 30.4249, 32.9351, 37.5862, 40.9187, 
-                     43.3271, 48.0052, 49.7738, 52.9703, 56.4462, 59.3470, 60.8318, 65.1125]
-    
-    # Use only the requested number of zeros
-    zero_t_values = zero_t_values[:num_zeros]
+    if zero_window is not None:
+        check_zero_window(*zero_window)
+        # Served from the zero table when it covers the window
+        zero_t_values = riemann_analyzer.calculate_zeros_t_between(*zero_window)
+        if len(zero_t_values) > MAX_OVERLAY_ZEROS:
+            raise ValueError(f"The zero window contains more than {MAX_OVERLAY_ZEROS} zeros")
+    else:
+        # Heights of the first num_zeros non-trivial zeros (computed once, then cached)
+        zero_t_values = riemann_analyzer.calculate_zeros_t(num_zeros)
     
     # Convert to s-plane: s = 1/2 + it
     s_zeros = 0.5 + 1j * np.array(zero_t_values)
@@ -587,6 +943,27 @@ def add_critical_line_and_zeros(result, num_zeros, t_max, plane='tau_plane'):
     return result
 
 if __name__ == '__main__':
-    # Enable debug mode for development (auto-reloads, provides debugger)
-    # Use host='0.0.0.0' to make it accessible on your network if needed
-    app.run(debug=True, host='127.0.0.1', port=5000)
+    import argparse
+    parser = argparse.ArgumentParser(description="Serve the τ-plane explorer.")
+    # Use --host 0.0.0.0 to make it accessible on your network if needed
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--production', action='store_true',
+                        help="serve without the debugger and reloader (with waitress if installed)")
+    parser.add_argument('--threads', type=int, default=0,
+                        help="server threads in production (default: enough for every slot and queue place)")
+    args = parser.parse_args()
+    
+    if args.production:
+        # Threads must outnumber the admission slots plus queues, otherwise
+        # requests wait unbounded in the server's own queue instead
+        threads = args.threads or sum(c['limit'] + c['queue_size'] for c in admission_controller.stats().values())
+        try:
+            from waitress import serve
+        except ImportError:
+            app.run(host=args.host, port=args.port, threaded=True)
+        else:
+            serve(app, host=args.host, port=args.port, threads=threads)
+    else:
+        # Enable debug mode for development (auto-reloads, provides debugger)
+        app.run(debug=True, host=args.host, port=args.port)
@@ -0,0 +1,103 @@
+"""
+Cold import time of the web app and the t_plane modules.
+
+Each module is imported in a fresh interpreter, timing only the import
+statement, and the best of several runs is kept. The heavy optional
+libraries (SymPy, SciPy, mpmath, Matplotlib, Plotly) that the import pulled
+in are listed, since they should only load on first use. Results can be
+saved as a JSON baseline; comparing against a baseline exits with status 1
+if any import got slower by more than the threshold.
+
+Usage:
+    python benchmarks/bench_import.py --output imports.json
+    python benchmarks/bench_import.py --baseline imports.json [--threshold 0.25]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    'app',
+    't_plane.core.tau_plane',
+    't_plane.core.expression',
+    't_plane.analysis.zeta',
+    't_plane.analysis.riemann',
+    't_plane.interactive.analysis_service',
+    't_plane.visualization.plotter',
+]
+
+HEAVY_MODULES = ('sympy', 'scipy', 'mpmath', 'matplotlib', 'plotly')
+
+# Slowdowns below this many seconds are treated as noise
+MIN_TIME_DELTA = 0.025
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{'seconds': seconds,
+                   'heavy': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def time_import(module, repeat):
+    """Best import time of module over repeat fresh interpreters, and the heavy modules it loads."""
+    best = None
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=ROOT, capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.splitlines()[-1])
+        if best is None or result['seconds'] < best['seconds']:
+            best = result
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5, help="fresh interpreters per module (best is kept)")
+    parser.add_argument('--output', default=None, help="write results to this JSON file")
+    parser.add_argument('--baseline', default=None, help="compare against this JSON file")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="allowed fractional slowdown (default 0.25)")
+    args = parser.parse_args()
+
+    results = {}
+    for module in MODULES:
+        results[module] = r = time_import(module, args.repeat)
+        heavy = ', '.join(r['heavy']) or '-'
+        print(f"{module:<40} {r['seconds'] * 1e3:>9.1f} ms   loads: {heavy}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'python': sys.version.split()[0], 'results': results}, f, indent=2)
+        print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions = []
+        for module, current in results.items():
+            previous = baseline.get(module)
+            if previous is None:
+                continue
+            old, new = previous['seconds'], current['seconds']
+            if new > old * (1 + args.threshold) and new - old > MIN_TIME_DELTA:
+                regressions.append(f"{module}: {old * 1e3:.1f} ms -> {new * 1e3:.1f} ms")
+            for name in sorted(set(current['heavy']) - set(previous['heavy'])):
+                regressions.append(f"{module}: now imports {name}")
+        if regressions:
+            print(f"{len(regressions)} regression(s):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,214 @@
+"""
+Benchmark suite for the core transforms, grid builders, evaluators and /api/plot_data.
+
+Sweeps grid sizes, planes and plot types, recording the best wall time over
+several repeats, the peak traced memory of one run and, for the endpoint,
+the response size. Results can be saved as a JSON baseline; comparing a run
+against a baseline exits with status 1 if any case got slower or used more
+memory by more than the threshold.
+
+Usage:
+    python benchmarks/bench_suite.py --output baseline.json
+    python benchmarks/bench_suite.py --baseline baseline.json [--threshold 0.25]
+    python benchmarks/bench_suite.py --quick --filter plot_data
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from t_plane.analysis.riemann import RiemannAnalysis
+from t_plane.core.tau_plane import TauPlane
+
+DEFAULT_SIZES = [100, 500, 1000, 2000, 4000]
+QUICK_SIZES = [100, 200]
+
+# Differences below these are treated as noise when comparing to a baseline
+MIN_TIME_DELTA = 0.002
+MIN_MEMORY_DELTA = 1 << 20
+
+
+def tau_values(size):
+    """A size×size complex τ grid over [-3, 3]² without the origin."""
+    tau_x, tau_y = TauPlane(delta=1e-3).create_tau_grid(-3.0, 3.0, size, sparse=True)
+    return tau_x + 1j * tau_y
+
+
+def case_to_tau(size):
+    plane = TauPlane()
+    z = tau_values(size)
+    return lambda: plane.to_tau(z)
+
+
+def case_create_tau_grid(size):
+    plane = TauPlane(delta=1e-3)
+    return lambda: plane.create_tau_grid(-3.0, 3.0, size)
+
+
+def case_iter_tau_blocks(size):
+    plane = TauPlane(delta=1e-3)
+
+    def run():
+        for _ in plane.iter_tau_blocks(-3.0, 3.0, size):
+            pass
+    return run
+
+
+def case_zeta_in_tau_plane(size):
+    riemann = RiemannAnalysis(TauPlane(delta=1e-3))
+    tau = tau_values(size)
+    return lambda: riemann.zeta_in_tau_plane(tau)
+
+
+def case_evaluate_function(function_str):
+    def build(size):
+        from app import evaluate_function
+        z = 1 / tau_values(size)
+        return lambda: evaluate_function(z, function_str)
+    return build
+
+
+def case_plot_data(plot_type, plane, response_format='json', function_str='z**2+1'):
+    def build(size):
+        from app import app
+        client = app.test_client()
+        query = {'plot_type': plot_type, 'plane': plane, 'points': size,
+                 'tau_min': -3.0, 'tau_max': 3.0, 'format': response_format}
+        if plot_type != 'zeta':
+            query['function'] = function_str
+
+        def run():
+            response = client.get('/api/plot_data', query_string=query)
+            if response.status_code != 200:
+                raise RuntimeError(f"plot_data returned {response.status_code}: {response.get_data(as_text=True)[:200]}")
+            return len(response.get_data())
+        return run
+    return build
+
+
+# (name, builder, largest size swept)
+CASES = [
+    ('to_tau', case_to_tau, 4000),
+    ('create_tau_grid', case_create_tau_grid, 4000),
+    ('iter_tau_blocks', case_iter_tau_blocks, 4000),
+    ('evaluate_function[z**2+1]', case_evaluate_function('z**2+1'), 4000),
+    ('evaluate_function[sin(z)*exp(z)]', case_evaluate_function('sin(z)*exp(z)'), 4000),
+    ('zeta_in_tau_plane', case_zeta_in_tau_plane, 500),
+    ('plot_data[general_func,tau_plane]', case_plot_data('general_func', 'tau_plane'), 1000),
+    ('plot_data[general_func,w_plane]', case_plot_data('general_func', 'w_plane'), 1000),
+    ('plot_data[general_func,z_plane]', case_plot_data('general_func', 'z_plane'), 1000),
+    ('plot_data[general_func,tau_plane,binary]', case_plot_data('general_func', 'tau_plane', 'binary'), 2000),
+    ('plot_data[zeta,tau_plane]', case_plot_data('zeta', 'tau_plane'), 250),
+    ('plot_data[zeta,w_plane]', case_plot_data('zeta', 'w_plane'), 250),
+]
+
+
+def measure(run, repeat):
+    """Best wall time over repeat runs, then peak traced memory of one more run."""
+    with np.errstate(all='ignore'):
+        return _measure(run, repeat)
+
+
+def _measure(run, repeat):
+    output = None
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = run()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    result = {'seconds': best, 'peak_bytes': peak}
+    if isinstance(output, int):
+        result['response_bytes'] = output
+    return result
+
+
+def run_suite(sizes, repeat, name_filter=None):
+    """Run every case at every size up to its limit; returns {key: measurements}."""
+    results = {}
+    for name, build, max_size in CASES:
+        if name_filter and name_filter not in name:
+            continue
+        for size in sizes:
+            if size > max_size:
+                continue
+            key = f"{name}@{size}"
+            results[key] = measure(build(size), repeat)
+            r = results[key]
+            extra = f" {r['response_bytes'] / 1e6:>9.2f} MB" if 'response_bytes' in r else ''
+            print(f"{key:<50} {r['seconds'] * 1e3:>10.2f} ms {r['peak_bytes'] / 1e6:>9.1f} MB peak{extra}")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """List regressions of time or peak memory beyond threshold (a fraction)."""
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        for metric, floor in (('seconds', MIN_TIME_DELTA), ('peak_bytes', MIN_MEMORY_DELTA)):
+            old, new = previous[metric], current[metric]
+            if new > old * (1 + threshold) and new - old > floor:
+                regressions.append(f"{key}: {metric} {old:.4g} -> {new:.4g} (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=None,
+                        help=f"grid sizes to sweep (default {DEFAULT_SIZES})")
+    parser.add_argument('--quick', action='store_true', help=f"sweep only {QUICK_SIZES}")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per case (best is kept)")
+    parser.add_argument('--filter', default=None, help="only run cases whose name contains this")
+    parser.add_argument('--output', default=None, help="write results to this JSON file")
+    parser.add_argument('--baseline', default=None, help="compare against this JSON file")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="allowed fractional slowdown or memory growth (default 0.25)")
+    args = parser.parse_args()
+
+    sizes = args.sizes or (QUICK_SIZES if args.quick else DEFAULT_SIZES)
+    results = run_suite(sizes, args.repeat, args.filter)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'environment': environment(), 'results': results}, f, indent=2)
+        print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline['results'], args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == '__main__':
+    main()
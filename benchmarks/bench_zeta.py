@@ -0,0 +1,80 @@
+"""
+Benchmark the vectorized zeta engine against the per-point mpmath baseline.
+
+Evaluates ζ(1/τ) over a τ-plane grid, as /api/plot_data does, and reports
+wall time for both implementations together with the accuracy of the
+vectorized values relative to mpmath.
+
+Usage:
+    python benchmarks/bench_zeta.py [--points 100 200 300] [--tau-max 3.0]
+"""
+import argparse
+import os
+import sys
+import time
+
+import mpmath as mp
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from t_plane.analysis.zeta import zeta
+
+
+def tau_grid(points, tau_max):
+    """Build the same τ grid as /api/plot_data, with the origin masked out."""
+    axis = np.linspace(-tau_max, tau_max, points)
+    tau_x, tau_y = np.meshgrid(axis, axis)
+    tau = tau_x + 1j * tau_y
+    tau[np.abs(tau) < 1e-10] = np.nan
+    return tau
+
+
+def mpmath_zeta(s):
+    """Baseline: the per-pixel mpmath loop previously used by /api/plot_data."""
+    result = np.full(s.shape, np.nan + 1j * np.nan)
+    for index in np.ndindex(s.shape):
+        if not np.isnan(s[index]):
+            result[index] = complex(mp.zeta(complex(s[index])))
+    return result
+
+
+def run(points, tau_max):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        s = 1 / tau_grid(points, tau_max)
+
+    start = time.perf_counter()
+    fast = zeta(s)
+    fast_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reference = mpmath_zeta(s)
+    reference_time = time.perf_counter() - start
+
+    valid = np.isfinite(reference)
+    rel_error = np.abs(fast[valid] - reference[valid]) / np.maximum(np.abs(reference[valid]), 1.0)
+    return {
+        'points': points,
+        'vectorized_s': fast_time,
+        'mpmath_s': reference_time,
+        'speedup': reference_time / fast_time,
+        'max_rel_error': float(np.max(rel_error)),
+        'median_rel_error': float(np.median(rel_error)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--points', type=int, nargs='+', default=[50, 100, 200])
+    parser.add_argument('--tau-max', type=float, default=3.0)
+    args = parser.parse_args()
+
+    print(f"{'points':>8} {'vectorized':>12} {'mpmath':>10} {'speedup':>9} {'max rel err':>12} {'median':>10}")
+    for points in args.points:
+        r = run(points, args.tau_max)
+        print(f"{r['points']:>8} {r['vectorized_s']:>11.3f}s {r['mpmath_s']:>9.2f}s "
+              f"{r['speedup']:>8.0f}x {r['max_rel_error']:>12.1e} {r['median_rel_error']:>10.1e}")
+
+
+if __name__ == '__main__':
+    main()
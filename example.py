@@ -34,15 +34,15 @@ def main():
     def square_function(tau):
         return tau**2
     
-    fig2 = plotter.plot_function_in_tau_plane(
+    # Domain coloring (hue = phase, brightness bands = magnitude), written
+    # straight to PNG without going through matplotlib
+    plotter.save_domain_coloring(
+        'tau_plane_function.png',
         func=square_function,
         tau_min=-3.0,
         tau_max=3.0,
-        points=200,
-        show_unit_circle=True
+        points=1200
     )
-    fig2.savefig('tau_plane_function.png', dpi=300, bbox_inches='tight')
-    plt.close(fig2)
     print("Saved function visualization to tau_plane_function.png")
     
     # Example 3: Riemann zeta function in τ-plane
@@ -11,6 +11,7 @@ document.addEventListener('DOMContentLoaded', () => {
     const liminalZoneSlider = document.getElementById('liminalZoneRange');
     const liminalZoneValueSpan = document.getElementById('liminalZoneValue');
     const updateButton = document.getElementById('updateButton');
+    const imageButton = document.getElementById('imageButton');
     const phasePlotDiv = document.getElementById('phasePlot');
     const magnitudePlotDiv = document.getElementById('magnitudePlot');
     const plot2dDiv = document.getElementById('plot2d');
@@ -338,6 +339,32 @@ document.addEventListener('DOMContentLoaded', () => {
         plot2dDiv.style.display = 'block';
     }
 
+    // Decode a format=binary plot response: a uint32 header length, a JSON
+    // header, then 8-byte aligned little-endian buffers. Buffers are viewed
+    // in place as typed arrays; 2D grids become arrays of row views so they
+    // can be passed straight to Plotly.
+    const TYPED_ARRAYS = { float32: Float32Array, float64: Float64Array, uint8: Uint8Array };
+
+    function decodeBinaryPlot(buffer) {
+        const headerLength = new DataView(buffer).getUint32(0, true);
+        const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 4, headerLength)));
+        const dataStart = 4 + headerLength;
+        const data = header.meta;
+
+        for (const [name, spec] of Object.entries(header.arrays)) {
+            const ArrayType = TYPED_ARRAYS[spec.dtype];
+            const count = spec.shape.reduce((a, b) => a * b, 1);
+            const flat = new ArrayType(buffer, dataStart + spec.offset, count);
+            if (spec.shape.length === 2) {
+                const [rows, cols] = spec.shape;
+                data[name] = Array.from({ length: rows }, (_, i) => flat.subarray(i * cols, (i + 1) * cols));
+            } else {
+                data[name] = flat;
+            }
+        }
+        return data;
+    }
+
     function updateSliderValue(slider, span) {
         const value = parseFloat(slider.value).toFixed(1);
         if (slider.id === 'tauRange') {
@@ -711,9 +738,441 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
 
+    // Overlay critical points from the symbolic analysis on the rendered plots
+    function addCriticalPointTraces(analysis) {
+        if (!analysis.critical_points || analysis.critical_points.length === 0) {
+            return;
+        }
+        const x = analysis.critical_points.map(p => p.tau_real);
+        const y = analysis.critical_points.map(p => p.tau_imag);
+        const criticalPointsTrace = {
+            type: 'scatter3d',
+            mode: 'markers',
+            x: x,
+            y: y,
+            z: Array(x.length).fill(0), // Plot on z=0 plane
+            marker: { color: 'red', size: 6, symbol: 'cross' },
+            name: 'Critical Points'
+        };
+        Plotly.addTraces(phasePlotDiv, criticalPointsTrace);
+        Plotly.addTraces(magnitudePlotDiv, criticalPointsTrace);
+
+        // Also add to 2D plot
+        Plotly.addTraces(plot2dDiv, {
+            type: 'scatter',
+            mode: 'markers',
+            x: x,
+            y: y,
+            marker: { color: 'red', size: 8, symbol: 'star' },
+            name: 'Critical Points'
+        });
+    }
+
+    // Zeros and poles located numerically by the server (locate_zeros=true)
+    function zeroPoleTraces(points, plane) {
+        const traces = [];
+        const kinds = [
+            { type: 'zero', name: 'Zeros (numeric)', symbol: 'circle-open', color: 'white' },
+            { type: 'pole', name: 'Poles (numeric)', symbol: 'x', color: 'black' }
+        ];
+        kinds.forEach(kind => {
+            // Points at the τ origin have no w coordinates
+            const selected = points.filter(p => p.type === kind.type &&
+                (plane !== 'w_plane' || p.w_real !== null));
+            if (selected.length === 0) {
+                return;
+            }
+            traces.push({
+                type: 'scatter',
+                mode: 'markers',
+                x: selected.map(p => plane === 'w_plane' ? p.w_real : p.tau_real),
+                y: selected.map(p => plane === 'w_plane' ? p.w_imag : p.tau_imag),
+                text: selected.map(p => `multiplicity ${p.multiplicity}`),
+                marker: { color: kind.color, size: 10, symbol: kind.symbol, line: { width: 2 } },
+                name: kind.name
+            });
+        });
+        return traces;
+    }
+
+    // --- Fetch Symbolic Analysis ---
+    // Runs server-side in a process pool with a time limit; sub-analyses that
+    // did not finish are simply missing from the result.
+    async function fetchAnalysis(functionString) {
+        try {
+            const params = new URLSearchParams({ function: functionString });
+            const response = await fetch(`/api/analyze?${params.toString()}`);
+            if (!response.ok) {
+                return;
+            }
+            const analysis = await response.json();
+            updateFunctionAnalysis(functionString, { analysis });
+            addCriticalPointTraces(analysis);
+        } catch (error) {
+            console.error('Error fetching function analysis:', error);
+        }
+    }
+
+    // --- Render Plots from a plot_data result ---
+    function renderPlots(data, functionText, plane) {
+        // --- Create layouts based on selected function and plane ---
+        const phaseLayout = createLayout(functionText, plane, 'phase');
+        const magnitudeLayout = createLayout(functionText, plane, 'magnitude');
+        
+        // Get selected 2D view type from radio buttons
+        const selectedView = document.querySelector('input[name="plot2d-view"]:checked').value;
+        let plot2dLayout = create2DLayout(functionText, plane, selectedView);
+        plot2dLayout = addShapesToPlot(plot2dLayout, plane);
+
+        // --- Clear existing plots ---
+        Plotly.purge(phasePlotDiv);
+        Plotly.purge(magnitudePlotDiv);
+        Plotly.purge(plot2dDiv);
+
+        // --- Create Traces based on data type ---
+        const phaseTrace = {
+            type: 'surface',
+            x: data.tau_x,
+            y: data.tau_y,
+            z: data.phase,
+            colorscale: 'Viridis', // Or a more modern one like 'Plasma' or 'Cividis'
+            showscale: true,
+            name: 'Phase'
+        };
+
+        const magnitudeTrace = {
+            type: 'surface',
+            x: data.tau_x,
+            y: data.tau_y,
+            z: data.magnitude,
+            colorscale: 'Plasma',
+            showscale: true,
+            name: 'Magnitude'
+        };
+        
+        const plotTracesPhase = [phaseTrace];
+        const plotTracesMagnitude = [magnitudeTrace];
+        
+        // --- Create 2D Cartesian plot traces ---
+        // Create a more detailed grid for contour plots
+        const plot2dTraces = [];
+        
+        // Create 2D trace based on selected view type
+        if (selectedView === 'real') {
+            plot2dTraces.push({
+                type: 'contour',
+                x: data.tau_x,
+                y: data.tau_y,
+                z: data.real_part || [],
+                colorscale: 'RdBu',
+                contours: {
+                    coloring: 'heatmap'
+                },
+                showscale: true,
+                name: 'Real Part'
+            });
+        } else if (selectedView === 'imag') {
+            plot2dTraces.push({
+                type: 'contour',
+                x: data.tau_x,
+                y: data.tau_y,
+                z: data.imag_part || [],
+                colorscale: 'RdBu',
+                contours: {
+                    coloring: 'heatmap'
+                },
+                showscale: true,
+                name: 'Imaginary Part'
+            });
+        } else if (selectedView === 'mag') {
+            // Log scale for magnitude is often more informative
+            const logMagnitude = data.magnitude.map(row => 
+                row.map(val => Math.log(Math.max(val, 1e-10)))
+            );
+            
+            plot2dTraces.push({
+                type: 'contour',
+                x: data.tau_x,
+                y: data.tau_y,
+                z: data.magnitude,
+                colorscale: 'Viridis',
+                contours: {
+                    coloring: 'heatmap'
+                },
+                showscale: true,
+                name: 'Magnitude (Log Scale)'
+            });
+        } else if (selectedView === 'phase') {
+            plot2dTraces.push({
+                type: 'contour',
+                x: data.tau_x,
+                y: data.tau_y,
+                z: data.phase,
+                colorscale: 'Jet',
+                contours: {
+                    coloring: 'heatmap'
+                },
+                showscale: true,
+                name: 'Phase'
+            });
+        }
+
+        // Add critical line and zeros for zeta plots
+        if ((data.type === 'zeta') && data.critical_line && data.zeros) {
+            const criticalLineTrace = {
+                type: 'scatter3d',
+                mode: 'lines',
+                x: data.critical_line.x,
+                y: data.critical_line.y,
+                z: Array(data.critical_line.x.length).fill(0), // Plot on z=0 plane for visibility
+                line: { color: 'red', width: 4 },
+                name: 'Critical Line'
+            };
+            const zerosTrace = {
+                type: 'scatter3d',
+                mode: 'markers',
+                x: data.zeros.x,
+                y: data.zeros.y,
+                z: Array(data.zeros.x.length).fill(0), // Plot on z=0 plane
+                marker: { color: 'black', size: 5, symbol: 'circle' },
+                name: 'Zeros'
+            };
+            plotTracesPhase.push(criticalLineTrace, zerosTrace);
+            plotTracesMagnitude.push(criticalLineTrace, zerosTrace);
+            
+            // Also add to 2D plot
+            plot2dTraces.push({
+                type: 'scatter',
+                mode: 'lines',
+                x: data.critical_line.x,
+                y: data.critical_line.y,
+                line: { color: 'red', width: 2 },
+                name: 'Critical Line'
+            });
+            
+            plot2dTraces.push({
+                type: 'scatter',
+                mode: 'markers',
+                x: data.zeros.x,
+                y: data.zeros.y,
+                marker: { color: 'black', size: 8, symbol: 'x' },
+                name: 'Zeros'
+            });
+        }
+        
+        if (data.zeros_and_poles) {
+            plot2dTraces.push(...zeroPoleTraces(data.zeros_and_poles, plane));
+        }
+        
+        // Apply custom formatting to the 2D plot
+        plot2dLayout.margin = { l: 60, r: 60, t: 40, b: 60 };  // Increase margins for tick labels
+        plot2dLayout.annotations = [];  // Clear any existing annotations
+        
+        // Customize font sizes for better readability
+        plot2dLayout.font = { size: 11 };
+        plot2dLayout.xaxis.title = { text: plot2dLayout.xaxis.title, font: { size: 12 } };
+        plot2dLayout.yaxis.title = { text: plot2dLayout.yaxis.title, font: { size: 12 } };
+        
+        // Add a title annotation for z-plane to explain the liminal circles
+        if (plane === 'z_plane') {
+            // Adjust the colorscale range to highlight the liminal zone boundary
+            if (plot2dTraces[0].type === 'contour') {
+                plot2dTraces[0].contours = {
+                    coloring: 'heatmap',
+                    showlabels: true,
+                    labelfont: {
+                        size: 10,
+                        color: 'rgba(0,0,0,0.5)'
+                    }
+                };
+            }
+        }
+        
+        // --- Render Plots ---
+        Plotly.newPlot(phasePlotDiv, plotTracesPhase, phaseLayout, {responsive: true});
+        Plotly.newPlot(magnitudePlotDiv, plotTracesMagnitude, magnitudeLayout, {responsive: true});
+        Plotly.newPlot(plot2dDiv, plot2dTraces, plot2dLayout, {responsive: true});
+        plot2dDiv.on('plotly_relayout', onPlot2dRelayout);
+    }
+
+    // --- Superseded requests ---
+    // Every plot request carries this tab's client id, so the server cancels
+    // the evaluation of an older request when a newer one arrives; the
+    // older fetch is aborted here as well.
+    const clientId = Math.random().toString(36).slice(2);
+    let plotAbort = null;
+
+    function startPlotRequest() {
+        if (plotAbort) {
+            plotAbort.abort();
+        }
+        plotAbort = new AbortController();
+        return plotAbort.signal;
+    }
+
+    // --- Pan/zoom of the 2D plot: fetch the new view, reusing overlapping samples ---
+    const viewId = Math.random().toString(36).slice(2);
+    let viewportTimeout;
+    let viewportRequest = 0;
+
+    function onPlot2dRelayout(event) {
+        const range = ['xaxis.range[0]', 'xaxis.range[1]', 'yaxis.range[0]', 'yaxis.range[1]']
+            .map(name => event[name]);
+        // Only τ-coordinate views can be re-gridded; autoscale events carry no range
+        if (range.some(value => value === undefined) || planeSelect.value === 'w_plane') {
+            return;
+        }
+        clearTimeout(viewportTimeout);
+        viewportTimeout = setTimeout(() => fetchViewport(range), 150);
+    }
+
+    async function fetchViewport([xMin, xMax, yMin, yMax]) {
+        const request = ++viewportRequest;
+        const { plotType, functionText } = selectedFunction();
+        const plane = planeSelect.value;
+        const params = new URLSearchParams({
+            plot_type: plotType,
+            tau_min: xMin,
+            tau_max: xMax,
+            tau_y_min: yMin,
+            tau_y_max: yMax,
+            points: parseInt(pointsSlider.value),
+            plane: plane,
+            liminal_radius: parseFloat(liminalZoneSlider.value),
+            format: 'binary',
+            viewport: 'true',
+            view_id: viewId,
+            client_id: clientId
+        });
+        if (plotType === 'zeta') {
+            params.append('num_zeros', parseInt(numZerosSlider.value));
+            params.append('t_max_crit', parseInt(tMaxCritSlider.value));
+        } else {
+            params.append('function', functionText);
+        }
+
+        const signal = startPlotRequest();
+        try {
+            const response = await fetch(`/api/plot_data?${params.toString()}`, { signal });
+            if (!response.ok) {
+                const errorData = await response.json();
+                throw new Error(errorData.error || `HTTP error! status: ${response.status}`);
+            }
+            const data = decodeBinaryPlot(await response.arrayBuffer());
+            // A newer pan has been requested meanwhile
+            if (request !== viewportRequest) {
+                return;
+            }
+            renderPlots(data, functionText, plane);
+        } catch (error) {
+            if (error.name !== 'AbortError') {
+                showPlotError(error);
+            }
+        }
+    }
+
+    // --- Show a plot_data error in place of the plots ---
+    function showPlotError(error) {
+        console.error('Error fetching or plotting data:', error);
+        
+        // Create more user-friendly error messages based on the error text
+        let errorMessage = error.message;
+        
+        // Handle specific function evaluation errors with more helpful messages
+        if (errorMessage.includes('Function evaluation error')) {
+            if (errorMessage.includes('not defined')) {
+                errorMessage = 'Function error: Make sure you\'re using supported functions (sin, cos, tan, log, exp, sqrt, abs)';
+            } else if (errorMessage.includes('division by zero')) {
+                errorMessage = 'Function error: Division by zero in your expression';
+            } else if (errorMessage.includes('Invalid function string')) {
+                errorMessage = 'Function error: Please use only valid mathematical expressions with z as the variable';
+            }
+        }
+        
+        // Display error messages in the plot divs
+        phasePlotDiv.innerHTML = `<p style="color: red; padding: 20px;">Error loading phase plot: ${errorMessage}</p>`;
+        magnitudePlotDiv.innerHTML = `<p style="color: red; padding: 20px;">Error loading magnitude plot: ${errorMessage}</p>`;
+        plot2dDiv.innerHTML = `<p style="color: red; padding: 20px;">Error loading 2D plot: ${errorMessage}</p>`;
+        
+        // Hide analysis panel on error
+        functionAnalysisDiv.style.display = 'none';
+    }
+
+    // --- Progressive Plot Stream ---
+    // Zeta is expensive at high resolution, so it is streamed coarse-to-fine:
+    // each 'level' event is a complete (JSON) plot_data result at twice the
+    // resolution of the previous one, the last one flagged "final".
+    let plotStream = null;
+
+    function streamPlot(params, functionText, plane) {
+        if (plotStream) {
+            plotStream.close();
+        }
+        startPlotRequest();
+        params.set('format', 'json');
+        params.set('progressive', 'true');
+        const stream = new EventSource(`/api/plot_data?${params.toString()}`);
+        plotStream = stream;
+
+        stream.addEventListener('level', (event) => {
+            const data = JSON.parse(event.data);
+            hideLoading();
+            renderPlots(data, functionText, plane);
+            if (data.final) {
+                stream.close();
+            }
+        });
+        stream.addEventListener('error', (event) => {
+            stream.close();
+            hideLoading();
+            // Server-sent 'error' events carry a message; connection errors do not
+            if (event.data) {
+                showPlotError(new Error(JSON.parse(event.data).error));
+            } else {
+                showPlotError(new Error('Lost connection while streaming the plot'));
+            }
+        });
+        functionAnalysisDiv.style.display = 'none';
+    }
+
     // --- Fetch and Update Plot Function ---
+    // Get function from input or dropdown
+    function selectedFunction() {
+        if (functionSelect.value === 'zeta') {
+            return { plotType: 'zeta', functionText: 'zeta' };
+        }
+        if (functionSelect.value === 'custom') {
+            return { plotType: 'general_func', functionText: functionInput.value };
+        }
+        // Also update the function input box to show the selected function
+        functionInput.value = functionSelect.value;
+        return { plotType: 'general_func', functionText: functionSelect.value };
+    }
+
+    // Open a high-resolution domain-colored image of the current function
+    function openImage() {
+        const tauAbs = parseFloat(tauRangeSlider.value);
+        const { plotType, functionText } = selectedFunction();
+        // The w-plane has no uniform image grid; show the τ-plane instead
+        const plane = planeSelect.value === 'z_plane' ? 'z_plane' : 'tau_plane';
+        const params = new URLSearchParams({
+            plot_type: plotType,
+            function: functionText,
+            tau_min: -tauAbs,
+            tau_max: tauAbs,
+            points: 1200,
+            plane: plane,
+            format: 'png'
+        });
+        window.open(`/api/plot_image?${params.toString()}`, '_blank');
+    }
+
     async function fetchAndUpdatePlot() {
         showLoading();
+        if (plotStream) {
+            plotStream.close();
+            plotStream = null;
+        }
 
         const tauAbs = parseFloat(tauRangeSlider.value);
         const points = parseInt(pointsSlider.value);
@@ -722,20 +1181,7 @@ document.addEventListener('DOMContentLoaded', () => {
         const plane = planeSelect.value; 
         const liminalRadius = parseFloat(liminalZoneSlider.value);
         
-        // Get function from input or dropdown
-        let functionText = '';
-        let plotType = 'general_func';  // Default to general function
-        
-        if (functionSelect.value === 'zeta') {
-            plotType = 'zeta';
-            functionText = 'zeta';
-        } else if (functionSelect.value === 'custom') {
-            functionText = functionInput.value;
-        } else {
-            functionText = functionSelect.value;
-            // Also update the function input box to show the selected function
-            functionInput.value = functionText;
-        }
+        const { plotType, functionText } = selectedFunction();
 
         // Construct API URL with parameters
         const params = new URLSearchParams({
@@ -744,227 +1190,34 @@ document.addEventListener('DOMContentLoaded', () => {
             tau_max: tauAbs,
             points: points,
             plane: plane,
-            liminal_radius: liminalRadius
+            liminal_radius: liminalRadius,
+            format: 'binary',
+            client_id: clientId
         });
 
         if (plotType === 'zeta') {
             params.append('num_zeros', numZeros);
             params.append('t_max_crit', tMaxCrit);
-        } else {
-            params.append('function', functionText);
-            params.append('analyze', 'true'); // Request function analysis
+            streamPlot(params, functionText, plane);
+            return;
         }
+        params.append('function', functionText);
+        params.append('locate_zeros', 'true');
 
+        const signal = startPlotRequest();
         try {
-            const response = await fetch(`/api/plot_data?${params.toString()}`);
+            const response = await fetch(`/api/plot_data?${params.toString()}`, { signal });
             if (!response.ok) {
                 const errorData = await response.json();
                 throw new Error(errorData.error || `HTTP error! status: ${response.status}`);
             }
-            const data = await response.json();
-
-            // --- Create layouts based on selected function and plane ---
-            const phaseLayout = createLayout(functionText, plane, 'phase');
-            const magnitudeLayout = createLayout(functionText, plane, 'magnitude');
-            
-            // Get selected 2D view type from radio buttons
-            const selectedView = document.querySelector('input[name="plot2d-view"]:checked').value;
-            let plot2dLayout = create2DLayout(functionText, plane, selectedView);
-            plot2dLayout = addShapesToPlot(plot2dLayout, plane);
-
-            // --- Clear existing plots ---
-            Plotly.purge(phasePlotDiv);
-            Plotly.purge(magnitudePlotDiv);
-            Plotly.purge(plot2dDiv);
-
-            // --- Create Traces based on data type ---
-            const phaseTrace = {
-                type: 'surface',
-                x: data.tau_x,
-                y: data.tau_y,
-                z: data.phase,
-                colorscale: 'Viridis', // Or a more modern one like 'Plasma' or 'Cividis'
-                showscale: true,
-                name: 'Phase'
-            };
-
-            const magnitudeTrace = {
-                type: 'surface',
-                x: data.tau_x,
-                y: data.tau_y,
-                z: data.magnitude,
-                colorscale: 'Plasma',
-                showscale: true,
-                name: 'Magnitude'
-            };
-            
-            const plotTracesPhase = [phaseTrace];
-            const plotTracesMagnitude = [magnitudeTrace];
-            
-            // --- Create 2D Cartesian plot traces ---
-            // Create a more detailed grid for contour plots
-            const plot2dTraces = [];
-            
-            // Create 2D trace based on selected view type
-            if (selectedView === 'real') {
-                plot2dTraces.push({
-                    type: 'contour',
-                    x: data.tau_x,
-                    y: data.tau_y,
-                    z: data.real_part || [],
-                    colorscale: 'RdBu',
-                    contours: {
-                        coloring: 'heatmap'
-                    },
-                    showscale: true,
-                    name: 'Real Part'
-                });
-            } else if (selectedView === 'imag') {
-                plot2dTraces.push({
-                    type: 'contour',
-                    x: data.tau_x,
-                    y: data.tau_y,
-                    z: data.imag_part || [],
-                    colorscale: 'RdBu',
-                    contours: {
-                        coloring: 'heatmap'
-                    },
-                    showscale: true,
-                    name: 'Imaginary Part'
-                });
-            } else if (selectedView === 'mag') {
-                // Log scale for magnitude is often more informative
-                const logMagnitude = data.magnitude.map(row => 
-                    row.map(val => Math.log(Math.max(val, 1e-10)))
-                );
-                
-                plot2dTraces.push({
-                    type: 'contour',
-                    x: data.tau_x,
-                    y: data.tau_y,
-                    z: data.magnitude,
-                    colorscale: 'Viridis',
-                    contours: {
-                        coloring: 'heatmap'
-                    },
-                    showscale: true,
-                    name: 'Magnitude (Log Scale)'
-                });
-            } else if (selectedView === 'phase') {
-                plot2dTraces.push({
-                    type: 'contour',
-                    x: data.tau_x,
-                    y: data.tau_y,
-                    z: data.phase,
-                    colorscale: 'Jet',
-                    contours: {
-                        coloring: 'heatmap'
-                    },
-                    showscale: true,
-                    name: 'Phase'
-                });
-            }
+            const data = decodeBinaryPlot(await response.arrayBuffer());
 
-            // Add critical line and zeros for zeta plots
-            if ((data.type === 'zeta') && data.critical_line && data.zeros) {
-                const criticalLineTrace = {
-                    type: 'scatter3d',
-                    mode: 'lines',
-                    x: data.critical_line.x,
-                    y: data.critical_line.y,
-                    z: Array(data.critical_line.x.length).fill(0), // Plot on z=0 plane for visibility
-                    line: { color: 'red', width: 4 },
-                    name: 'Critical Line'
-                };
-                const zerosTrace = {
-                    type: 'scatter3d',
-                    mode: 'markers',
-                    x: data.zeros.x,
-                    y: data.zeros.y,
-                    z: Array(data.zeros.x.length).fill(0), // Plot on z=0 plane
-                    marker: { color: 'black', size: 5, symbol: 'circle' },
-                    name: 'Zeros'
-                };
-                plotTracesPhase.push(criticalLineTrace, zerosTrace);
-                plotTracesMagnitude.push(criticalLineTrace, zerosTrace);
-                
-                // Also add to 2D plot
-                plot2dTraces.push({
-                    type: 'scatter',
-                    mode: 'lines',
-                    x: data.critical_line.x,
-                    y: data.critical_line.y,
-                    line: { color: 'red', width: 2 },
-                    name: 'Critical Line'
-                });
-                
-                plot2dTraces.push({
-                    type: 'scatter',
-                    mode: 'markers',
-                    x: data.zeros.x,
-                    y: data.zeros.y,
-                    marker: { color: 'black', size: 8, symbol: 'x' },
-                    name: 'Zeros'
-                });
-            }
-            
-            // Add critical points if available
-            if (data.type === 'general_func' && data.analysis && data.analysis.critical_points) {
-                const criticalPointsTrace = {
-                    type: 'scatter3d',
-                    mode: 'markers',
-                    x: data.analysis.critical_points.map(p => p.tau_real),
-                    y: data.analysis.critical_points.map(p => p.tau_imag),
-                    z: Array(data.analysis.critical_points.length).fill(0), // Plot on z=0 plane
-                    marker: { color: 'red', size: 6, symbol: 'cross' },
-                    name: 'Critical Points'
-                };
-                plotTracesPhase.push(criticalPointsTrace);
-                plotTracesMagnitude.push(criticalPointsTrace);
-                
-                // Also add to 2D plot
-                plot2dTraces.push({
-                    type: 'scatter',
-                    mode: 'markers',
-                    x: data.analysis.critical_points.map(p => p.tau_real),
-                    y: data.analysis.critical_points.map(p => p.tau_imag),
-                    marker: { color: 'red', size: 8, symbol: 'star' },
-                    name: 'Critical Points'
-                });
-            }
-            
-            // Apply custom formatting to the 2D plot
-            plot2dLayout.margin = { l: 60, r: 60, t: 40, b: 60 };  // Increase margins for tick labels
-            plot2dLayout.annotations = [];  // Clear any existing annotations
-            
-            // Customize font sizes for better readability
-            plot2dLayout.font = { size: 11 };
-            plot2dLayout.xaxis.title = { text: plot2dLayout.xaxis.title, font: { size: 12 } };
-            plot2dLayout.yaxis.title = { text: plot2dLayout.yaxis.title, font: { size: 12 } };
-            
-            // Add a title annotation for z-plane to explain the liminal circles
-            if (plane === 'z_plane') {
-                // Adjust the colorscale range to highlight the liminal zone boundary
-                if (plot2dTraces[0].type === 'contour') {
-                    plot2dTraces[0].contours = {
-                        coloring: 'heatmap',
-                        showlabels: true,
-                        labelfont: {
-                            size: 10,
-                            color: 'rgba(0,0,0,0.5)'
-                        }
-                    };
-                }
-            }
-            
-            // --- Render Plots ---
-            Plotly.newPlot(phasePlotDiv, plotTracesPhase, phaseLayout, {responsive: true});
-            Plotly.newPlot(magnitudePlotDiv, plotTracesMagnitude, magnitudeLayout, {responsive: true});
-            Plotly.newPlot(plot2dDiv, plot2dTraces, plot2dLayout, {responsive: true});
+            renderPlots(data, functionText, plane);
 
-            // Update function analysis section if this is a general function
+            // Symbolic analysis is fetched separately so the plot never waits on it
             if (data.type === 'general_func' && data.function) {
-                updateFunctionAnalysis(data.function, data);
+                fetchAnalysis(data.function);
             } else if (data.type === 'zeta') {
                 // For zeta function, we can show a special analysis or hide it
                 functionAnalysisDiv.style.display = 'none';
@@ -973,31 +1226,14 @@ document.addEventListener('DOMContentLoaded', () => {
             }
 
         } catch (error) {
-            console.error('Error fetching or plotting data:', error);
-            
-            // Create more user-friendly error messages based on the error text
-            let errorMessage = error.message;
-            
-            // Handle specific function evaluation errors with more helpful messages
-            if (errorMessage.includes('Function evaluation error')) {
-                if (errorMessage.includes('not defined')) {
-                    errorMessage = 'Function error: Make sure you\'re using supported functions (sin, cos, tan, log, exp, sqrt, abs)';
-                } else if (errorMessage.includes('division by zero')) {
-                    errorMessage = 'Function error: Division by zero in your expression';
-                } else if (errorMessage.includes('Invalid function string')) {
-                    errorMessage = 'Function error: Please use only valid mathematical expressions with z as the variable';
-                }
+            if (error.name !== 'AbortError') {
+                showPlotError(error);
             }
-            
-            // Display error messages in the plot divs
-            phasePlotDiv.innerHTML = `<p style="color: red; padding: 20px;">Error loading phase plot: ${errorMessage}</p>`;
-            magnitudePlotDiv.innerHTML = `<p style="color: red; padding: 20px;">Error loading magnitude plot: ${errorMessage}</p>`;
-            plot2dDiv.innerHTML = `<p style="color: red; padding: 20px;">Error loading 2D plot: ${errorMessage}</p>`;
-            
-            // Hide analysis panel on error
-            functionAnalysisDiv.style.display = 'none';
         } finally {
-            hideLoading();
+            // An aborted request's replacement is still loading
+            if (!signal.aborted) {
+                hideLoading();
+            }
         }
     }
 
@@ -1044,6 +1280,7 @@ document.addEventListener('DOMContentLoaded', () => {
     });
 
     updateButton.addEventListener('click', fetchAndUpdatePlot);
+    imageButton.addEventListener('click', openImage);
     
     // Event listener for function input (debounced)
     let debounceTimeout;
@@ -0,0 +1,231 @@
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Fine lattice steps per side of a cell when it is subdivided
+SUBDIVISION_SAMPLES = 8
+
+# Subdivision stops once cells are this fraction of the grid spacing
+MIN_CELL_FRACTION = 1e-6
+
+# Newton iterations when polishing a located zero or pole
+NEWTON_STEPS = 30
+
+# A polished point is accepted if |f| (zeros) or |1/f| (poles) there, relative
+# to its value one grid spacing away, is below this
+ACCEPT_TOLERANCE = 1e-6
+
+
+def _wrap(angle: np.ndarray) -> np.ndarray:
+    """Wrap phase differences into [-π, π)."""
+    return (angle + np.pi) % (2 * np.pi) - np.pi
+
+
+def winding_numbers(phase: np.ndarray) -> np.ndarray:
+    """
+    Winding number of f around each cell of a grid, from its phase.
+
+    Sums the wrapped phase differences counter-clockwise around every cell
+    (argument principle): the result is the number of zeros minus the number
+    of poles inside, provided the grid resolves the phase along the cell
+    edges. Cells with a non-finite corner get 0.
+
+    Args:
+        phase: arg f on a grid indexed [y, x] like a meshgrid, with x and y
+            increasing along the axes
+
+    Returns:
+        Integer array of shape (ny - 1, nx - 1)
+    """
+    with np.errstate(invalid='ignore'):
+        dx = _wrap(np.diff(phase, axis=1))
+        dy = _wrap(np.diff(phase, axis=0))
+        total = dx[:-1, :] + dy[:, 1:] - dx[1:, :] - dy[:, :-1]
+    winding = np.rint(total / (2 * np.pi))
+    winding[~np.isfinite(winding)] = 0
+    return winding.astype(np.int64)
+
+
+def _subdivide(func: Callable[[np.ndarray], np.ndarray],
+               x0: np.ndarray, y0: np.ndarray, width: np.ndarray
+               ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Split cells into quadrants and compute each quadrant's winding number.
+
+    Each cell is sampled on a fine lattice so that the phase stays resolved
+    along the quadrant edges; a quadrant's winding is the sum over its
+    fine cells.
+
+    Returns:
+        Tuple of (x0, y0, width, winding) of the quadrants
+    """
+    n = SUBDIVISION_SAMPLES
+    steps = np.arange(n + 1) / n
+    tau = ((x0[:, None, None] + width[:, None, None] * steps[None, None, :])
+           + 1j * (y0[:, None, None] + width[:, None, None] * steps[None, :, None]))
+    with np.errstate(all='ignore'):
+        phase = np.angle(np.asarray(func(tau.ravel()), dtype=complex)).reshape(tau.shape)
+    fine = np.stack([winding_numbers(p) for p in phase])
+    half = n // 2
+    quadrants = [fine[:, :half, :half], fine[:, :half, half:],
+                 fine[:, half:, :half], fine[:, half:, half:]]
+    winding = np.concatenate([q.sum(axis=(1, 2)) for q in quadrants])
+    half_width = width / 2
+    child_x0 = np.concatenate([x0, x0 + half_width, x0, x0 + half_width])
+    child_y0 = np.concatenate([y0, y0, y0 + half_width, y0 + half_width])
+    return child_x0, child_y0, np.tile(half_width, 4), winding
+
+
+def _polish(func: Callable[[np.ndarray], np.ndarray],
+            tau: np.ndarray, multiplicity: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """
+    Polish zeros (multiplicity > 0) and poles (< 0) with Newton's method.
+
+    Uses τ ← τ − m·g/g' with g = f for zeros and g = 1/f for poles, which
+    converges quadratically at roots of multiplicity m. Derivatives are
+    central differences on the scale of the containing cell.
+    """
+    m = np.abs(multiplicity).astype(float)
+    invert = multiplicity < 0
+    h = scale * 1e-3
+
+    def g(points):
+        with np.errstate(all='ignore'):
+            values = np.asarray(func(points), dtype=complex)
+            return np.where(invert, 1 / values, values)
+
+    start = tau.copy()
+    for _ in range(NEWTON_STEPS):
+        derivative = (g(tau + h) - g(tau - h)) / (2 * h)
+        with np.errstate(all='ignore'):
+            step = m * g(tau) / derivative
+        step[~np.isfinite(step)] = 0
+        tau = tau - step
+        h = np.maximum(np.minimum(h, np.abs(step) * 1e-2), 1e-12 * np.maximum(np.abs(tau), 1))
+        if np.all(np.abs(step) <= 1e-14 * np.maximum(np.abs(tau), 1)):
+            break
+    # Steps that left the neighbourhood of the cell lost the root
+    lost = ~np.isfinite(tau) | (np.abs(tau - start) > 2 * scale)
+    tau[lost] = start[lost]
+    return tau
+
+
+def _merge(tau: np.ndarray, counts: np.ndarray, tolerance: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge roots found from several cells into one, adding up their counts.
+
+    A root on a shared cell edge splits its winding between the cells on
+    either side, and both polish to the same point.
+    """
+    order = np.argsort(tau.real, kind='stable')
+    merged_tau: List[complex] = []
+    merged_counts: List[int] = []
+    for t, m in zip(tau[order], counts[order]):
+        match = None
+        # Candidates are the most recent roots within tolerance in Re τ
+        for k in range(len(merged_tau) - 1, -1, -1):
+            if t.real - merged_tau[k].real > tolerance:
+                break
+            if abs(t - merged_tau[k]) <= tolerance and np.sign(m) == np.sign(merged_counts[k]):
+                match = k
+                break
+        if match is None:
+            merged_tau.append(t)
+            merged_counts.append(int(m))
+        else:
+            merged_counts[match] += int(m)
+    return np.array(merged_tau, dtype=complex), np.array(merged_counts, dtype=np.int64)
+
+
+def locate_zeros_and_poles(func: Callable[[np.ndarray], np.ndarray],
+                           tau_x: np.ndarray,
+                           tau_y: np.ndarray,
+                           phase: Optional[np.ndarray] = None,
+                           max_depth: int = 20,
+                           z_from_tau: Callable[[np.ndarray], np.ndarray] = lambda tau: 1 / tau
+                           ) -> List[Dict[str, Any]]:
+    """
+    Find the zeros and poles of a function from its phase over a τ grid.
+
+    Cells with a non-zero winding number are subdivided recursively,
+    keeping the quadrants with non-zero winding, until every remaining
+    cell is tiny or contains a single root; each is then polished with
+    Newton's method and kept if f (or 1/f) really vanishes there. Work is
+    proportional to the grid size plus a fixed cost per root.
+
+    Zero–pole pairs closer together than the grid spacing cancel in the
+    winding number and are not found.
+
+    Args:
+        func: Vectorized function of complex τ whose zeros and poles are sought
+        tau_x: Grid x axis (ascending)
+        tau_y: Grid y axis (ascending)
+        phase: arg func on the grid, indexed [y, x]; computed if omitted
+        max_depth: Maximum number of subdivisions of a grid cell
+        z_from_tau: Map from τ to the z coordinate reported for each point
+
+    Returns:
+        A list of dictionaries with 'type' ('zero' or 'pole'),
+        'multiplicity', and 'tau_real'/'tau_imag', 'z_real'/'z_imag' and
+        'w_real'/'w_imag' (w = log τ) coordinates. A zero or pole at the
+        τ origin has None for its z and w coordinates.
+    """
+    tau_x = np.asarray(tau_x, dtype=float)
+    tau_y = np.asarray(tau_y, dtype=float)
+    if phase is None:
+        x_mesh, y_mesh = np.meshgrid(tau_x, tau_y)
+        with np.errstate(all='ignore'):
+            phase = np.angle(np.asarray(func(x_mesh + 1j * y_mesh), dtype=complex))
+
+    winding = winding_numbers(phase)
+    rows, cols = np.nonzero(winding)
+    # Grid cells may be rectangles; subdivision works on squares covering them
+    x0 = tau_x[cols]
+    y0 = tau_y[rows]
+    width = np.maximum(tau_x[cols + 1] - x0, tau_y[rows + 1] - y0)
+    counts = winding[rows, cols]
+    min_width = MIN_CELL_FRACTION * np.min(np.abs(np.diff(tau_x))) if len(tau_x) > 1 else 0.0
+
+    leaves = []
+    for _ in range(max_depth):
+        # A cell with a single simple root needs no further splitting once it is small
+        done = (width <= min_width) | (np.abs(counts) == 1) & (width <= 1e-3 * (tau_x[-1] - tau_x[0]))
+        leaves.append((x0[done], y0[done], width[done], counts[done]))
+        x0, y0, width, counts = x0[~done], y0[~done], width[~done], counts[~done]
+        if len(x0) == 0:
+            break
+        x0, y0, width, counts = _subdivide(func, x0, y0, width)
+        keep = counts != 0
+        x0, y0, width, counts = x0[keep], y0[keep], width[keep], counts[keep]
+    leaves.append((x0, y0, width, counts))
+
+    x0, y0, width, counts = (np.concatenate(part) for part in zip(*leaves))
+    if len(counts) == 0:
+        return []
+    tau = _polish(func, (x0 + width / 2) + 1j * (y0 + width / 2), counts, width)
+    spacing = np.min(np.abs(np.diff(tau_x))) if len(tau_x) > 1 else 1.0
+    tau, counts = _merge(tau, counts, 1e-6 * spacing)
+
+    # Compare |g| at the root with |g| one grid spacing away (g = f or 1/f)
+    with np.errstate(all='ignore'):
+        at_root = np.abs(np.asarray(func(tau), dtype=complex))
+        nearby = np.abs(np.asarray(func(tau + spacing), dtype=complex))
+        residual = np.where(counts > 0, at_root / nearby, nearby / at_root)
+    accepted = residual <= ACCEPT_TOLERANCE
+
+    points = []
+    for t, m in zip(tau[accepted], counts[accepted]):
+        point = {
+            'type': 'zero' if m > 0 else 'pole',
+            'multiplicity': int(abs(m)),
+            'tau_real': float(t.real),
+            'tau_imag': float(t.imag),
+        }
+        if abs(t) <= 1e-9 * spacing:
+            # The τ origin: z and w are infinite there
+            point.update(tau_real=0.0, tau_imag=0.0, z_real=None, z_imag=None, w_real=None, w_imag=None)
+        else:
+            z = complex(z_from_tau(np.complex128(t)))
+            w = np.log(t)
+            point.update(z_real=z.real, z_imag=z.imag, w_real=float(w.real), w_imag=float(w.imag))
+        points.append(point)
+    return points
@@ -1,55 +1,84 @@
 import numpy as np
-from scipy import special
 from typing import Tuple, Optional, Union, List
 from ..core.tau_plane import TauPlane
+from .zeta import zeta
+from .zeros import zeta_zeros, zeta_zeros_between
+from .zero_table import ZeroTable
+
+# Significant digits representable by a float64 result
+FLOAT64_DIGITS = 15
 
 class RiemannAnalysis:
     """
     Class for analyzing the Riemann zeta function in the τ-plane.
     """
     
-    def __init__(self, tau_plane: Optional[TauPlane] = None):
+    def __init__(self,
+                 tau_plane: Optional[TauPlane] = None,
+                 zero_table: Optional[Union[str, ZeroTable]] = None):
         """
         Initialize the Riemann analysis with a TauPlane instance.
         
         Args:
             tau_plane: TauPlane instance for transformations
+            zero_table: Precomputed zero table (or its path) used for zero
+                queries it covers; see t_plane.analysis.zero_table
         """
         self.tau_plane = tau_plane or TauPlane()
+        if isinstance(zero_table, str):
+            zero_table = ZeroTable(zero_table)
+        self.zero_table = zero_table
     
-    def zeta_in_tau_plane(self, tau: Union[complex, np.ndarray]) -> Union[complex, np.ndarray]:
+    def zeta_in_tau_plane(self,
+                          tau: Union[complex, np.ndarray],
+                          digits: int = 12) -> Union[complex, np.ndarray]:
         """
         Compute the Riemann zeta function in the τ-plane.
         In the τ-plane, we compute ζ(1/τ).
         
+        The whole array is evaluated in one batched float64 pass. Points whose
+        error estimate exceeds the requested relative accuracy (typically near
+        zeros, or far from the origin of the standard plane) are recomputed
+        with mpmath at the requested precision.
+        
         Args:
             tau: Point(s) in the τ-plane
+            digits: Number of correct significant digits required. Up to 15
+                the result is complex128; above that every point is evaluated
+                with mpmath and an object array of mpmath.mpc is returned.
             
         Returns:
             The zeta function values
         """
         # Convert tau to z (standard complex plane)
         z = self.tau_plane.from_tau(tau)
+        values, error = zeta(z, return_error=True)
+        
+        scalar = np.ndim(values) == 0
+        values = np.atleast_1d(values)
+        error = np.atleast_1d(error)
+        tau_arr = np.atleast_1d(np.asarray(tau, dtype=complex))
         
-        # Use scipy's implementation of the Riemann zeta function
-        # Note: This calculation may have numerical issues near the critical line
-        # and for values close to z = 1 (which corresponds to tau = 1)
-        try:
-            if isinstance(z, np.ndarray):
-                # Handle arrays element-wise to catch exceptions
-                result = np.zeros_like(z, dtype=complex)
-                for i in np.ndindex(z.shape):
+        if digits > FLOAT64_DIGITS:
+            result = values.astype(object)
+            escalate = np.isfinite(tau_arr)
+        else:
+            result = values
+            tolerance = 10.0 ** -digits
+            escalate = np.isfinite(values) & (error > tolerance * np.abs(values))
+        
+        if np.any(escalate):
+            import mpmath as mp
+            with mp.workdps(digits + 5):
+                for i in zip(*np.nonzero(escalate)):
                     try:
-                        result[i] = special.zeta(z[i], 1)
+                        s = 1 / mp.mpc(tau_arr[i])
+                        value = mp.zeta(s)
+                        result[i] = value if result.dtype == object else complex(value)
                     except (ValueError, OverflowError, ZeroDivisionError):
                         result[i] = np.nan + 1j * np.nan
-                return result
-            else:
-                return special.zeta(z, 1)
-        except (ValueError, OverflowError, ZeroDivisionError):
-            if isinstance(z, np.ndarray):
-                return np.full_like(z, np.nan + 1j * np.nan)
-            return np.nan + 1j * np.nan
+        
+        return result[0] if scalar else result
     
     def find_critical_line(self, tau_min: float = 0.1, 
                           tau_max: float = 10.0, 
@@ -86,28 +115,63 @@ class RiemannAnalysis:
         Return the imaginary parts (t values) of the first few non-trivial zeros 
         of the Riemann zeta function.
         
+        Zeros are located as sign changes of the Riemann–Siegel Z function
+        between Gram points and cached, so repeated calls are cheap.
+        
         Args:
             num_zeros: Number of zeros to return
             
         Returns:
             List of t values where zeta(1/2 + it) = 0
         """
-        # First few zeros on the critical line (t values)
-        # These are approximations from known calculations
-        known_zeros_t = [
-            14.134725, 21.022040, 25.010858, 30.424876, 32.935062,
-            37.586178, 40.918719, 43.327073, 48.005151, 49.773832,
-            52.970321, 56.446248, 59.347044, 60.831779, 65.112544
-        ][:num_zeros]
-        
-        return known_zeros_t
+        table = self.zero_table
+        if table is not None and num_zeros <= len(table):
+            return np.array(table.heights[:num_zeros]).tolist()
+        return zeta_zeros(num_zeros).tolist()
+    
+    def calculate_zeros_t_between(self, t_min: float, t_max: float) -> List[float]:
+        """
+        Return the t values of all non-trivial zeros with t_min <= t <= t_max.
+        
+        Args:
+            t_min: Lower bound on t
+            t_max: Upper bound on t
+            
+        Returns:
+            List of t values where zeta(1/2 + it) = 0, ascending
+        """
+        if self.zero_table is not None and t_max <= self.zero_table.t_max:
+            return self.zero_table.window(t_min, t_max).tolist()
+        return zeta_zeros_between(t_min, t_max).tolist()
+    
+    def zeros_in_tau_window(self, t_min: float, t_max: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get every zero with t_min <= t <= t_max in τ-plane coordinates.
+        
+        Answered by binary search in the zero table when it covers the
+        window, otherwise computed (and cached) on demand.
+        
+        Args:
+            t_min: Lower bound on t
+            t_max: Upper bound on t
+            
+        Returns:
+            A tuple of (tau_x, tau_y) coordinates for the zeros
+        """
+        return self._zeros_to_tau(np.array(self.calculate_zeros_t_between(t_min, t_max)))
+    
+    @staticmethod
+    def _zeros_to_tau(zeros_t: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # Zeros are at s = 1/2 + it, and τ = 1/s
+        tau = 1 / (0.5 + 1j * zeros_t)
+        return np.real(tau), np.imag(tau)
     
     def calculate_zeros_in_tau_plane(self, num_zeros: int = 10) -> Tuple[np.ndarray, np.ndarray]:
         """
         Calculate the first few zeros of the Riemann zeta function in the τ-plane.
         
         The first few zeros on the critical line are at s = 1/2 + it, where
-        t ≈ 14.135, 21.022, 25.011, 30.425, ...
+        t ≈ 14.135, 21.022, 25.011, 30.425, ... (see calculate_zeros_t).
         
         Args:
             num_zeros: Number of zeros to calculate
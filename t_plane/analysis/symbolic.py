@@ -0,0 +1,400 @@
+import math
+import re
+from sympy import diff, solve, roots, series
+from sympy.abc import z
+from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application
+
+# Sub-analyses run by analyze_function, in the order they are reported
+SUB_ANALYSES = ('critical_points', 'domain_properties', 'series_expansion',
+                'special_values', 'differential_equations')
+
+
+def to_sympy_string(function_str):
+    """Convert a user function string into a form SymPy can parse."""
+    # '^' is Python's xor; a standalone 'e' is SymPy's E. Names such as
+    # sin, cos, tan, exp, log, sqrt and pi are already in SymPy format.
+    return re.sub(r'\be\b', 'E', function_str.replace('^', '**'))
+
+
+def parse_function(function_str):
+    """
+    Parse a user function string into a SymPy expression of z.
+
+    Args:
+        function_str: String representation of the function
+
+    Returns:
+        The SymPy expression
+    """
+    # Set up SymPy for parsing with implicit multiplication
+    transformations = standard_transformations + (implicit_multiplication_application,)
+    return parse_expr(to_sympy_string(function_str), transformations=transformations)
+
+
+def find_critical_points(function_str):
+    """
+    Find critical points (where the derivative vanishes) and classify them.
+
+    Args:
+        function_str: String representation of the function
+
+    Returns:
+        A list of critical point dictionaries in z and τ coordinates
+    """
+    expr = parse_function(function_str)
+
+    # Calculate the derivative
+    derivative = diff(expr, z)
+    second_derivative = diff(derivative, z)
+
+    critical_points = []
+    solutions = list(roots(derivative, z))
+    if not solutions:
+        solutions = solve(derivative, z)
+
+    # Convert solutions to a list of complex numbers
+    for sol in solutions:
+        if sol.is_real:
+            z_value = complex(float(sol), 0)
+        else:
+            z_value = complex(float(sol.as_real_imag()[0]), float(sol.as_real_imag()[1]))
+
+        # Determine point type (maximum, minimum, saddle, etc.)
+        try:
+            # Calculate second derivative at this point
+            second_deriv_val = complex(second_derivative.subs(z, sol))
+
+            if second_deriv_val.real > 0:
+                point_type = "Minimum"
+            elif second_deriv_val.real < 0:
+                point_type = "Maximum"
+            else:
+                point_type = "Saddle point or inflection"
+        except:
+            point_type = "Unknown"
+
+        # Convert z back to tau space
+        tau_value = 1.0 / z_value if z_value != 0 else None
+
+        if tau_value is not None:
+            critical_points.append({
+                'z_real': z_value.real,
+                'z_imag': z_value.imag,
+                'tau_real': tau_value.real if not math.isinf(tau_value.real) else 0,
+                'tau_imag': tau_value.imag if not math.isinf(tau_value.imag) else 0,
+                'type': point_type,
+                'function_value': str(expr.subs(z, sol))
+            })
+    return critical_points
+
+
+def describe_domain(function_str):
+    """
+    Describe singularities, branch points and growth from the function string.
+
+    Args:
+        function_str: String representation of the function
+
+    Returns:
+        A dictionary of domain properties
+    """
+    sympy_str = to_sympy_string(function_str)
+
+    # Find domain properties (singularities, branch points)
+    domain_properties = {
+        'description': 'Complex analytic function',
+        'singularities': 'None detected',
+        'branch_points': 'None detected',
+        'domain': 'Entire complex plane',
+        'growth_rate': 'Undetermined'
+    }
+
+    # Look for division by expressions that could be zero
+    if '/' in function_str:
+        domain_properties['description'] = 'Meromorphic function with possible poles'
+        domain_properties['singularities'] = 'Potential poles where denominator = 0'
+        domain_properties['domain'] = 'Complex plane excluding singularities'
+
+    # Check for logarithms or fractional powers that could create branch cuts
+    if 'log' in function_str or 'sqrt' in function_str or re.search(r'\^\s*\d*\.\d+', function_str):
+        if 'log' in function_str:
+            domain_properties['description'] = 'Function with logarithmic branch cut'
+            domain_properties['branch_points'] = 'At z = 0 extending to -∞'
+            domain_properties['domain'] = 'Complex plane excluding branch cut'
+        elif 'sqrt' in function_str:
+            domain_properties['description'] = 'Function with square root branch cut'
+            domain_properties['branch_points'] = 'Present (specific points not calculated)'
+            domain_properties['domain'] = 'Complex plane excluding branch cut'
+
+    # Determine growth rate for polynomial-like functions
+    if all(term not in function_str for term in ['sin', 'cos', 'tan', 'exp', 'log']):
+        try:
+            # Check if function resembles a polynomial (by examining highest power)
+            degree = 0
+            if 'z**' in sympy_str:
+                powers = re.findall(r'z\*\*(\d+)', sympy_str)
+                if powers:
+                    degree = max(int(p) for p in powers)
+
+            if degree > 0:
+                domain_properties['growth_rate'] = f"O(|z|^{degree}) as |z| → ∞"
+            else:
+                domain_properties['growth_rate'] = "Bounded or sublinear growth"
+        except:
+            pass
+    elif 'exp' in function_str:
+        domain_properties['growth_rate'] = "Exponential growth"
+
+    return domain_properties
+
+
+def expand_series(function_str):
+    """
+    Compute the Taylor series around z = 0, and the Laurent series for
+    functions with a singularity there.
+
+    Args:
+        function_str: String representation of the function
+
+    Returns:
+        A dictionary with 'series_expansion' and possibly 'laurent_expansion'
+    """
+    expr = parse_function(function_str)
+    expansions = {}
+
+    # Get Taylor series around z=0 (up to order 5)
+    taylor_series = series(expr, z, 0, 5).removeO()
+    expansions['series_expansion'] = str(taylor_series)
+
+    # Get Laurent series for functions with singularity at z=0
+    if '/' in function_str and 'z' in function_str.split('/')[1]:
+        try:
+            laurent_series = series(expr, z, 0, n=None)
+            expansions['laurent_expansion'] = str(laurent_series)
+        except:
+            pass
+    return expansions
+
+
+def compute_special_values(function_str):
+    """
+    Evaluate the function at special points and its limit at infinity.
+
+    Args:
+        function_str: String representation of the function
+
+    Returns:
+        A dictionary of special values
+    """
+    expr = parse_function(function_str)
+    special_values = {}
+    special_values['at_zero'] = str(expr.subs(z, 0)) if '/' not in function_str or 'z' not in function_str.split('/')[1] else "Undefined (singularity)"
+    special_values['at_one'] = str(expr.subs(z, 1))
+    special_values['at_i'] = str(expr.subs(z, 1j))
+
+    # Add limits for more context
+    from sympy import limit, oo
+    if '/' in function_str:
+        # Try to compute limit at infinity
+        try:
+            lim_inf = limit(expr, z, oo)
+            special_values['limit_at_infinity'] = str(lim_inf)
+        except:
+            special_values['limit_at_infinity'] = "Could not compute"
+    return special_values
+
+
+def describe_differential_equations(function_str):
+    """
+    Suggest a simple differential equation the function may satisfy.
+
+    Args:
+        function_str: String representation of the function
+
+    Returns:
+        A dictionary with an explanatory note, if any
+    """
+    diff_eq_info = {}
+    # Check if function satisfies a simple differential equation
+    if 'sin' in function_str:
+        diff_eq_info['note'] = "Function may satisfy y'' + y = 0 (harmonic oscillator equation)"
+    elif 'exp' in function_str:
+        diff_eq_info['note'] = "Function may satisfy y' = y (exponential growth equation)"
+    elif any(fn in function_str for fn in ['tan', 'cot']):
+        diff_eq_info['note'] = "Function may satisfy a nonlinear first-order differential equation"
+    return diff_eq_info
+
+
+# Each sub-analysis takes the function string, so it can run in a worker process
+SUB_ANALYSIS_FUNCTIONS = {
+    'critical_points': find_critical_points,
+    'domain_properties': describe_domain,
+    'series_expansion': expand_series,
+    'special_values': compute_special_values,
+    'differential_equations': describe_differential_equations,
+}
+
+# Fallback values reported when a sub-analysis fails or does not finish
+SUB_ANALYSIS_DEFAULTS = {
+    'critical_points': [],
+    'domain_properties': {},
+    'series_expansion': {'series_expansion': "Could not compute Taylor series"},
+    'special_values': {},
+    'differential_equations': {},
+}
+
+
+def assemble_analysis(parts):
+    """
+    Combine sub-analysis results into the response format of analyze_function.
+
+    Args:
+        parts: Mapping from sub-analysis name to its result; missing entries
+            are filled with SUB_ANALYSIS_DEFAULTS
+
+    Returns:
+        A dictionary containing analysis results
+    """
+    parts = {name: parts.get(name, SUB_ANALYSIS_DEFAULTS[name]) for name in SUB_ANALYSES}
+    domain_properties = dict(parts['domain_properties'])
+    domain_properties.update(parts['series_expansion'])
+    return {
+        'critical_points': parts['critical_points'],
+        'domain_properties': domain_properties,
+        'special_values': parts['special_values'],
+        'differential_equations': parts['differential_equations']
+    }
+
+
+def parse_error(function_str):
+    """
+    Check whether SymPy can parse a function string.
+
+    Args:
+        function_str: String representation of the function
+
+    Returns:
+        The parser's error message, or None if the string parses
+    """
+    try:
+        parse_function(function_str)
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def failed_analysis(error):
+    """
+    The analysis reported for a function that could not be parsed.
+
+    Args:
+        error: The parser's error message
+
+    Returns:
+        A dictionary in the format of analyze_function with an 'error' entry
+    """
+    return {
+        'error': f"Analysis failed: {error}",
+        'critical_points': [],
+        'domain_properties': {
+            'description': 'Analysis failed',
+            'singularities': 'Unknown',
+            'branch_points': 'Unknown'
+        }
+    }
+
+
+def analyze_function(function_str, is_zeta=False):
+    """
+    Perform mathematical analysis on a function to find critical points,
+    singularities, and other properties.
+
+    Runs every sub-analysis in the calling thread; see
+    t_plane.interactive.analysis_service for the time-limited variant.
+
+    Args:
+        function_str: String representation of the function to analyze
+        is_zeta: Boolean indicating whether the function is the Riemann Zeta function
+
+    Returns:
+        A dictionary containing analysis results
+    """
+    if is_zeta:
+        # Special analysis for the Riemann Zeta function
+        return analyze_zeta_function()
+
+    # Fail early on expressions SymPy cannot parse
+    error = parse_error(function_str)
+    if error is not None:
+        print(f"Function analysis failed: {error}")
+        return failed_analysis(error)
+
+    parts = {}
+    for name in SUB_ANALYSES:
+        try:
+            parts[name] = SUB_ANALYSIS_FUNCTIONS[name](function_str)
+        except Exception as e:
+            print(f"Error in {name} analysis: {e}")
+    return assemble_analysis(parts)
+
+
+def analyze_zeta_function():
+    """
+    Special analysis for the Riemann Zeta function.
+
+    Returns:
+        Dictionary containing zeta-specific analysis results
+    """
+    # Define important properties of the Riemann Zeta function
+    critical_points = [
+        {
+            'z_real': -1.0,
+            'z_imag': 0.0,
+            'tau_real': -1.0,
+            'tau_imag': 0.0,
+            'type': 'Extremum',
+            'function_value': '-1/12'
+        }
+    ]
+    
+    domain_properties = {
+        'description': 'Meromorphic function with analytic continuation',
+        'singularities': 'Simple pole at s = 1',
+        'branch_points': 'None',
+        'domain': 'Entire complex plane except s = 1',
+        'growth_rate': 'Various rates in different regions',
+        'series_expansion': 'ζ(s) = 1/s-1 + Σ(-1)^n γ_n/(n!) · (s-1)^n for s near 1',
+        'laurent_expansion': '1/(s-1) + γ + O((s-1))'
+    }
+    
+    special_values = {
+        'at_zero': '-1/2',
+        'at_two': 'π²/6 ≈ 1.645',
+        'at_four': 'π⁴/90 ≈ 1.082',
+        'at_negative_even': '0 (trivial zeros)',
+        'functional_equation': 'ζ(s) = 2^s · π^(s-1) · sin(πs/2) · Γ(1-s) · ζ(1-s)',
+        'critical_line': 'Re(s) = 1/2 is where all non-trivial zeros are conjectured to lie (Riemann Hypothesis)'
+    }
+    
+    important_facts = {
+        'riemann_hypothesis': 'All non-trivial zeros lie on the critical line Re(s) = 1/2',
+        'prime_number_connection': 'Euler product formula: ζ(s) = ∏ᵨ(1 - p^(-s))^(-1)',
+        'analytic_continuation': 'Originally defined for Re(s) > 1, but can be extended to the entire complex plane',
+        'reflection_formula': 'ζ(1-s) = 2^(1-s) · π^(-s) · cos(πs/2) · Γ(s) · ζ(s)',
+        'number_theory': 'Central to the distribution of prime numbers through the Prime Number Theorem',
+        'trivial_zeros': 'At negative even integers: -2, -4, -6, ...',
+        'first_few_zeros': [
+            '1/2 + 14.1347i',
+            '1/2 + 21.0220i',
+            '1/2 + 25.0109i',
+            '1/2 + 30.4249i',
+            '1/2 + 32.9351i'
+        ]
+    }
+    
+    return {
+        'critical_points': critical_points,
+        'domain_properties': domain_properties,
+        'special_values': special_values,
+        'important_facts': important_facts
+    }
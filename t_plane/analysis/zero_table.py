@@ -0,0 +1,218 @@
+"""
+On-disk table of Riemann zero heights, opened with np.memmap.
+
+File layout (all little-endian):
+
+    offset 0    header, 64 bytes:
+                  magic         8s   b"TAUZEROS"
+                  version       u4
+                  reserved      u4
+                  count         u8   number of zeros in the table
+                  index_stride  u8   one index entry per index_stride zeros
+                  index_count   u8   number of index entries
+                  data_offset   u8   byte offset of the heights
+                  index_offset  u8   byte offset of the index
+    data_offset  count × f8    zero heights t_1 < t_2 < ..., starting at the first zero
+    index_offset index_count × f8   every index_stride-th height
+
+Only the small index is read into memory. A window query binary-searches
+the index, then the one or two index_stride-sized blocks of the mapped
+heights that contain the window's ends.
+
+Build a table with:
+
+    python -m t_plane.analysis.zero_table zeros.tzt --t-max 100500
+"""
+import argparse
+import struct
+import numpy as np
+from typing import Iterable, Optional, Tuple
+
+from .zeros import _gram_index_at, _scan, FIRST_GRAM_INDEX
+
+MAGIC = b"TAUZEROS"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQQQQQ")
+
+# Zero heights per index entry
+INDEX_STRIDE = 4096
+
+# Gram intervals located per build step (≈ zeros kept in memory at once)
+BUILD_CHUNK = 100_000
+
+
+def write_zero_table(path: str, chunks: Iterable[np.ndarray], index_stride: int = INDEX_STRIDE) -> int:
+    """
+    Write ascending zero heights, given in consecutive chunks, as a zero table.
+
+    Args:
+        path: Output file
+        chunks: Arrays of heights; together they must be strictly ascending
+            and start at the first zero
+        index_stride: Zero heights per index entry
+
+    Returns:
+        Number of zeros written
+    """
+    count = 0
+    index = []
+    last = -np.inf
+    with open(path, "wb") as f:
+        f.write(b"\0" * HEADER.size)
+        for chunk in chunks:
+            chunk = np.ascontiguousarray(chunk, dtype="<f8")
+            if len(chunk) == 0:
+                continue
+            if chunk[0] <= last or np.any(np.diff(chunk) <= 0):
+                raise ValueError("Zero heights must be strictly ascending")
+            # Positions count + k that are multiples of index_stride
+            first = -count % index_stride
+            index.append(chunk[first::index_stride])
+            f.write(chunk.tobytes())
+            count += len(chunk)
+            last = chunk[-1]
+
+        index_values = np.concatenate(index) if index else np.empty(0, dtype="<f8")
+        index_offset = HEADER.size + 8 * count
+        f.write(index_values.astype("<f8").tobytes())
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, 0, count, index_stride, len(index_values),
+                            HEADER.size, index_offset))
+    return count
+
+
+def build_zero_table(path: str,
+                     t_max: Optional[float] = None,
+                     count: Optional[int] = None,
+                     chunk: int = BUILD_CHUNK) -> int:
+    """
+    Compute zeros with the Riemann–Siegel engine and write them to a table.
+
+    Zeros are located BUILD_CHUNK Gram intervals at a time, so memory use
+    does not grow with the size of the table.
+
+    Args:
+        path: Output file
+        t_max: Include every zero with t <= t_max
+        count: Include the first count zeros (if t_max is not given)
+        chunk: Gram intervals per step
+
+    Returns:
+        Number of zeros written
+    """
+    if (t_max is None) == (count is None):
+        raise ValueError("Give exactly one of t_max and count")
+
+    def chunks():
+        written = 0
+        n = FIRST_GRAM_INDEX
+        stop = _gram_index_at(t_max) + 1 if t_max is not None else None
+        while True:
+            if stop is None:
+                # Zero k lies close to Gram point g_{k-2}
+                n_next = n + min(chunk, count - written + 8)
+            else:
+                n_next = min(n + chunk, stop)
+            zeros = _scan(n, n_next)
+            if t_max is not None:
+                zeros = zeros[zeros <= t_max]
+            else:
+                zeros = zeros[:count - written]
+            written += len(zeros)
+            yield zeros
+            n = n_next
+            if (stop is not None and n >= stop) or (count is not None and written >= count):
+                return
+
+    return write_zero_table(path, chunks())
+
+
+class ZeroTable:
+    """
+    Read-only view of a zero table file; heights are memory-mapped.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a zero table.
+
+        Args:
+            path: Table file written by write_zero_table or build_zero_table
+        """
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{path} is not a zero table")
+        (magic, version, _, self.count, self.index_stride, index_count,
+         data_offset, index_offset) = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a zero table")
+        if version != VERSION:
+            raise ValueError(f"Unsupported zero table version {version}")
+
+        self.path = path
+        self.heights = (np.memmap(path, dtype="<f8", mode="r", offset=data_offset, shape=(self.count,))
+                        if self.count else np.empty(0))
+        self.index = np.fromfile(path, dtype="<f8", count=index_count, offset=index_offset)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def t_max(self) -> float:
+        """Height of the last zero in the table (the table is complete up to here)."""
+        return float(self.heights[-1]) if self.count else 0.0
+
+    def _position(self, t: float, side: str) -> int:
+        """Position of t among the heights, like np.searchsorted on the full table."""
+        block = max(np.searchsorted(self.index, t, side=side) - 1, 0)
+        start = block * self.index_stride
+        stop = min(start + self.index_stride, self.count)
+        return start + int(np.searchsorted(self.heights[start:stop], t, side=side))
+
+    def window_positions(self, t_min: float, t_max: float) -> Tuple[int, int]:
+        """
+        Find the zeros with t_min <= t <= t_max.
+
+        Args:
+            t_min: Lower height
+            t_max: Upper height
+
+        Returns:
+            (start, stop) such that heights[start:stop] is the window; zero
+            number k (counting from 1) is at position k - 1
+        """
+        if t_max < t_min:
+            raise ValueError("t_max must not be smaller than t_min")
+        return self._position(t_min, "left"), self._position(t_max, "right")
+
+    def window(self, t_min: float, t_max: float) -> np.ndarray:
+        """
+        Get the heights of the zeros with t_min <= t <= t_max.
+
+        Args:
+            t_min: Lower height
+            t_max: Upper height
+
+        Returns:
+            The heights in the window (an in-memory copy), ascending
+        """
+        start, stop = self.window_positions(t_min, t_max)
+        return np.array(self.heights[start:stop])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a Riemann zero table for np.memmap access.")
+    parser.add_argument("path", help="output file")
+    limit = parser.add_mutually_exclusive_group(required=True)
+    limit.add_argument("--t-max", type=float, help="include every zero with t <= T_MAX")
+    limit.add_argument("--count", type=int, help="include the first COUNT zeros")
+    args = parser.parse_args(argv)
+
+    written = build_zero_table(args.path, t_max=args.t_max, count=args.count)
+    table = ZeroTable(args.path)
+    print(f"Wrote {written} zeros up to t = {table.t_max:.6f} to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+import threading
+import numpy as np
+from collections import OrderedDict
+from numpy.polynomial import chebyshev
+from typing import Tuple
+
+from .zeta import zeta
+
+# Below this height Z(t) is computed from ζ(1/2 + it) directly; above it the
+# Riemann–Siegel formula is both faster and at least as accurate
+RS_MIN_T = 1000.0
+
+# Samples of Z per Gram interval in the first scan for sign changes
+GRAM_SUBDIVISIONS = 4
+
+# Rounds of 4× denser sampling for Gram blocks that are missing zeros
+MAX_REFINEMENTS = 4
+
+# Absolute tolerance on the location of polished zeros
+ZERO_XTOL = 1e-10
+
+# Zeros up to this height are cached as one contiguous sorted table
+PREFIX_LIMIT_T = 1e5
+
+# Number of cached windows above PREFIX_LIMIT_T
+WINDOW_CACHE_SIZE = 64
+
+# No zeros lie below t = 14.13; the scan starts at Gram point g_{-1} ≈ 9.67
+FIRST_GRAM_INDEX = -1
+
+
+def _psi(p: np.ndarray) -> np.ndarray:
+    """Ψ(p) = cos(2π(p² − p − 1/16)) / cos(2πp), analytic on [0, 1]."""
+    return np.cos(2 * np.pi * (p * p - p - 1 / 16)) / np.cos(2 * np.pi * p)
+
+
+# Ψ and the derivatives entering the Riemann–Siegel correction terms, as
+# Chebyshev series on [0, 1]. Chebyshev nodes never hit the removable
+# singularities of Ψ at p = 1/4 and p = 3/4.
+_PSI = chebyshev.Chebyshev.interpolate(_psi, 40, domain=[0, 1])
+_PSI_2 = _PSI.deriv(2)
+_PSI_3 = _PSI.deriv(3)
+_PSI_6 = _PSI.deriv(6)
+
+
+def theta(t: np.ndarray) -> np.ndarray:
+    """
+    Riemann–Siegel theta function θ(t) = arg Γ(1/4 + it/2) − (t/2) log π.
+
+    Args:
+        t: Real heights
+
+    Returns:
+        θ(t), continuous in t
+    """
+    from scipy import special
+    t = np.asarray(t, dtype=float)
+    return np.imag(special.loggamma(0.25 + 0.5j * t)) - 0.5 * t * np.log(np.pi)
+
+
+def _theta_prime(t: np.ndarray) -> np.ndarray:
+    from scipy import special
+    return 0.5 * np.real(special.psi(0.25 + 0.5j * t)) - 0.5 * np.log(np.pi)
+
+
+def gram_points(indices: np.ndarray) -> np.ndarray:
+    """
+    Compute Gram points g_n, the solutions of θ(g_n) = nπ with g_n > 7.
+
+    Args:
+        indices: Integer Gram indices n >= -1
+
+    Returns:
+        The Gram points, one per index
+    """
+    from scipy import special
+    n = np.asarray(indices, dtype=float)
+    # Asymptotic θ(t) ≈ (t/2) log(t/2πe) − π/8 inverted with Lambert W
+    g = 2 * np.pi * np.exp(1 + np.real(special.lambertw((8 * n + 1) / (8 * np.e))))
+    for _ in range(4):
+        g = g - (theta(g) - n * np.pi) / _theta_prime(g)
+    return g
+
+
+def riemann_siegel_z(t: np.ndarray) -> np.ndarray:
+    """
+    Evaluate Hardy's Z function Z(t) = e^{iθ(t)} ζ(1/2 + it), which is real.
+
+    For t >= RS_MIN_T the Riemann–Siegel formula is used: a main sum of
+    ⌊√(t/2π)⌋ terms plus the correction terms C0, C1 and C2 (absolute error
+    well below 1e-8 there). Smaller t are evaluated through ζ directly.
+
+    Args:
+        t: Real heights t >= 0
+
+    Returns:
+        Z(t), with the shape of t
+    """
+    t = np.asarray(t, dtype=float)
+    result = np.empty(t.shape)
+    flat_t = t.ravel()
+    flat = result.reshape(-1)
+
+    low = flat_t < RS_MIN_T
+    if np.any(low):
+        t_low = flat_t[low]
+        values = zeta(0.5 + 1j * t_low)
+        flat[low] = np.real(np.exp(1j * theta(t_low)) * values)
+
+    high = ~low
+    if np.any(high):
+        t_high = flat_t[high]
+        a = np.sqrt(t_high / (2 * np.pi))
+        n_terms = np.floor(a).astype(np.int64)
+        p = a - n_terms
+        th = theta(t_high)
+
+        main = np.zeros_like(t_high)
+        for n in range(1, int(n_terms.max()) + 1):
+            active = n_terms >= n
+            main[active] += np.cos(th[active] - t_high[active] * np.log(n)) / np.sqrt(n)
+
+        u = 1 / a
+        c0 = _PSI(p)
+        c1 = -_PSI_3(p) / (96 * np.pi ** 2)
+        c2 = _PSI_2(p) / (64 * np.pi ** 2) + _PSI_6(p) / (18432 * np.pi ** 4)
+        sign = np.where(n_terms % 2 == 1, 1.0, -1.0)
+        flat[high] = 2 * main + sign * np.sqrt(u) * (c0 + c1 * u + c2 * u * u)
+
+    return result
+
+
+def _polish(a: np.ndarray, b: np.ndarray, fa: np.ndarray, fb: np.ndarray,
+            xtol: float = ZERO_XTOL, max_iter: int = 100) -> np.ndarray:
+    """
+    Refine sign-change brackets of Z to zeros, all brackets at once.
+
+    Uses the Illinois variant of regula falsi, falling back to bisection
+    when a step would leave the bracket.
+
+    Args:
+        a, b: Bracket endpoints
+        fa, fb: Z at the endpoints, of opposite sign
+        xtol: Absolute tolerance on the zero
+        max_iter: Iteration limit
+
+    Returns:
+        The zeros, one per bracket
+    """
+    a, b, fa, fb = a.copy(), b.copy(), fa.copy(), fb.copy()
+    active = np.abs(b - a) > xtol
+    for _ in range(max_iter):
+        idx = np.nonzero(active)[0]
+        if len(idx) == 0:
+            break
+        ai, bi, fai, fbi = a[idx], b[idx], fa[idx], fb[idx]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            c = bi - fbi * (bi - ai) / (fbi - fai)
+        outside = ~((c > np.minimum(ai, bi)) & (c < np.maximum(ai, bi)))
+        c[outside] = 0.5 * (ai + bi)[outside]
+        fc = riemann_siegel_z(c)
+
+        crossed = fc * fbi < 0
+        # The root is between b and c: the old b becomes the far end
+        a[idx] = np.where(crossed, bi, ai)
+        fa[idx] = np.where(crossed, fbi, 0.5 * fai)
+        b[idx], fb[idx] = c, fc
+
+        done = (np.abs(b[idx] - a[idx]) <= xtol) | (fc == 0)
+        active[idx[done]] = False
+    return b
+
+
+def _scan(n_start: int, n_stop: int) -> np.ndarray:
+    """
+    Locate all zeros of Z in (g_{n_start}, g_{n_stop}].
+
+    Z is sampled GRAM_SUBDIVISIONS times per Gram interval. Blocks between
+    consecutive good Gram points (where (−1)^n Z(g_n) > 0) must contain as
+    many zeros as Gram intervals; blocks that are short, which happens
+    around close pairs of zeros, are sampled more densely until they match.
+
+    Args:
+        n_start: Gram index of the lower end
+        n_stop: Gram index of the upper end
+
+    Returns:
+        Sorted array of zero heights
+    """
+    indices = np.arange(n_start, n_stop + 1)
+    gram = gram_points(indices)
+    z_gram = riemann_siegel_z(gram)
+    good = ((-1.0) ** indices) * z_gram > 0
+    # The scan's end points always delimit a block
+    good[0] = good[-1] = True
+    boundaries = np.nonzero(good)[0]
+
+    def sample(lo: int, hi: int, subdivisions: int) -> Tuple[np.ndarray, np.ndarray]:
+        # Z at the Gram points g_lo .. g_hi and at evenly spaced points between them
+        steps = np.arange(1, subdivisions) / subdivisions
+        interior = gram[lo:hi, None] + steps[None, :] * np.diff(gram[lo:hi + 1])[:, None]
+        t = np.append(np.column_stack([gram[lo:hi], interior]).ravel(), gram[hi])
+        z = np.append(np.column_stack([z_gram[lo:hi], riemann_siegel_z(interior)]).ravel(), z_gram[hi])
+        return t, z
+
+    def brackets(t: np.ndarray, z: np.ndarray) -> Tuple[np.ndarray, ...]:
+        change = np.nonzero(np.sign(z[:-1]) * np.sign(z[1:]) < 0)[0]
+        return t[change], t[change + 1], z[change], z[change + 1]
+
+    # One pass over the whole range, then denser passes over short blocks only
+    t, z = sample(0, len(gram) - 1, GRAM_SUBDIVISIONS)
+    found = [brackets(t, z)]
+    block_of = np.searchsorted(gram[boundaries[1:-1]], found[0][0], side='right')
+    counts = np.bincount(block_of, minlength=len(boundaries) - 1)
+    short = np.nonzero(counts < np.diff(boundaries))[0]
+    if len(short):
+        keep = ~np.isin(block_of, short)
+        found[0] = tuple(part[keep] for part in found[0])
+        for block in short:
+            lo, hi = boundaries[block], boundaries[block + 1]
+            subdivisions = GRAM_SUBDIVISIONS
+            for _ in range(MAX_REFINEMENTS):
+                subdivisions *= 4
+                refined = brackets(*sample(lo, hi, subdivisions))
+                if len(refined[0]) >= hi - lo:
+                    break
+            found.append(refined)
+
+    a, b, fa, fb = (np.concatenate(part) for part in zip(*found))
+    return np.sort(_polish(a, b, fa, fb))
+
+
+def _gram_index_at(t: float) -> int:
+    """Index of the last Gram point at or below t (never below FIRST_GRAM_INDEX)."""
+    if t <= gram_points([FIRST_GRAM_INDEX])[0]:
+        return FIRST_GRAM_INDEX
+    return int(np.floor(theta(t) / np.pi))
+
+
+class ZeroFinder:
+    """
+    Locates non-trivial zeros of ζ on the critical line, with an in-memory cache.
+
+    Zeros are the sign changes of Hardy's Z function, bracketed between Gram
+    points and polished to ZERO_XTOL. Zeros up to PREFIX_LIMIT_T are kept as
+    one sorted table that grows on demand; windows higher up are cached
+    individually.
+    """
+
+    def __init__(self, prefix_limit: float = PREFIX_LIMIT_T, window_cache_size: int = WINDOW_CACHE_SIZE):
+        """
+        Initialize an empty cache.
+
+        Args:
+            prefix_limit: Height up to which zeros are kept in the contiguous table
+            window_cache_size: Number of windows above prefix_limit kept
+        """
+        self.prefix_limit = prefix_limit
+        self.window_cache_size = window_cache_size
+        self._zeros = np.empty(0)
+        self._covered_index = FIRST_GRAM_INDEX
+        self._windows: "OrderedDict[Tuple[int, int], np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _extend(self, gram_index: int) -> None:
+        """Grow the contiguous table to cover all zeros up to g_{gram_index}."""
+        if gram_index > self._covered_index:
+            found = _scan(self._covered_index, gram_index)
+            self._zeros = np.concatenate([self._zeros, found])
+            self._covered_index = gram_index
+
+    def first_zeros(self, count: int) -> np.ndarray:
+        """
+        Get the heights of the first zeros 1/2 + it.
+
+        Args:
+            count: Number of zeros
+
+        Returns:
+            The first count zero heights t, ascending
+        """
+        with self._lock:
+            # The k-th zero lies close to Gram point g_{k-2}
+            target = max(self._covered_index, count + 8)
+            while len(self._zeros) < count:
+                self._extend(target)
+                target *= 2
+            return self._zeros[:count].copy()
+
+    def zeros_between(self, t_min: float, t_max: float) -> np.ndarray:
+        """
+        Get the heights of all zeros with t_min <= t <= t_max.
+
+        Args:
+            t_min: Lower height
+            t_max: Upper height
+
+        Returns:
+            The zero heights in the range, ascending
+        """
+        if t_max < t_min:
+            raise ValueError("t_max must not be smaller than t_min")
+        n_hi = _gram_index_at(t_max) + 1
+        with self._lock:
+            if t_max <= self.prefix_limit:
+                self._extend(n_hi)
+                zeros = self._zeros
+            else:
+                key = (_gram_index_at(t_min), n_hi)
+                zeros = self._windows.get(key)
+                if zeros is None:
+                    zeros = _scan(*key)
+                    self._windows[key] = zeros
+                    while len(self._windows) > self.window_cache_size:
+                        self._windows.popitem(last=False)
+                else:
+                    self._windows.move_to_end(key)
+            lo = np.searchsorted(zeros, t_min, side='left')
+            hi = np.searchsorted(zeros, t_max, side='right')
+            return zeros[lo:hi].copy()
+
+
+# Shared finder so every caller benefits from the same cache
+default_finder = ZeroFinder()
+
+
+def zeta_zeros(count: int) -> np.ndarray:
+    """
+    Heights t of the first non-trivial zeros 1/2 + it of ζ.
+
+    Args:
+        count: Number of zeros
+
+    Returns:
+        Array of count zero heights, ascending
+    """
+    return default_finder.first_zeros(count)
+
+
+def estimated_zero_count(t_min: float, t_max: float) -> float:
+    """
+    Approximate number of zeros with t_min <= t <= t_max, without finding them.
+
+    Uses N(t) ≈ θ(t)/π + 1, which is accurate to a few zeros at any height,
+    plus one to cover a zero on either end.
+
+    Args:
+        t_min: Lower height
+        t_max: Upper height
+
+    Returns:
+        The estimated count (0 for an empty window)
+    """
+    if t_max < t_min:
+        return 0.0
+    low, high = theta(np.array([max(t_min, 0.0), max(t_max, 0.0)]))
+    return float((high - low) / np.pi + 1)
+
+
+def zeta_zeros_between(t_min: float, t_max: float) -> np.ndarray:
+    """
+    Heights t of the non-trivial zeros 1/2 + it of ζ with t_min <= t <= t_max.
+
+    Args:
+        t_min: Lower height
+        t_max: Upper height
+
+    Returns:
+        Array of zero heights, ascending
+    """
+    return default_finder.zeros_between(t_min, t_max)
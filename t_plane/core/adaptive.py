@@ -0,0 +1,245 @@
+import warnings
+import numpy as np
+from typing import Callable, Tuple
+
+
+class QuadtreeSamples:
+    """
+    The result of adaptive sampling: a quadtree of square cells over the τ-plane.
+
+    Cells live on an integer lattice with `lattice` steps per side, so a leaf
+    is described by its lower-left lattice corner (x0, y0) and its side
+    length `size` in lattice steps. Each leaf carries the function values at
+    its four corners, in the order (x0, y0), (x0+size, y0), (x0, y0+size),
+    (x0+size, y0+size).
+    """
+
+    def __init__(self,
+                 tau_min: float,
+                 tau_max: float,
+                 lattice: int,
+                 x0: np.ndarray,
+                 y0: np.ndarray,
+                 size: np.ndarray,
+                 corners: np.ndarray,
+                 evaluations: int):
+        """
+        Initialize the quadtree description.
+
+        Args:
+            tau_min: Minimum τ value of the sampled square
+            tau_max: Maximum τ value of the sampled square
+            lattice: Number of lattice steps per side at the finest level
+            x0: Lattice x coordinate of each leaf's lower-left corner
+            y0: Lattice y coordinate of each leaf's lower-left corner
+            size: Side length of each leaf in lattice steps
+            corners: Complex function values at the leaf corners, shape (leaves, 4)
+            evaluations: Number of function evaluations performed
+        """
+        self.tau_min = tau_min
+        self.tau_max = tau_max
+        self.lattice = lattice
+        self.x0 = x0
+        self.y0 = y0
+        self.size = size
+        self.corners = corners
+        self.evaluations = evaluations
+
+    @property
+    def step(self) -> float:
+        """Width in τ of one lattice step."""
+        return (self.tau_max - self.tau_min) / self.lattice
+
+    def cells(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the leaf cells in τ coordinates.
+
+        Returns:
+            A tuple of (x_min, y_min, width) arrays, one entry per leaf
+        """
+        step = self.step
+        return (self.tau_min + self.x0 * step,
+                self.tau_min + self.y0 * step,
+                self.size * step)
+
+    def cell_phase(self) -> np.ndarray:
+        """Circular mean of the phase over each leaf's corners."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            unit = self.corners / np.abs(self.corners)
+            return np.angle(np.nansum(unit, axis=1))
+
+    def cell_log_magnitude(self) -> np.ndarray:
+        """Mean of log10 |f| over each leaf's finite corners."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            log_magnitude = np.log10(np.abs(self.corners))
+        log_magnitude[~np.isfinite(log_magnitude)] = np.nan
+        with warnings.catch_warnings():
+            # Leaves whose corners are all singular have no mean
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return np.nanmean(log_magnitude, axis=1)
+
+    def to_grid(self, points: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rasterize the quadtree onto a uniform points×points grid.
+
+        Each output sample is bilinearly interpolated from the corners of the
+        leaf containing it (falling back to the nearest corner where a corner
+        is not finite, e.g. at a pole).
+
+        Args:
+            points: Number of samples per dimension
+
+        Returns:
+            A tuple of (tau_axis, values) where values has shape (points, points)
+            and is indexed [y, x] like a meshgrid
+        """
+        tau_axis = np.linspace(self.tau_min, self.tau_max, points)
+        u = (tau_axis - self.tau_min) / self.step
+        # Samples on the far edge belong to the last cell
+        cell_u = np.minimum(u, self.lattice - 1e-9)
+        ux, uy = np.meshgrid(cell_u, cell_u)
+
+        leaf = np.full(ux.shape, -1, dtype=np.int64)
+        for size in np.unique(self.size):
+            at_level = np.nonzero(self.size == size)[0]
+            keys = (self.y0[at_level] // size) * (self.lattice // size + 1) + self.x0[at_level] // size
+            order = np.argsort(keys)
+            keys = keys[order]
+            pixel_keys = ((uy // size).astype(np.int64) * (self.lattice // size + 1)
+                          + (ux // size).astype(np.int64))
+            pos = np.clip(np.searchsorted(keys, pixel_keys), 0, len(keys) - 1)
+            found = keys[pos] == pixel_keys
+            leaf[found] = at_level[order[pos[found]]]
+
+        fx = (ux - self.x0[leaf]) / self.size[leaf]
+        fy = (uy - self.y0[leaf]) / self.size[leaf]
+        c = self.corners[leaf]
+        with np.errstate(invalid='ignore'):
+            values = (c[..., 0] * (1 - fx) * (1 - fy) + c[..., 1] * fx * (1 - fy)
+                      + c[..., 2] * (1 - fx) * fy + c[..., 3] * fx * fy)
+        bad = ~np.isfinite(values)
+        if np.any(bad):
+            nearest = np.rint(fx[bad]).astype(int) + 2 * np.rint(fy[bad]).astype(int)
+            values[bad] = c[bad, nearest]
+        return tau_axis, values
+
+
+def _corner_keys(x0: np.ndarray, y0: np.ndarray, size: np.ndarray, lattice: int) -> np.ndarray:
+    """Lattice keys of the four corners of each cell, shape (cells, 4)."""
+    xs = np.stack([x0, x0 + size, x0, x0 + size], axis=1)
+    ys = np.stack([y0, y0, y0 + size, y0 + size], axis=1)
+    return ys * (lattice + 1) + xs
+
+
+def _variation(corners: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Measure how much the function varies over each cell.
+
+    Args:
+        corners: Complex corner values, shape (cells, 4)
+
+    Returns:
+        A tuple of (phase_variation, log_magnitude_range); both are inf for
+        cells with a zero or non-finite corner
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        phase = np.angle(corners)
+        # Walk the cell boundary: (x0,y0) → (x1,y0) → (x1,y1) → (x0,y1) → back
+        ring = phase[:, [0, 1, 3, 2, 0]]
+        steps = np.abs(np.angle(np.exp(1j * np.diff(ring, axis=1))))
+        phase_variation = steps.max(axis=1)
+        log_magnitude = np.log10(np.abs(corners))
+        log_range = log_magnitude.max(axis=1) - log_magnitude.min(axis=1)
+
+    singular = ~np.all(np.isfinite(corners) & (corners != 0), axis=1)
+    phase_variation[singular] = np.inf
+    log_range[singular] = np.inf
+    return phase_variation, log_range
+
+
+def adaptive_sample(func: Callable[[np.ndarray], np.ndarray],
+                    tau_min: float = -3.0,
+                    tau_max: float = 3.0,
+                    base: int = 16,
+                    max_depth: int = 6,
+                    budget: int = 20000,
+                    phase_threshold: float = np.pi / 8,
+                    log_magnitude_threshold: float = 0.25) -> QuadtreeSamples:
+    """
+    Sample a function over the τ-plane, refining only where it varies.
+
+    Starts from a base×base grid of cells and repeatedly splits cells into
+    four wherever the phase changes by more than phase_threshold along the
+    cell boundary, log10|f| changes by more than log_magnitude_threshold, or
+    a corner is zero or non-finite (the τ origin, poles). The cells with the
+    largest variation are refined first, until max_depth is reached or the
+    evaluation budget is spent. Corner samples are shared between
+    neighbouring cells and each point is evaluated only once.
+
+    Args:
+        func: Vectorized function of complex τ values
+        tau_min: Minimum τ value (both axes)
+        tau_max: Maximum τ value (both axes)
+        base: Number of cells per side at the coarsest level
+        max_depth: Maximum number of times a base cell may be subdivided
+        budget: Maximum number of function evaluations
+        phase_threshold: Phase change (radians) that triggers refinement
+        log_magnitude_threshold: Change of log10|f| that triggers refinement
+
+    Returns:
+        The quadtree of leaf cells and their corner values
+    """
+    lattice = base * 2 ** max_depth
+    step = (tau_max - tau_min) / lattice
+
+    known_keys = np.empty(0, dtype=np.int64)
+    known_values = np.empty(0, dtype=complex)
+
+    def lookup(keys: np.ndarray) -> np.ndarray:
+        nonlocal known_keys, known_values
+        flat = keys.ravel()
+        pos = np.clip(np.searchsorted(known_keys, flat), 0, max(len(known_keys) - 1, 0))
+        have = (known_keys[pos] == flat) if len(known_keys) else np.zeros(flat.shape, dtype=bool)
+        missing = np.unique(flat[~have])
+        if len(missing):
+            tau = (tau_min + (missing % (lattice + 1)) * step
+                   + 1j * (tau_min + (missing // (lattice + 1)) * step))
+            with np.errstate(all='ignore'):
+                values = np.asarray(func(tau), dtype=complex)
+            merged_keys = np.concatenate([known_keys, missing])
+            order = np.argsort(merged_keys, kind='stable')
+            known_keys = merged_keys[order]
+            known_values = np.concatenate([known_values, values])[order]
+            pos = np.searchsorted(known_keys, flat)
+        return known_values[pos].reshape(keys.shape)
+
+    cell_size = 2 ** max_depth
+    iy, ix = np.divmod(np.arange(base * base), base)
+    x0, y0 = ix * cell_size, iy * cell_size
+    size = np.full(x0.shape, cell_size)
+    corners = lookup(_corner_keys(x0, y0, size, lattice))
+
+    while True:
+        phase_variation, log_range = _variation(corners)
+        score = np.maximum(phase_variation / phase_threshold, log_range / log_magnitude_threshold)
+        candidates = np.nonzero((score > 1) & (size > 1))[0]
+        # Each split evaluates at most five new points
+        room = (budget - len(known_keys)) // 5
+        if len(candidates) == 0 or room <= 0:
+            break
+        split = candidates[np.argsort(-score[candidates], kind='stable')[:room]]
+
+        half = size[split] // 2
+        child_x0 = np.concatenate([x0[split], x0[split] + half, x0[split], x0[split] + half])
+        child_y0 = np.concatenate([y0[split], y0[split], y0[split] + half, y0[split] + half])
+        child_size = np.tile(half, 4)
+
+        keep = np.ones(len(x0), dtype=bool)
+        keep[split] = False
+        x0 = np.concatenate([x0[keep], child_x0])
+        y0 = np.concatenate([y0[keep], child_y0])
+        size = np.concatenate([size[keep], child_size])
+        corners = np.concatenate([corners[keep],
+                                  lookup(_corner_keys(child_x0, child_y0, child_size, lattice))])
+
+    return QuadtreeSamples(tau_min, tau_max, lattice, x0, y0, size, corners, len(known_keys))
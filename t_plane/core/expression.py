@@ -0,0 +1,210 @@
+import ast
+import io
+import tokenize
+import numpy as np
+from functools import lru_cache
+from typing import Dict, Union
+
+# Maximum number of distinct compiled expressions kept in memory
+CACHE_SIZE = 256
+
+# Functions and constants that may appear in a user expression
+FUNCTIONS = {
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "log": np.log,
+    "exp": np.exp,
+    "sqrt": np.sqrt,
+    "abs": np.abs,
+}
+CONSTANTS = {
+    "pi": np.pi,
+    "e": np.e,
+}
+VARIABLE = "z"
+
+# Tokens that carry no meaning in an expression and are left out when normalizing
+_LAYOUT_TOKENS = (tokenize.NEWLINE, tokenize.NL, tokenize.INDENT, tokenize.DEDENT,
+                  tokenize.COMMENT, tokenize.ENDMARKER)
+
+_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.UAdd, ast.USub)
+
+
+class CompiledExpression:
+    """
+    A user function string that has been parsed, validated and compiled once.
+
+    Calling the instance evaluates the expression on an array of complex
+    values with NumPy, without any further parsing or validation.
+
+    conjugate_symmetric is True when f(conj z) = conj f(z) is guaranteed,
+    which lets a grid symmetric about the real axis be evaluated by halves.
+    """
+
+    def __init__(self, source: str, tree: ast.Expression):
+        """
+        Initialize from a validated expression tree.
+
+        Args:
+            source: The normalized expression string
+            tree: The validated AST of the expression
+        """
+        self.source = source
+        self.code = compile(tree, "<expression>", "eval")
+        self._namespace = {"__builtins__": {}, **FUNCTIONS, **CONSTANTS}
+        self.conjugate_symmetric = _is_conjugate_symmetric(tree.body)
+
+    def __call__(self, z_values: Union[complex, np.ndarray]) -> Union[complex, np.ndarray]:
+        """
+        Evaluate the expression.
+
+        Args:
+            z_values: Value(s) to substitute for z
+
+        Returns:
+            The expression evaluated at z_values, broadcast to its shape
+        """
+        result = eval(self.code, self._namespace, {VARIABLE: z_values})
+        if np.ndim(result) == 0 and np.ndim(z_values) > 0:
+            # Constant expressions still produce a full grid
+            result = np.full(np.shape(z_values), result, dtype=complex)
+        return result
+
+
+def normalize_expression(function_str: str) -> str:
+    """
+    Normalize a function string into the form used as the cache key.
+
+    Args:
+        function_str: String representation of a function of z
+
+    Returns:
+        The expression with '^' written as '**' and its tokens separated by
+        single spaces, so 'z*z' and 'z * z' normalize alike
+    """
+    source = function_str.replace("^", "**")
+    try:
+        tokens = [token.string for token in tokenize.generate_tokens(io.StringIO(source).readline)
+                  if token.type not in _LAYOUT_TOKENS]
+    except (tokenize.TokenError, SyntaxError):
+        # Not valid Python anyway; parsing reports the error
+        return " ".join(source.split())
+    return " ".join(tokens)
+
+
+def _validate(node: ast.AST) -> None:
+    """
+    Check that an expression tree only uses whitelisted operations.
+
+    Args:
+        node: The parsed expression or one of its sub-nodes
+
+    Raises:
+        ValueError: If any node is not an allowed number, name, call or operator
+    """
+    if isinstance(node, ast.Expression):
+        _validate(node.body)
+    elif isinstance(node, ast.BinOp) and isinstance(node.op, _OPERATORS):
+        _validate(node.left)
+        _validate(node.right)
+    elif isinstance(node, ast.UnaryOp) and isinstance(node.op, _OPERATORS):
+        _validate(node.operand)
+    elif isinstance(node, ast.Call):
+        if not (isinstance(node.func, ast.Name) and node.func.id in FUNCTIONS) or node.keywords:
+            raise ValueError("Invalid function string. Only use z and basic operations.")
+        for arg in node.args:
+            _validate(arg)
+    elif isinstance(node, ast.Name):
+        if node.id != VARIABLE and node.id not in CONSTANTS:
+            raise ValueError("Invalid function string. Only use z and basic operations.")
+    elif not (isinstance(node, ast.Constant) and type(node.value) in (int, float, complex)):
+        raise ValueError("Invalid function string. Only use z and basic operations.")
+
+
+def _depends_on_z(node: ast.AST) -> bool:
+    return any(isinstance(n, ast.Name) and n.id == VARIABLE for n in ast.walk(node))
+
+
+def _is_non_negative_constant(node: ast.AST) -> bool:
+    """Whether a node is a non-negative real literal or a whitelisted constant."""
+    if isinstance(node, ast.Name):
+        return node.id in CONSTANTS
+    return isinstance(node, ast.Constant) and type(node.value) in (int, float) and node.value >= 0
+
+
+def _is_conjugate_symmetric(node: ast.AST) -> bool:
+    """
+    Whether a validated expression satisfies f(conj z) = conj f(z).
+
+    Every whitelisted function, constant and operator commutes with
+    conjugation (their branch cuts lie on the real axis or symmetric about
+    it), so the identity holds unless the expression contains a complex
+    literal or raises a constant that may be negative to a power: (-8)**(1/3)
+    and (-2)**z are complex even though every literal in them is real.
+    The decision is made from the tree alone; constant sub-expressions are
+    never evaluated, since that can take unbounded time (9**9**9).
+
+    Args:
+        node: A node of a validated expression tree
+
+    Returns:
+        True if the identity is guaranteed; False if it may not hold
+    """
+    if isinstance(node, ast.Constant):
+        return not isinstance(node.value, complex)
+    if isinstance(node, ast.Name):
+        return True
+    if isinstance(node, ast.BinOp):
+        if (isinstance(node.op, ast.Pow) and not _depends_on_z(node.left)
+                and not _is_non_negative_constant(node.left)
+                and not (isinstance(node.right, ast.Constant) and type(node.right.value) is int)):
+            return False
+        return _is_conjugate_symmetric(node.left) and _is_conjugate_symmetric(node.right)
+    if isinstance(node, ast.UnaryOp):
+        return _is_conjugate_symmetric(node.operand)
+    if isinstance(node, ast.Call):
+        return all(_is_conjugate_symmetric(arg) for arg in node.args)
+    return False
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compile_normalized(source: str) -> CompiledExpression:
+    try:
+        tree = ast.parse(source, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid function string: {e.msg}") from None
+    _validate(tree)
+    return CompiledExpression(source, tree)
+
+
+def compile_expression(function_str: str) -> CompiledExpression:
+    """
+    Parse, validate and compile a function string, reusing cached results.
+
+    Compiled expressions are kept in a bounded LRU cache keyed by the
+    normalized expression, so repeated requests for the same function skip
+    parsing and validation entirely.
+
+    Args:
+        function_str: String representation of a function of z
+
+    Returns:
+        The compiled expression
+
+    Raises:
+        ValueError: If the string is not a valid expression of z
+    """
+    return _compile_normalized(normalize_expression(function_str))
+
+
+def cache_info() -> Dict[str, int]:
+    """
+    Report usage of the compiled expression cache.
+
+    Returns:
+        A dictionary with hits, misses, current size and maximum size
+    """
+    info = _compile_normalized.cache_info()
+    return {"hits": info.hits, "misses": info.misses,
+            "size": info.currsize, "maxsize": info.maxsize}
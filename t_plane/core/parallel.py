@@ -0,0 +1,311 @@
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, List, Optional, Tuple, Union
+
+import numpy as np
+
+# Grids smaller than this are evaluated inline; pool overhead would dominate
+MIN_PARALLEL_POINTS = 16384
+
+# Row blocks per worker; more blocks balance uneven per-row cost (zeta)
+CHUNKS_PER_WORKER = 4
+
+BACKENDS = ('process', 'thread')
+
+# Seconds between checks of the cancel flag while blocks are running
+CANCEL_POLL_SECONDS = 0.05
+
+# Rows count as mirror images when they agree to this relative tolerance
+MIRROR_TOLERANCE = 1e-9
+
+# Released blocks whose arrays were still referenced; closed once they are not
+_pending_close: List[SharedMemory] = []
+_pending_lock = threading.Lock()
+
+
+def _close_shared(shm: Optional[SharedMemory] = None) -> None:
+    """Close a shared block, deferring it while views of it are alive."""
+    with _pending_lock:
+        if shm is not None:
+            _pending_close.append(shm)
+        for pending in list(_pending_close):
+            try:
+                pending.close()
+            except BufferError:
+                continue
+            _pending_close.remove(pending)
+
+
+def mirrored_rows(tau_values: np.ndarray) -> int:
+    """
+    Number of leading rows of a grid that are conjugates of its trailing rows.
+
+    Args:
+        tau_values: Complex grid
+
+    Returns:
+        rows // 2 if each of the first rows // 2 rows is the complex
+        conjugate of its mirror row (rows - 1 - i), as for a grid symmetric
+        about the real axis; otherwise 0
+    """
+    if tau_values.ndim != 2 or tau_values.shape[0] < 2:
+        return 0
+    half = tau_values.shape[0] // 2
+    lower, upper = tau_values[:half], tau_values[::-1][:half]
+    if not np.allclose(lower, np.conj(upper), rtol=MIRROR_TOLERANCE, atol=0, equal_nan=True):
+        return 0
+    return half
+
+
+class EvaluationCancelled(Exception):
+    """Raised by GridEvaluator.evaluate when its cancel flag is set."""
+
+
+class SharedGrid:
+    """
+    A NumPy array in shared memory that worker processes can write into.
+
+    Use as a context manager. On exit the block is unlinked, so no other
+    process can attach to it any more; this process's mapping stays valid
+    for as long as arrays derived from it (e.g. np.real views) are alive.
+    """
+
+    def __init__(self, shape: Tuple[int, ...], dtype=np.complex128):
+        """
+        Allocate an uninitialized shared array.
+
+        Args:
+            shape: Shape of the array
+            dtype: NumPy data type of the array
+        """
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        nbytes = max(int(np.prod(self.shape)) * self.dtype.itemsize, 1)
+        self._shm = SharedMemory(create=True, size=nbytes)
+        # frombuffer keeps the buffer exported while any view of the array lives
+        count = int(np.prod(self.shape))
+        self.array = np.frombuffer(self._shm.buf, dtype=self.dtype, count=count).reshape(self.shape)
+
+    @property
+    def name(self) -> str:
+        """Name under which other processes attach to the block."""
+        return self._shm.name
+
+    def release(self) -> None:
+        """Free the shared block."""
+        if self._shm is None:
+            return
+        self.array = None
+        self._shm.unlink()
+        _close_shared(self._shm)
+        self._shm = None
+
+    def __enter__(self) -> "SharedGrid":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+
+def _evaluate_rows(func: Callable[[np.ndarray], np.ndarray],
+                   input_name: str,
+                   output_name: str,
+                   shape: Tuple[int, ...],
+                   start: int,
+                   stop: int) -> None:
+    """Worker task: evaluate rows start:stop of a shared grid into a shared output."""
+    tau_shm = SharedMemory(name=input_name)
+    out_shm = SharedMemory(name=output_name)
+    try:
+        tau_values = np.ndarray(shape, dtype=np.complex128, buffer=tau_shm.buf)
+        values = np.ndarray(shape, dtype=np.complex128, buffer=out_shm.buf)
+        values[start:stop] = func(tau_values[start:stop])
+        del tau_values, values
+    finally:
+        tau_shm.close()
+        out_shm.close()
+
+
+class GridEvaluator:
+    """
+    Evaluates vectorized functions over τ grids on a pool of workers.
+
+    The grid is split into blocks of rows that are evaluated concurrently.
+    With the 'process' backend the input is placed in shared memory once and
+    each worker writes its rows straight into a shared output array; the
+    function must then be picklable (a module-level function or a
+    functools.partial of one). The 'thread' backend shares memory directly
+    and relies on NumPy releasing the GIL inside array operations.
+    """
+
+    def __init__(self,
+                 workers: Optional[int] = None,
+                 backend: str = 'process',
+                 min_points: int = MIN_PARALLEL_POINTS):
+        """
+        Initialize the evaluator. Workers are started on first use.
+
+        Args:
+            workers: Number of workers (defaults to the number of CPUs);
+                1 evaluates everything inline
+            backend: 'process' or 'thread'
+            min_points: Grids with fewer points are evaluated inline
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.backend = backend
+        self.min_points = min_points
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.backend == 'process':
+                    # 'spawn' keeps workers independent of the web server's threads
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context('spawn'))
+                else:
+                    self._executor = ThreadPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the workers."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def row_blocks(self, rows: int) -> List[Tuple[int, int]]:
+        """
+        Split a grid's rows into the blocks handed to workers.
+
+        Args:
+            rows: Number of rows of the grid
+
+        Returns:
+            List of (start, stop) row ranges covering all rows
+        """
+        block = max(1, math.ceil(rows / (self.workers * CHUNKS_PER_WORKER)))
+        return [(start, min(start + block, rows)) for start in range(0, rows, block)]
+
+    def evaluate(self,
+                 func: Callable[[np.ndarray], np.ndarray],
+                 tau_values: np.ndarray,
+                 out: Optional[Union[SharedGrid, np.ndarray]] = None,
+                 cancel: Optional[threading.Event] = None,
+                 conjugate_symmetric: bool = False) -> np.ndarray:
+        """
+        Evaluate a function over a grid, splitting the rows across workers.
+
+        Args:
+            func: Vectorized function of complex τ values
+            tau_values: Complex τ grid (at least 1-D; split along axis 0)
+            out: Array to write the results into. With the process backend,
+                pass a SharedGrid to receive results without a copy; any
+                other array is filled by copying from a temporary shared grid.
+            cancel: Flag checked between row blocks. Once it is set, blocks
+                not yet started are dropped, running ones are waited for,
+                and EvaluationCancelled is raised.
+            conjugate_symmetric: Declares that func(conj τ) = conj func(τ).
+                If the grid's rows mirror each other about the real axis
+                (see mirrored_rows), only the upper half is evaluated and
+                the lower half is filled with its conjugate.
+
+        Returns:
+            The complex function values with the shape of tau_values
+
+        Raises:
+            EvaluationCancelled: If cancel was set before the last block finished
+        """
+        tau_values = np.asarray(tau_values, dtype=np.complex128)
+        target = out.array if isinstance(out, SharedGrid) else out
+        if target is None:
+            target = np.empty(tau_values.shape, dtype=np.complex128)
+
+        # With a declared symmetry only rows first..end are evaluated, in
+        # place; the rows below are mirrored from them at the end
+        half = mirrored_rows(tau_values) if conjugate_symmetric else 0
+        self._evaluate_rows_from(func, tau_values, out, target, half, cancel)
+        if half:
+            target[:half] = np.conj(target[::-1][:half])
+        return target
+
+    def _evaluate_rows_from(self,
+                            func: Callable[[np.ndarray], np.ndarray],
+                            tau_values: np.ndarray,
+                            out: Optional[Union[SharedGrid, np.ndarray]],
+                            target: np.ndarray,
+                            first: int,
+                            cancel: Optional[threading.Event]) -> None:
+        """Evaluate rows first: of tau_values into target (out.array when out is a SharedGrid)."""
+        if tau_values.size < self.min_points or tau_values.ndim == 0:
+            self._check(cancel)
+            evaluated = slice(first, None) if tau_values.ndim else ...
+            target[evaluated] = func(tau_values[evaluated])
+            return
+
+        rows = tau_values.shape[0]
+        blocks = [(start + first, stop + first) for start, stop in self.row_blocks(rows - first)]
+        if self.workers == 1:
+            # Inline, but still in blocks so that cancellation takes effect
+            for start, stop in blocks if cancel is not None else [(first, rows)]:
+                self._check(cancel)
+                target[start:stop] = func(tau_values[start:stop])
+            return
+
+        self._check(cancel)
+        executor = self._pool()
+        if self.backend == 'thread':
+            futures = [executor.submit(self._evaluate_block, func, tau_values, target, start, stop)
+                       for start, stop in blocks]
+            self._wait(futures, cancel)
+            return
+
+        with SharedGrid(tau_values.shape) as shared_tau:
+            shared_tau.array[first:] = tau_values[first:]
+            output = out if isinstance(out, SharedGrid) else SharedGrid(tau_values.shape)
+            try:
+                futures = [executor.submit(_evaluate_rows, func, shared_tau.name, output.name,
+                                           tau_values.shape, start, stop)
+                           for start, stop in blocks]
+                self._wait(futures, cancel)
+                if output is not out:
+                    target[first:] = output.array[first:]
+            finally:
+                if output is not out:
+                    output.release()
+
+    @staticmethod
+    def _check(cancel: Optional[threading.Event]) -> None:
+        if cancel is not None and cancel.is_set():
+            raise EvaluationCancelled("Evaluation was cancelled")
+
+    @classmethod
+    def _wait(cls, futures, cancel: Optional[threading.Event] = None) -> None:
+        # Let every block finish (or be cancelled) before releasing buffers or raising
+        pending = set(futures)
+        while pending:
+            timeout = CANCEL_POLL_SECONDS if cancel is not None else None
+            _, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if cancel is not None and cancel.is_set():
+                for future in pending:
+                    future.cancel()
+                wait(pending)
+                cls._check(cancel)
+        for future in futures:
+            future.result()
+
+    @staticmethod
+    def _evaluate_block(func: Callable[[np.ndarray], np.ndarray],
+                        tau_values: np.ndarray,
+                        target: np.ndarray,
+                        start: int,
+                        stop: int) -> None:
+        target[start:stop] = func(tau_values[start:stop])
@@ -1,5 +1,67 @@
 import numpy as np
-from typing import Tuple, Union, Optional
+from typing import Iterator, Tuple, Union, Optional
+
+# Array elements per block in to_tau/from_tau; keeps the scratch memory for
+# the zero check small and cache-resident however large the array
+TRANSFORM_CHUNK = 1 << 16
+
+ZERO_POLICIES = ('raise', 'nan', 'inf')
+
+# Rows per block yielded by TauPlane.iter_tau_blocks by default
+GRID_BLOCK_ROWS = 256
+
+
+def _reciprocal(values, out, dtype, on_zero, chunk_size, message):
+    """
+    Compute 1 / values, handling exact zeros according to on_zero.
+    
+    Arrays are processed in blocks of chunk_size elements (when values and
+    out are contiguous), each checked for zeros before it is divided, so the
+    only temporary is one block-sized boolean mask.
+    """
+    if on_zero not in ZERO_POLICIES:
+        raise ValueError(f"on_zero must be one of {ZERO_POLICIES}, got {on_zero!r}")
+    fill = np.nan if on_zero == 'nan' else np.inf
+    
+    if not isinstance(values, np.ndarray):
+        if out is not None:
+            raise ValueError("out is only supported for array input")
+        if values == 0:
+            if on_zero == 'raise':
+                raise ValueError(message)
+            result = complex(fill) if isinstance(values, complex) else fill
+        else:
+            result = 1.0 / values
+        return np.dtype(dtype).type(result) if dtype is not None else result
+    
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    if out is None:
+        out = np.empty(values.shape, dtype=dtype if dtype is not None else np.result_type(values, 1.0))
+    elif out.shape != values.shape:
+        raise ValueError(f"out has shape {out.shape}, expected {values.shape}")
+    elif dtype is not None and np.dtype(dtype) != out.dtype:
+        raise ValueError(f"out has dtype {out.dtype}, expected {np.dtype(dtype)}")
+    
+    if values.flags.c_contiguous and out.flags.c_contiguous:
+        flat_values, flat_out = values.reshape(-1), out.reshape(-1)
+        blocks = ((flat_values[i:i + chunk_size], flat_out[i:i + chunk_size])
+                  for i in range(0, flat_values.size, chunk_size))
+    else:
+        blocks = [(values, out)]
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for block, target in blocks:
+            # Checked before dividing, since target may be block itself
+            zero = block == 0
+            has_zero = zero.any()
+            if has_zero and on_zero == 'raise':
+                raise ValueError(message)
+            np.divide(1.0, block, out=target)
+            if has_zero:
+                target[zero] = fill
+    return out
+
 
 class TauPlane:
     """
@@ -19,58 +81,67 @@ class TauPlane:
         """
         self.delta = delta
     
-    def to_tau(self, z: Union[complex, np.ndarray]) -> Union[complex, np.ndarray]:
+    def to_tau(self,
+               z: Union[complex, np.ndarray],
+               out: Optional[np.ndarray] = None,
+               dtype=None,
+               on_zero: str = 'raise',
+               chunk_size: int = TRANSFORM_CHUNK) -> Union[complex, np.ndarray]:
         """
         Transform a point or array from the standard complex plane to the τ-plane.
         
         Args:
             z: Point(s) in the standard complex plane (z ≠ 0)
+            out: Array to write the result to (arrays only); may be z itself
+                for an in-place transform
+            dtype: Dtype of the result, e.g. np.complex64 (default: that of 1.0 / z)
+            on_zero: 'raise' a ValueError at z = 0, or map it to 'nan' or 'inf'
+            chunk_size: Array elements transformed per block
             
         Returns:
             The transformed point(s) in the τ-plane
         """
-        # Ensure z ≠ 0 to avoid division by zero
-        if isinstance(z, np.ndarray):
-            if np.any(z == 0):
-                raise ValueError("Zero is explicitly excluded from the τ-plane")
-            return 1.0 / z
-        elif z == 0:
-            raise ValueError("Zero is explicitly excluded from the τ-plane")
-        return 1.0 / z
+        return _reciprocal(z, out, dtype, on_zero, chunk_size,
+                           "Zero is explicitly excluded from the τ-plane")
     
-    def from_tau(self, tau: Union[complex, np.ndarray]) -> Union[complex, np.ndarray]:
+    def from_tau(self,
+                 tau: Union[complex, np.ndarray],
+                 out: Optional[np.ndarray] = None,
+                 dtype=None,
+                 on_zero: str = 'raise',
+                 chunk_size: int = TRANSFORM_CHUNK) -> Union[complex, np.ndarray]:
         """
         Transform a point or array from the τ-plane back to the standard complex plane.
         
         Args:
             tau: Point(s) in the τ-plane (τ ≠ 0)
+            out: Array to write the result to (arrays only); may be tau itself
+                for an in-place transform
+            dtype: Dtype of the result, e.g. np.complex64 (default: that of 1.0 / tau)
+            on_zero: 'raise' a ValueError at τ = 0 (infinity), or map it to 'nan' or 'inf'
+            chunk_size: Array elements transformed per block
             
         Returns:
             The transformed point(s) in the standard complex plane
         """
-        # Ensure τ ≠ 0 to avoid division by zero (τ = 0 corresponds to ±∞)
-        if isinstance(tau, np.ndarray):
-            if np.any(tau == 0):
-                raise ValueError("τ = 0 corresponds to infinity and cannot be mapped back")
-            return 1.0 / tau
-        elif tau == 0:
-            raise ValueError("τ = 0 corresponds to infinity and cannot be mapped back")
-        return 1.0 / tau
+        return _reciprocal(tau, out, dtype, on_zero, chunk_size,
+                           "τ = 0 corresponds to infinity and cannot be mapped back")
     
-    def create_tau_grid(self, 
-                        tau_min: float = -10.0, 
-                        tau_max: float = 10.0, 
-                        points: int = 1000) -> Tuple[np.ndarray, np.ndarray]:
+    def tau_axis(self,
+                 tau_min: float = -10.0,
+                 tau_max: float = 10.0,
+                 points: int = 1000) -> np.ndarray:
         """
-        Create a grid in the τ-plane excluding the origin.
+        Create the 1-D axis shared by the x and y directions of the τ grid.
         
         Args:
             tau_min: Minimum τ value
             tau_max: Maximum τ value
-            points: Number of points per dimension
+            points: Approximate number of points
             
         Returns:
-            A tuple of (tau_x, tau_y) meshgrids for the τ-plane
+            Ascending axis values, excluding (-delta, delta) when the range
+            crosses zero
         """
         # Exclude τ = 0 by creating two ranges and concatenating
         if tau_min < 0 < tau_max:
@@ -83,15 +154,74 @@ class TauPlane:
             right_range = np.linspace(self.delta, tau_max, max(right_count, 2))
             
             # Combine the ranges
-            tau_range = np.concatenate((left_range, right_range))
-        else:
-            # If range doesn't cross zero, use standard linspace
-            tau_range = np.linspace(tau_min, tau_max, points)
+            return np.concatenate((left_range, right_range))
+        # If range doesn't cross zero, use standard linspace
+        return np.linspace(tau_min, tau_max, points)
+    
+    def create_tau_grid(self, 
+                        tau_min: float = -10.0, 
+                        tau_max: float = 10.0, 
+                        points: int = 1000,
+                        sparse: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Create a grid in the τ-plane excluding the origin.
         
-        # Create meshgrid
-        tau_x, tau_y = np.meshgrid(tau_range, tau_range)
+        Args:
+            tau_min: Minimum τ value
+            tau_max: Maximum τ value
+            points: Number of points per dimension
+            sparse: Return broadcastable axes of shape (1, n) and (n, 1)
+                instead of dense meshgrids; tau_x + 1j * tau_y then
+                allocates only the complex grid
+            
+        Returns:
+            A tuple of (tau_x, tau_y) meshgrids for the τ-plane
+        """
+        tau_range = self.tau_axis(tau_min, tau_max, points)
+        tau_x, tau_y = np.meshgrid(tau_range, tau_range, sparse=sparse)
         return tau_x, tau_y
     
+    def iter_tau_blocks(self,
+                        tau_min: float = -10.0,
+                        tau_max: float = 10.0,
+                        points: int = 1000,
+                        block_shape: Tuple[int, Optional[int]] = (GRID_BLOCK_ROWS, None),
+                        dtype=complex) -> Iterator[Tuple[slice, slice, np.ndarray]]:
+        """
+        Iterate over the grid of create_tau_grid in blocks of complex τ values.
+        
+        Only one block is allocated at a time, so grids far larger than
+        memory can be streamed through a fixed budget.
+        
+        Args:
+            tau_min: Minimum τ value
+            tau_max: Maximum τ value
+            points: Number of points per dimension
+            block_shape: (rows, columns) per block; None columns gives
+                blocks of full rows
+            dtype: Complex dtype of the blocks, e.g. np.complex64
+            
+        Yields:
+            Tuples (rows, cols, tau) where rows and cols are slices of the
+            full grid and tau holds its values there, indexed [y, x]
+        """
+        axis = self.tau_axis(tau_min, tau_max, points)
+        size = len(axis)
+        block_rows, block_cols = block_shape
+        block_cols = block_cols or size
+        if block_rows < 1 or block_cols < 1:
+            raise ValueError("block_shape must be positive")
+        
+        for row in range(0, size, block_rows):
+            rows = slice(row, min(row + block_rows, size))
+            for col in range(0, size, block_cols):
+                cols = slice(col, min(col + block_cols, size))
+                tau = np.empty((rows.stop - rows.start, cols.stop - cols.start), dtype=dtype)
+                # Broadcast the axes straight into the block, without x/y meshes
+                tau.real = axis[None, cols]
+                tau.imag = axis[rows, None]
+                yield rows, cols, tau
+    
     def unit_circle(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Create a unit circle in the τ-plane centered at the origin with radius delta.
@@ -0,0 +1,192 @@
+import math
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+# Weight of the latest request in the moving average of service times
+SERVICE_TIME_WEIGHT = 0.2
+
+# Retry-After hint bounds in seconds
+MIN_RETRY_AFTER = 1
+MAX_RETRY_AFTER = 60
+
+
+class Overloaded(Exception):
+    """Raised when a request cannot be admitted: its queue is full or it waited too long."""
+
+    def __init__(self, work_class: str, retry_after: int, reason: str):
+        super().__init__(f"Server busy ({reason} for {work_class} requests); retry in {retry_after} s")
+        self.work_class = work_class
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+class _WorkClass:
+    """Slots, waiting queue and counters of one class of work."""
+
+    def __init__(self, limit: int, queue_size: int):
+        self.limit = limit
+        self.queue_size = queue_size
+        self.running = 0
+        self.queue: Deque[object] = deque()
+        self.admitted = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+        # Moving average of how long a request holds its slot
+        self.service_time: Optional[float] = None
+
+
+class Admission:
+    """
+    A slot held by an admitted request; release it when the work is done.
+
+    Use as a context manager, or call release() explicitly (for example when
+    a streamed response closes). Releasing twice is harmless.
+    """
+
+    def __init__(self, controller: "AdmissionController", work_class: str, wait: float):
+        self.controller = controller
+        self.work_class = work_class
+        self.wait = wait
+        self._start = time.perf_counter()
+        self._released = False
+
+    def release(self) -> None:
+        """Free the slot for the next waiting request."""
+        if not self._released:
+            self._released = True
+            self.controller._release(self.work_class, time.perf_counter() - self._start)
+
+    def __enter__(self) -> "Admission":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+
+class AdmissionController:
+    """
+    Bounded concurrency per class of work, with bounded waiting queues.
+
+    Each class (for example cheap plots, zeta plots and symbolic analysis)
+    runs at most `limit` requests at once, so one kind of slow request cannot
+    occupy every server thread. Up to `queue_size` further requests wait in
+    arrival order; beyond that, or after waiting `max_wait` seconds, requests
+    are rejected with Overloaded, which carries a Retry-After estimate from
+    the queue length and the recent service time.
+    """
+
+    def __init__(self, limits: Dict[str, int], queue_size: int = 32, max_wait: float = 30.0):
+        """
+        Initialize the controller.
+
+        Args:
+            limits: Concurrent requests allowed per work class
+            queue_size: Requests allowed to wait per work class
+            max_wait: Seconds a request may wait before it is rejected
+        """
+        if any(limit < 1 for limit in limits.values()):
+            raise ValueError("Concurrency limits must be positive")
+        if queue_size < 0:
+            raise ValueError("queue_size must not be negative")
+        self.max_wait = max_wait
+        self._classes = {name: _WorkClass(limit, queue_size) for name, limit in limits.items()}
+        self._condition = threading.Condition()
+
+    def _retry_after(self, state: _WorkClass) -> int:
+        service_time = state.service_time or 1.0
+        seconds = service_time * (len(state.queue) + state.running) / state.limit
+        return int(min(MAX_RETRY_AFTER, max(MIN_RETRY_AFTER, math.ceil(seconds))))
+
+    def acquire(self, work_class: str) -> Admission:
+        """
+        Wait for a slot of the given class.
+
+        Args:
+            work_class: One of the classes given to the constructor
+
+        Returns:
+            An Admission holding the slot; its wait attribute is the time
+            spent queued in seconds
+
+        Raises:
+            Overloaded: If the queue is full or the wait exceeds max_wait
+        """
+        if work_class not in self._classes:
+            raise ValueError(f"Unknown work class '{work_class}'")
+        state = self._classes[work_class]
+        start = time.perf_counter()
+        with self._condition:
+            if state.running >= state.limit or state.queue:
+                if len(state.queue) >= state.queue_size:
+                    state.rejected += 1
+                    raise Overloaded(work_class, self._retry_after(state), "queue full")
+                waiter = object()
+                state.queue.append(waiter)
+                deadline = start + self.max_wait
+                try:
+                    # First in, first out: only the head of the queue takes a free slot
+                    while state.running >= state.limit or state.queue[0] is not waiter:
+                        remaining = deadline - time.perf_counter()
+                        if remaining <= 0:
+                            state.rejected += 1
+                            raise Overloaded(work_class, self._retry_after(state), "timed out waiting")
+                        self._condition.wait(remaining)
+                finally:
+                    state.queue.remove(waiter)
+                    self._condition.notify_all()
+            state.running += 1
+            state.admitted += 1
+            wait = time.perf_counter() - start
+            state.wait_seconds += wait
+        return Admission(self, work_class, wait)
+
+    def _release(self, work_class: str, seconds: float) -> None:
+        state = self._classes[work_class]
+        with self._condition:
+            state.running -= 1
+            if state.service_time is None:
+                state.service_time = seconds
+            else:
+                state.service_time += SERVICE_TIME_WEIGHT * (seconds - state.service_time)
+            self._condition.notify_all()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Report the state of each work class.
+
+        Returns:
+            Per class: limit, queue_size, running, waiting, admitted,
+            rejected and the total seconds admitted requests spent waiting
+        """
+        with self._condition:
+            return {name: {'limit': state.limit, 'queue_size': state.queue_size,
+                           'running': state.running, 'waiting': len(state.queue),
+                           'admitted': state.admitted, 'rejected': state.rejected,
+                           'wait_seconds': state.wait_seconds}
+                    for name, state in self._classes.items()}
+
+    def render(self) -> str:
+        """
+        Render the counters and gauges in the Prometheus text format.
+
+        Returns:
+            The exposition text, ending with a newline
+        """
+        metrics = [
+            ('running', 'gauge', "Requests currently holding a slot."),
+            ('waiting', 'gauge', "Requests currently queued for a slot."),
+            ('admitted', 'counter', "Requests admitted since start."),
+            ('rejected', 'counter', "Requests rejected with 503 since start."),
+            ('wait_seconds', 'counter', "Total time admitted requests spent queued."),
+        ]
+        stats = self.stats()
+        lines = []
+        for field, kind, help_text in metrics:
+            name = f"tau_plane_admission_{field}" + ('_total' if kind == 'counter' else '')
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for work_class, values in sorted(stats.items()):
+                lines.append(f'{name}{{work_class="{work_class}"}} {values[field]!r}')
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,234 @@
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..core.expression import normalize_expression
+
+# Sub-analyses that only inspect the function string; cheap enough to run inline
+INLINE_ANALYSES = ('domain_properties', 'differential_equations')
+
+# Statuses of sub-analyses that may succeed on another attempt; not cached
+TRANSIENT_STATUSES = ('timeout', 'interrupted')
+
+
+def _worker_main(connection) -> None:
+    """Worker process loop: run (func, args) tasks until sent None."""
+    while True:
+        task = connection.recv()
+        if task is None:
+            return
+        func, args = task
+        try:
+            connection.send((True, func(*args)))
+        except Exception as e:
+            connection.send((False, repr(e)))
+
+
+class _Worker:
+    """A worker process that runs one task at a time over a pipe."""
+
+    def __init__(self, context):
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+
+    def run(self, func: Callable, args: tuple, timeout: float) -> Tuple[bool, Any]:
+        """
+        Run func(*args) in the worker.
+
+        Returns:
+            A tuple of (ok, value): the result, or the repr of the exception
+
+        Raises:
+            TimeoutError: If the task did not finish within timeout seconds;
+                the worker is then still busy and must be terminated
+            EOFError: If the worker process died
+        """
+        self.connection.send((func, args))
+        if not self.connection.poll(max(timeout, 0)):
+            raise TimeoutError
+        return self.connection.recv()
+
+    def terminate(self) -> None:
+        """Stop the worker process, even in the middle of a task."""
+        self.process.terminate()
+        self.process.join()
+        self.connection.close()
+
+
+class AnalysisService:
+    """
+    Runs symbolic function analysis in worker processes with a hard time limit.
+
+    Each SymPy-heavy sub-analysis (critical points, series, special values)
+    and the parsing check are separate tasks, each run by a worker process
+    of its own. Whatever finishes within the timeout is returned. A task
+    still running at the deadline is reported as timed out, and only its
+    worker is terminated and later replaced, so concurrent requests are
+    unaffected. Complete results are cached by the normalized expression.
+    """
+
+    def __init__(self, max_workers: int = 2, timeout: float = 10.0, cache_size: int = 512):
+        """
+        Initialize the service. Worker processes are started on first use.
+
+        Args:
+            max_workers: Number of worker processes
+            timeout: Seconds allowed for all sub-analyses of one request,
+                including the wait for a free worker
+            cache_size: Number of analysed expressions kept in the cache
+        """
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # 'spawn' keeps workers independent of the web server's threads
+        self._context = multiprocessing.get_context('spawn')
+        self._idle: List[_Worker] = []
+        self._started = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def _acquire_worker(self, deadline: float) -> Optional[_Worker]:
+        """An idle or newly started worker, or None if none is free before the deadline."""
+        with self._condition:
+            while not self._idle and self._started >= self.max_workers:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+            if self._idle:
+                return self._idle.pop()
+            self._started += 1
+        try:
+            return _Worker(self._context)
+        except BaseException:
+            self._discard_worker(None)
+            raise
+
+    def _return_worker(self, worker: _Worker) -> None:
+        with self._condition:
+            if not self._closed:
+                self._idle.append(worker)
+                self._condition.notify()
+                return
+        self._discard_worker(worker)
+
+    def _discard_worker(self, worker: Optional[_Worker]) -> None:
+        """Terminate a worker (if any) and free its place for a new one."""
+        if worker is not None:
+            worker.terminate()
+        with self._condition:
+            self._started -= 1
+            self._condition.notify()
+
+    def _run_task(self, func: Callable, function_str: str, deadline: float) -> Tuple[str, Any]:
+        """
+        Run one task on a worker, terminating the worker if it overruns the deadline.
+
+        Returns:
+            A tuple of (status, value) with status 'ok', 'error', 'timeout'
+            or 'interrupted' (the worker died)
+        """
+        worker = self._acquire_worker(deadline)
+        if worker is None:
+            return 'timeout', None
+        try:
+            ok, value = worker.run(func, (function_str,), deadline - time.perf_counter())
+        except TimeoutError:
+            self._discard_worker(worker)
+            return 'timeout', None
+        except (EOFError, OSError):
+            self._discard_worker(worker)
+            return 'interrupted', None
+        self._return_worker(worker)
+        return ('ok', value) if ok else ('error', value)
+
+    def shutdown(self) -> None:
+        """Stop the idle worker processes; busy ones stop when their task ends."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            self._discard_worker(worker)
+
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._condition:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+            return entry
+
+    def _cache_put(self, key: str, entry: Dict[str, Any]) -> None:
+        with self._condition:
+            self._cache[key] = entry
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def analyze(self, function_str: str) -> Dict[str, Any]:
+        """
+        Analyze a function, returning partial results if the time limit is hit.
+
+        Args:
+            function_str: String representation of the function to analyze
+
+        Returns:
+            The analysis in the format of symbolic.analyze_function, plus
+            'status' (per sub-analysis: 'ok', 'error', 'timeout' or
+            'interrupted'), 'elapsed' seconds and 'cached'
+        """
+        # SymPy takes longer to import than the rest of the app together
+        from ..analysis import symbolic
+        if function_str == 'zeta':
+            return dict(symbolic.analyze_zeta_function(), cached=True)
+
+        # Parsing itself can take unbounded time ('9^9^9^9'), so it only
+        # happens in the workers, under the deadline
+        key = normalize_expression(function_str)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return dict(cached, cached=True)
+
+        start = time.perf_counter()
+        deadline = start + self.timeout
+        parts: Dict[str, Any] = {}
+        status: Dict[str, str] = {}
+        for name in INLINE_ANALYSES:
+            try:
+                parts[name] = symbolic.SUB_ANALYSIS_FUNCTIONS[name](function_str)
+                status[name] = 'ok'
+            except Exception:
+                status[name] = 'error'
+
+        tasks = {name: symbolic.SUB_ANALYSIS_FUNCTIONS[name]
+                 for name in symbolic.SUB_ANALYSES if name not in INLINE_ANALYSES}
+        tasks['parse'] = symbolic.parse_error
+        # Every task returns by the deadline: overrunning workers are terminated
+        with ThreadPoolExecutor(max_workers=len(tasks)) as runner:
+            futures = {name: runner.submit(self._run_task, func, function_str, deadline)
+                       for name, func in tasks.items()}
+        outcomes = {name: future.result() for name, future in futures.items()}
+
+        parse_status, parse_message = outcomes.pop('parse')
+        if parse_status == 'ok' and parse_message is not None:
+            # Unparseable input: the same response as the synchronous path
+            entry = symbolic.failed_analysis(parse_message)
+            self._cache_put(key, entry)
+            return dict(entry, cached=False)
+
+        for name, (task_status, value) in outcomes.items():
+            status[name] = task_status
+            if task_status == 'ok':
+                parts[name] = value
+
+        entry = symbolic.assemble_analysis(parts)
+        entry['status'] = status
+        entry['elapsed'] = time.perf_counter() - start
+        if not set(status.values()) & set(TRANSIENT_STATUSES):
+            # A timed-out expression may finish on a less loaded server
+            self._cache_put(key, entry)
+        return dict(entry, cached=False)
@@ -0,0 +1,73 @@
+import threading
+from typing import Dict
+
+
+class ClientRequests:
+    """
+    The latest in-flight request of each client, identified by a client id.
+
+    Starting a request hands out a fresh cancel flag and sets the flag of the
+    client's previous request, if that is still running. Evaluations check
+    the flag between blocks (see GridEvaluator.evaluate), so work for a view
+    the client has already moved away from stops early.
+    """
+
+    def __init__(self):
+        self._active: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self.cancelled = 0
+
+    def start(self, client_id: str) -> threading.Event:
+        """
+        Register a new request of a client, cancelling its previous one.
+
+        Args:
+            client_id: Identifies the client (for example one browser tab)
+
+        Returns:
+            The cancel flag of the new request
+        """
+        cancel = threading.Event()
+        with self._lock:
+            previous = self._active.get(client_id)
+            self._active[client_id] = cancel
+            if previous is not None and not previous.is_set():
+                previous.set()
+                self.cancelled += 1
+        return cancel
+
+    def finish(self, client_id: str, cancel: threading.Event) -> None:
+        """
+        Unregister a finished request.
+
+        Args:
+            client_id: The id passed to start()
+            cancel: The flag returned by start()
+        """
+        with self._lock:
+            if self._active.get(client_id) is cancel:
+                del self._active[client_id]
+
+    def stats(self) -> dict:
+        """
+        Report the number of clients with a request in flight and of cancelled requests.
+
+        Returns:
+            A dictionary with 'active' and 'cancelled'
+        """
+        with self._lock:
+            return {'active': len(self._active), 'cancelled': self.cancelled}
+
+    def render(self) -> str:
+        """
+        Render the counters in the Prometheus text format.
+
+        Returns:
+            The exposition text, ending with a newline
+        """
+        stats = self.stats()
+        return "\n".join([
+            "# HELP tau_plane_superseded_requests_total Requests cancelled by a newer request of the same client.",
+            "# TYPE tau_plane_superseded_requests_total counter",
+            f"tau_plane_superseded_requests_total {stats['cancelled']}",
+        ]) + "\n"
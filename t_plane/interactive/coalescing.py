@@ -0,0 +1,139 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from ..core.parallel import CANCEL_POLL_SECONDS, EvaluationCancelled
+
+
+class FlightCancel:
+    """
+    Cancel flag of a flight, set only once every caller waiting on it is cancelled.
+
+    Each caller contributes its own flag, or None if it cannot be cancelled.
+    Like threading.Event it offers is_set(), so it can be passed to
+    GridEvaluator.evaluate as the leader's cancel flag.
+    """
+
+    def __init__(self):
+        self._flags: List[Optional[threading.Event]] = []
+
+    def add(self, flag: Optional[threading.Event]) -> None:
+        """Register the cancel flag of another caller waiting on the flight."""
+        self._flags.append(flag)
+
+    def is_set(self) -> bool:
+        """True once every registered caller has been cancelled."""
+        return all(flag is not None and flag.is_set() for flag in list(self._flags))
+
+
+class _Call:
+    """An in-flight computation that followers wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.cancel = FlightCancel()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into one computation.
+
+    The first caller for a key (the leader) runs the function; callers that
+    arrive while it is running (followers) wait and receive the same result,
+    or the same exception. Nothing is cached: once the leader finishes, the
+    next call for the key computes afresh.
+
+    Every caller may bring its own cancel flag. A cancelled follower stops
+    waiting, while the computation itself is only cancelled once all of its
+    callers are: the leader's function receives a FlightCancel to check.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[[FlightCancel], Any],
+           cancel: Optional[threading.Event] = None) -> Tuple[Any, bool]:
+        """
+        Run func, or wait for the identical call already running.
+
+        Args:
+            key: Identifies calls whose results are interchangeable
+            func: Computes the result from the flight's cancel flag; called
+                at most once per flight
+            cancel: This caller's cancel flag, or None if it cannot be cancelled
+
+        Returns:
+            A tuple of (result, shared) where shared is True for followers.
+            Followers receive the leader's result object itself, so it
+            should be immutable or copied before modification.
+
+        Raises:
+            EvaluationCancelled: If this caller is a follower and its cancel
+                flag is set before the leader finishes
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+                leader = True
+            else:
+                call.followers += 1
+                self.coalesced += 1
+                leader = False
+            call.cancel.add(cancel)
+
+        if not leader:
+            while not call.done.wait(None if cancel is None else CANCEL_POLL_SECONDS):
+                if cancel.is_set():
+                    raise EvaluationCancelled()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func(call.cancel)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def stats(self) -> dict:
+        """
+        Report coalescing counters.
+
+        Returns:
+            A dictionary with the number of leader computations, calls
+            coalesced onto them and flights currently in progress
+        """
+        with self._lock:
+            return {'leaders': self.leaders, 'coalesced': self.coalesced, 'in_flight': len(self._calls)}
+
+    def render(self) -> str:
+        """
+        Render the counters in the Prometheus text format.
+
+        Returns:
+            The exposition text, ending with a newline
+        """
+        stats = self.stats()
+        return "\n".join([
+            "# HELP tau_plane_coalesced_leaders_total Requests that computed a response.",
+            "# TYPE tau_plane_coalesced_leaders_total counter",
+            f"tau_plane_coalesced_leaders_total {stats['leaders']}",
+            "# HELP tau_plane_coalesced_followers_total Requests served by an identical in-flight request.",
+            "# TYPE tau_plane_coalesced_followers_total counter",
+            f"tau_plane_coalesced_followers_total {stats['coalesced']}",
+            "# HELP tau_plane_coalesced_in_flight Distinct requests being computed.",
+            "# TYPE tau_plane_coalesced_in_flight gauge",
+            f"tau_plane_coalesced_in_flight {stats['in_flight']}",
+        ]) + "\n"
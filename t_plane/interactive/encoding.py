@@ -0,0 +1,145 @@
+import json
+import struct
+import numpy as np
+from typing import Any, Dict
+
+# Every buffer starts on a multiple of this many bytes so that the client can
+# view it directly as a Float64Array / Float32Array without copying.
+ALIGNMENT = 8
+
+BINARY_MIMETYPE = "application/vnd.tau-plane.grid"
+
+FLOAT_DTYPES = {
+    "float32": np.dtype("<f4"),
+    "float64": np.dtype("<f8"),
+}
+
+
+def to_jsonable(value: Any) -> Any:
+    """
+    Convert NumPy arrays and scalars inside a result into plain Python values.
+
+    Args:
+        value: A result value, possibly a nested dict/list containing arrays
+
+    Returns:
+        The same structure with arrays converted by tolist()
+    """
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict):
+        return {key: to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(item) for item in value]
+    return value
+
+
+def encode_binary(result: Dict[str, Any], float_dtype: str = "float32") -> bytes:
+    """
+    Encode a plot result as a JSON header followed by raw array buffers.
+
+    Layout (all integers little-endian):
+        uint32      length of the JSON header in bytes
+        bytes       UTF-8 JSON header, space-padded so the data starts aligned
+        bytes       contiguous array buffers, each aligned to ALIGNMENT bytes
+
+    Top-level NumPy arrays are written as buffers: floating-point grids use
+    float_dtype, boolean and integer masks use uint8. The header
+    holds every other field under "meta" and, under "arrays", the dtype,
+    shape and byte offset (relative to the start of the data section) of
+    each buffer.
+
+    Args:
+        result: The plot result dictionary
+        float_dtype: 'float32' or 'float64' for floating-point grids
+
+    Returns:
+        The encoded response body
+    """
+    if float_dtype not in FLOAT_DTYPES:
+        raise ValueError(f"Unsupported dtype '{float_dtype}'. Use one of {sorted(FLOAT_DTYPES)}.")
+
+    meta = {}
+    arrays = {}
+    buffers = []
+    offset = 0
+    for name, value in result.items():
+        if not isinstance(value, np.ndarray):
+            meta[name] = to_jsonable(value)
+            continue
+        if value.dtype.kind in "biu":
+            data = np.ascontiguousarray(value, dtype=np.uint8)
+        else:
+            # Magnitudes beyond the float32 range become inf, as in the JSON path
+            with np.errstate(over='ignore'):
+                data = np.ascontiguousarray(value, dtype=FLOAT_DTYPES[float_dtype])
+        arrays[name] = {
+            "dtype": data.dtype.name,
+            "shape": list(data.shape),
+            "offset": offset,
+        }
+        padding = -data.nbytes % ALIGNMENT
+        buffers.append(data.tobytes())
+        if padding:
+            buffers.append(b"\0" * padding)
+        offset += data.nbytes + padding
+
+    header = json.dumps({"meta": meta, "arrays": arrays}).encode("utf-8")
+    header += b" " * (-(4 + len(header)) % ALIGNMENT)
+    return b"".join([struct.pack("<I", len(header)), header] + buffers)
+
+
+def decode_binary(payload: bytes) -> Dict[str, Any]:
+    """
+    Decode a payload produced by encode_binary (used by tests and scripts).
+
+    Args:
+        payload: The encoded response body
+
+    Returns:
+        The result dictionary with arrays restored as read-only NumPy views
+    """
+    (header_length,) = struct.unpack_from("<I", payload)
+    header = json.loads(payload[4:4 + header_length])
+    data_start = 4 + header_length
+    result = dict(header["meta"])
+    for name, spec in header["arrays"].items():
+        dtype = np.dtype(spec["dtype"]).newbyteorder("<")
+        count = int(np.prod(spec["shape"]))
+        result[name] = np.frombuffer(payload, dtype=dtype, count=count,
+                                     offset=data_start + spec["offset"]).reshape(spec["shape"])
+    return result
+
+
+def _finite_or_none(value: Any) -> Any:
+    """Like to_jsonable, but with NaN and ±inf replaced by None (JSON null)."""
+    if isinstance(value, np.ndarray) and value.dtype.kind == "f":
+        converted = value.astype(object)
+        converted[~np.isfinite(value)] = None
+        return converted.tolist()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    if isinstance(value, dict):
+        return {key: _finite_or_none(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_or_none(item) for item in value]
+    return to_jsonable(value)
+
+
+def sse_event(event: str, payload: Dict[str, Any]) -> str:
+    """
+    Format a result as one Server-Sent Events message.
+
+    Non-finite numbers are sent as null, since JSON.parse in the browser
+    rejects NaN and Infinity.
+
+    Args:
+        event: Event name
+        payload: Result dictionary
+
+    Returns:
+        The event text, terminated by a blank line
+    """
+    return f"event: {event}\ndata: {json.dumps(_finite_or_none(payload))}\n\n"
@@ -0,0 +1,142 @@
+import bisect
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRIC_NAME = "tau_plane_plot_stage_seconds"
+
+
+class StageTimer:
+    """
+    Lap timer for the stages of one request.
+
+    Each call to lap() records the time since the previous lap (or since the
+    timer was created) under the given stage name.
+    """
+
+    def __init__(self):
+        self.stages: List[Tuple[str, float]] = []
+        self._start = self._last = time.perf_counter()
+
+    def lap(self, stage: str) -> None:
+        """Record the time since the previous lap as the named stage."""
+        now = time.perf_counter()
+        self.stages.append((stage, now - self._last))
+        self._last = now
+
+    def total(self) -> float:
+        """Seconds since the timer was created."""
+        return time.perf_counter() - self._start
+
+    def server_timing(self) -> str:
+        """
+        Format the stages as a Server-Timing header value.
+
+        Returns:
+            For example "grid;dur=0.41, evaluate;dur=12.03, total;dur=13.90"
+            (durations in milliseconds)
+        """
+        entries = [f"{stage};dur={seconds * 1e3:.2f}" for stage, seconds in self.stages]
+        entries.append(f"total;dur={self.total() * 1e3:.2f}")
+        return ", ".join(entries)
+
+
+class _NullTimer:
+    """Stand-in used when metrics are disabled; every call is a no-op."""
+
+    stages: List[Tuple[str, float]] = []
+
+    def lap(self, stage: str) -> None:
+        pass
+
+    def total(self) -> float:
+        return 0.0
+
+    def server_timing(self) -> Optional[str]:
+        return None
+
+
+NULL_TIMER = _NullTimer()
+
+
+class PlotMetrics:
+    """
+    Cumulative per-stage latency histograms, labelled by plot type and plane.
+
+    Rendered in the Prometheus text exposition format. Label values outside
+    the known sets are reported as "other" so that arbitrary request
+    arguments cannot grow the number of series.
+    """
+
+    def __init__(self,
+                 enabled: bool = True,
+                 plot_types=('zeta', 'general_func', 'simple_func'),
+                 planes=('tau_plane', 'z_plane', 'w_plane'),
+                 buckets=DEFAULT_BUCKETS):
+        """
+        Initialize empty histograms.
+
+        Args:
+            enabled: When False, timer() returns a no-op timer and nothing is recorded
+            plot_types: plot_type label values tracked individually
+            planes: plane label values tracked individually
+            buckets: Histogram bucket upper bounds in seconds
+        """
+        self.enabled = enabled
+        self.plot_types = frozenset(plot_types)
+        self.planes = frozenset(planes)
+        self.buckets = tuple(buckets)
+        # (stage, plot_type, plane) -> [per-bucket counts (+Inf last), sum]
+        self._series: Dict[Tuple[str, str, str], list] = {}
+        self._lock = threading.Lock()
+
+    def timer(self):
+        """A fresh StageTimer, or a shared no-op timer when disabled."""
+        return StageTimer() if self.enabled else NULL_TIMER
+
+    def observe(self, timer, plot_type: str, plane: str) -> None:
+        """
+        Add the stages of a finished request (and its total) to the histograms.
+
+        Args:
+            timer: Timer returned by timer()
+            plot_type: plot_type of the request
+            plane: plane of the request
+        """
+        if not self.enabled:
+            return
+        plot_type = plot_type if plot_type in self.plot_types else 'other'
+        plane = plane if plane in self.planes else 'other'
+        samples = list(timer.stages) + [('total', timer.total())]
+        with self._lock:
+            for stage, seconds in samples:
+                series = self._series.get((stage, plot_type, plane))
+                if series is None:
+                    series = self._series[(stage, plot_type, plane)] = [[0] * (len(self.buckets) + 1), 0.0]
+                series[0][bisect.bisect_left(self.buckets, seconds)] += 1
+                series[1] += seconds
+
+    def render(self) -> str:
+        """
+        Render all histograms in the Prometheus text format.
+
+        Returns:
+            The exposition text, ending with a newline
+        """
+        lines = [f"# HELP {METRIC_NAME} Time spent in each stage of /api/plot_data.",
+                 f"# TYPE {METRIC_NAME} histogram"]
+        with self._lock:
+            series = sorted((key, (list(counts), total)) for key, (counts, total) in self._series.items())
+        for (stage, plot_type, plane), (counts, total) in series:
+            labels = f'stage="{stage}",plot_type="{plot_type}",plane="{plane}"'
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float('inf') else repr(bound)
+                lines.append(f'{METRIC_NAME}_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"{METRIC_NAME}_sum{{{labels}}} {total!r}")
+            lines.append(f"{METRIC_NAME}_count{{{labels}}} {cumulative}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,57 @@
+import numpy as np
+from typing import Callable, Iterator, List, Tuple
+
+# Approximate number of samples per side in the first, coarsest pass
+BASE_RESOLUTION = 32
+
+
+def refinement_strides(points: int, base: int = BASE_RESOLUTION) -> List[int]:
+    """
+    Choose the subsampling strides of a coarse-to-fine schedule.
+
+    Level k samples every stride-th row and column of the final
+    points×points grid, with strides halving from the coarsest level down
+    to 1, so each level contains every sample of the previous one.
+
+    Args:
+        points: Number of samples per side of the final grid
+        base: Approximate number of samples per side of the first level
+
+    Returns:
+        Strides in the order they should be emitted, ending with 1
+    """
+    strides = [1]
+    while (points - 1) // (strides[-1] * 2) + 1 >= base:
+        strides.append(strides[-1] * 2)
+    return strides[::-1]
+
+
+def progressive_evaluate(func: Callable[[np.ndarray], np.ndarray],
+                         tau_values: np.ndarray,
+                         strides: List[int]) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Evaluate a function over a grid coarse-to-fine, reusing earlier samples.
+
+    At each level only the points that are on the level's subgrid but were
+    not on the previous level's subgrid are evaluated, so the total work is
+    the same as a single full-resolution evaluation.
+
+    Args:
+        func: Vectorized function of complex τ values
+        tau_values: Complex τ grid of the final resolution
+        strides: Strides from refinement_strides
+
+    Yields:
+        Tuples of (stride, values) where values[::stride, ::stride] is the
+        level's result. The array is shared between levels and filled in place.
+    """
+    values = np.full(tau_values.shape, np.nan + 1j * np.nan, dtype=complex)
+    rows = np.arange(tau_values.shape[0])[:, None]
+    cols = np.arange(tau_values.shape[1])[None, :]
+    previous = None
+    for stride in strides:
+        on_level = (rows % stride == 0) & (cols % stride == 0)
+        new = on_level if previous is None else on_level & ~((rows % previous == 0) & (cols % previous == 0))
+        values[new] = func(tau_values[new])
+        previous = stride
+        yield stride, values
@@ -0,0 +1,193 @@
+import hashlib
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Samples per tile side
+TILE_SIZE = 256
+
+# Width in τ units of a tile at zoom level 0; each zoom level halves it
+BASE_TILE_SPAN = 4.0
+
+# Deepest supported zoom level (tile span ≈ 4e-9 in τ)
+MAX_ZOOM = 30
+
+# Reserved function hash for the Riemann zeta function
+ZETA_HASH = "zeta"
+
+
+def tile_axes(zoom: int, x: int, y: int, size: int = TILE_SIZE) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the τ coordinates sampled by a tile.
+
+    Tile (x, y) at a zoom level covers τ_x ∈ [x·w, (x+1)·w) and
+    τ_y ∈ [y·w, (y+1)·w) with w = BASE_TILE_SPAN / 2^zoom. Samples sit at
+    cell centers, so no tile ever samples the excluded origin τ = 0 and
+    neighbouring tiles join without duplicated rows or columns.
+
+    Args:
+        zoom: Zoom level (0 .. MAX_ZOOM)
+        x: Tile column index (may be negative)
+        y: Tile row index (may be negative)
+        size: Samples per tile side
+
+    Returns:
+        A tuple of (tau_x, tau_y) 1-D axes of the tile
+    """
+    if not 0 <= zoom <= MAX_ZOOM:
+        raise ValueError(f"Zoom level must be between 0 and {MAX_ZOOM}")
+    span = BASE_TILE_SPAN / 2 ** zoom
+    offsets = (np.arange(size) + 0.5) * (span / size)
+    return x * span + offsets, y * span + offsets
+
+
+def function_hash(normalized_function: str) -> str:
+    """
+    Compute the short, URL-safe hash that addresses a function in tile URLs.
+
+    Args:
+        normalized_function: Function string after normalize_expression
+
+    Returns:
+        A 16-character hexadecimal digest
+    """
+    return hashlib.sha1(normalized_function.encode("utf-8")).hexdigest()[:16]
+
+
+class TileCache:
+    """
+    Thread-safe LRU cache of rendered tiles bounded by a memory budget.
+
+    Entries are dictionaries of NumPy arrays (plus scalar metadata); their
+    size is the total nbytes of the arrays. The least recently used tiles
+    are evicted once the budget is exceeded.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Memory budget for cached tile arrays
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Dict[str, Any], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _size(tile: Dict[str, Any]) -> int:
+        return sum(value.nbytes for value in tile.values() if isinstance(value, np.ndarray))
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        Look up a tile and mark it as most recently used.
+
+        Args:
+            key: Tile key, e.g. (plane, function hash, zoom, x, y)
+
+        Returns:
+            The cached tile, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, tile: Dict[str, Any]) -> None:
+        """
+        Store a tile, evicting least recently used tiles to stay in budget.
+
+        Tiles larger than the whole budget are not cached.
+
+        Args:
+            key: Tile key
+            tile: Dictionary of arrays and metadata for the tile
+        """
+        size = self._size(tile)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (tile, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report cache usage.
+
+        Returns:
+            A dictionary with entry count, bytes used, budget, hits, misses
+            and evictions
+        """
+        with self._lock:
+            return {
+                "tiles": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class FunctionRegistry:
+    """
+    Bounded mapping from function hashes used in tile URLs to expressions.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        """
+        Initialize an empty registry.
+
+        Args:
+            max_entries: Number of functions remembered before the least
+                recently registered ones are forgotten
+        """
+        self.max_entries = max_entries
+        self._functions: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, normalized_function: str) -> str:
+        """
+        Register a normalized function string and return its hash.
+
+        Args:
+            normalized_function: Function string after normalize_expression
+
+        Returns:
+            The function hash
+        """
+        key = function_hash(normalized_function)
+        with self._lock:
+            self._functions[key] = normalized_function
+            self._functions.move_to_end(key)
+            while len(self._functions) > self.max_entries:
+                self._functions.popitem(last=False)
+        return key
+
+    def lookup(self, key: str) -> Optional[str]:
+        """
+        Find the function registered under a hash.
+
+        Args:
+            key: Function hash
+
+        Returns:
+            The normalized function string, or None if unknown
+        """
+        with self._lock:
+            return self._functions.get(key)
@@ -0,0 +1,185 @@
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Optional, Tuple
+
+# Grid spacings within this relative difference count as the same resolution
+SPACING_TOLERANCE = 1e-6
+
+
+def _step(axis: np.ndarray) -> float:
+    return (axis[-1] - axis[0]) / (len(axis) - 1)
+
+
+def _offset(axis: np.ndarray, cached_axis: np.ndarray) -> Optional[int]:
+    """
+    Offset in grid steps of axis relative to cached_axis, if both have the same spacing.
+
+    Returns:
+        k such that axis[i] is (after snapping) cached lattice point k + i,
+        or None if the spacings differ
+    """
+    if len(axis) < 2 or len(cached_axis) < 2:
+        return None
+    step = _step(cached_axis)
+    if step == 0 or abs(_step(axis) - step) > SPACING_TOLERANCE * abs(step):
+        return None
+    return int(round((axis[0] - cached_axis[0]) / step))
+
+
+def _overlap(k: int, size: int, cached_size: int) -> Tuple[int, int]:
+    """Index range [start, stop) of a new axis covered by the cached one, given offset k."""
+    return max(0, -k), min(size, cached_size - k)
+
+
+class ViewportCache:
+    """
+    Last evaluated grid per view, reused when the view is panned.
+
+    A view is identified by a key (for example a client's view id plus
+    the function and plane). When the next grid for the same key has the
+    same spacing, its axes are snapped onto the cached grid's lattice; the
+    overlapping samples are copied and only the uncovered strips are
+    evaluated. Entries are evicted least recently used beyond a memory
+    budget.
+    """
+
+    def __init__(self, max_bytes: int = 128 * 1024 * 1024):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Memory budget for cached grids
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries: "OrderedDict[Hashable, Tuple[np.ndarray, np.ndarray, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: Hashable) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _put(self, key: Hashable, tau_x: np.ndarray, tau_y: np.ndarray, values: np.ndarray) -> None:
+        size = values.nbytes + tau_x.nbytes + tau_y.nbytes
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= sum(a.nbytes for a in self._entries.pop(key))
+            self._entries[key] = (tau_x, tau_y, values)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= sum(a.nbytes for a in evicted)
+
+    def align(self, key: Hashable, tau_x: np.ndarray, tau_y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Snap a view's axes onto the lattice of the cached grid for key.
+
+        Axes are only moved (by less than half a grid step) when both have
+        the cached spacing and the views overlap; otherwise they are
+        returned unchanged.
+
+        Args:
+            key: View key
+            tau_x: Requested x axis (ascending, evenly spaced)
+            tau_y: Requested y axis (ascending, evenly spaced)
+
+        Returns:
+            A tuple of (tau_x, tau_y)
+        """
+        entry = self._get(key)
+        if entry is None:
+            return tau_x, tau_y
+        cached_x, cached_y, _ = entry
+        kx, ky = _offset(tau_x, cached_x), _offset(tau_y, cached_y)
+        if kx is None or ky is None:
+            return tau_x, tau_y
+        x_start, x_stop = _overlap(kx, len(tau_x), len(cached_x))
+        y_start, y_stop = _overlap(ky, len(tau_y), len(cached_y))
+        if x_start >= x_stop or y_start >= y_stop:
+            return tau_x, tau_y
+        return self._lattice(cached_x, kx, len(tau_x)), self._lattice(cached_y, ky, len(tau_y))
+
+    @staticmethod
+    def _lattice(cached_axis: np.ndarray, k: int, size: int) -> np.ndarray:
+        step = _step(cached_axis)
+        axis = cached_axis[0] + (k + np.arange(size)) * step
+        # Keep the origin exact, so that it is still recognized as τ = 0
+        axis[np.abs(axis) < 1e-9 * abs(step)] = 0.0
+        return axis
+
+    def evaluate(self,
+                 key: Hashable,
+                 tau_x: np.ndarray,
+                 tau_y: np.ndarray,
+                 evaluate_grid: Callable[[np.ndarray, np.ndarray], np.ndarray]) -> Tuple[np.ndarray, float]:
+        """
+        Evaluate a grid, reusing the overlap with the cached grid for key.
+
+        The axes should come from align(), so that an overlapping grid
+        lies exactly on the cached lattice. The result becomes the new
+        cached grid for key.
+
+        Args:
+            key: View key
+            tau_x: x axis of the grid
+            tau_y: y axis of the grid
+            evaluate_grid: Called as evaluate_grid(x_axis, y_axis) on the
+                whole grid or on uncovered strips; returns complex values
+                indexed [y, x]
+
+        Returns:
+            A tuple of (values, reused) where reused is the fraction of the
+            grid copied from the cache. values is shared with the cache and
+            must not be modified.
+        """
+        entry = self._get(key)
+        values = None
+        reused = 0.0
+        if entry is not None:
+            values, reused = self._stitch(entry, tau_x, tau_y, evaluate_grid)
+        if values is None:
+            values = np.asarray(evaluate_grid(tau_x, tau_y), dtype=complex)
+        self._put(key, np.array(tau_x), np.array(tau_y), values)
+        return values, reused
+
+    @staticmethod
+    def _stitch(entry, tau_x, tau_y, evaluate_grid) -> Tuple[Optional[np.ndarray], float]:
+        cached_x, cached_y, cached_values = entry
+        kx, ky = _offset(tau_x, cached_x), _offset(tau_y, cached_y)
+        if kx is None or ky is None:
+            return None, 0.0
+        x_start, x_stop = _overlap(kx, len(tau_x), len(cached_x))
+        y_start, y_stop = _overlap(ky, len(tau_y), len(cached_y))
+        if x_start >= x_stop or y_start >= y_stop:
+            return None, 0.0
+
+        values = np.empty((len(tau_y), len(tau_x)), dtype=complex)
+        values[y_start:y_stop, x_start:x_stop] = cached_values[y_start + ky:y_stop + ky,
+                                                               x_start + kx:x_stop + kx]
+        # Full-width strips above and below the overlap, then its left and right sides
+        strips: List[Tuple[slice, slice]] = [
+            (slice(0, y_start), slice(None)),
+            (slice(y_stop, None), slice(None)),
+            (slice(y_start, y_stop), slice(0, x_start)),
+            (slice(y_start, y_stop), slice(x_stop, None)),
+        ]
+        for rows, cols in strips:
+            if values[rows, cols].size:
+                values[rows, cols] = evaluate_grid(tau_x[cols], tau_y[rows])
+        return values, (y_stop - y_start) * (x_stop - x_start) / values.size
+
+    def stats(self) -> dict:
+        """
+        Report cache usage.
+
+        Returns:
+            A dictionary with the number of cached views and bytes used
+        """
+        with self._lock:
+            return {"views": len(self._entries), "bytes": self.current_bytes, "max_bytes": self.max_bytes}
@@ -0,0 +1,64 @@
+import numpy as np
+
+# Saturation of domain-coloring hues
+SATURATION = 0.9
+
+# Brightness ramps from MIN_VALUE to 1 across each decade of |f|, which
+# draws contour bands at |f| = 10^k
+MIN_VALUE = 0.6
+
+# Color of points where the function is undefined (NaN), e.g. the τ origin
+UNDEFINED_RGB = (0, 0, 0)
+
+
+def domain_coloring(phase: np.ndarray, log_magnitude: np.ndarray) -> np.ndarray:
+    """
+    Color a function by domain coloring: hue from its phase, brightness from its magnitude.
+
+    Args:
+        phase: arg f in [-π, π]
+        log_magnitude: log10 |f|, with the shape of phase
+
+    Returns:
+        uint8 array of RGB colors with shape phase.shape + (3,)
+    """
+    phase = np.asarray(phase, dtype=np.float32)
+    log_magnitude = np.asarray(log_magnitude, dtype=np.float32)
+    undefined = ~(np.isfinite(phase) & np.isfinite(log_magnitude))
+    with np.errstate(invalid='ignore'):
+        hue = np.nan_to_num((phase / np.float32(2 * np.pi)) % 1 * 6)
+        value = np.nan_to_num(MIN_VALUE + (1 - MIN_VALUE) * (log_magnitude % 1))
+
+    # HSV to RGB: each channel is one of v, p, q, t depending on the hue sector
+    sector = np.floor(hue)
+    fraction = hue - sector
+    sector = sector.astype(np.int8) % 6
+    p = value * (1 - SATURATION)
+    q = value * (1 - SATURATION * fraction)
+    t = value * (1 - SATURATION * (1 - fraction))
+    channels = np.stack([value, p, q, t])
+    # Rows: sector; columns: which of (v, p, q, t) feeds R, G and B
+    table = np.array([[0, 3, 1], [2, 0, 1], [1, 0, 3], [1, 2, 0], [3, 1, 0], [0, 1, 2]])
+    picks = table[sector]
+    rgb = np.take_along_axis(channels, np.moveaxis(picks, -1, 0), axis=0)
+    rgb = np.moveaxis(rgb, 0, -1)
+
+    result = np.clip(rgb * 255 + 0.5, 0, 255).astype(np.uint8)
+    result[undefined] = UNDEFINED_RGB
+    return result
+
+
+def domain_coloring_values(values: np.ndarray) -> np.ndarray:
+    """
+    Domain coloring of complex function values.
+
+    Args:
+        values: Complex values of f on a grid
+
+    Returns:
+        uint8 RGB array with shape values.shape + (3,), laid out like values
+    """
+    with np.errstate(all='ignore'):
+        phase = np.angle(values)
+        log_magnitude = np.log10(np.maximum(np.abs(values), 1e-10))
+    return domain_coloring(phase, log_magnitude)
@@ -0,0 +1,100 @@
+import io
+import struct
+import zlib
+import numpy as np
+from typing import Tuple
+
+# zlib level for PNG output; low levels are several times faster and only
+# slightly larger on smooth domain-coloring images
+PNG_COMPRESSION = 3
+
+# Lossy WebP quality (0-100)
+WEBP_QUALITY = 90
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _png_chunk(kind: bytes, payload: bytes) -> bytes:
+    return (struct.pack(">I", len(payload)) + kind + payload
+            + struct.pack(">I", zlib.crc32(kind + payload)))
+
+
+def encode_png(rgb: np.ndarray, compression: int = PNG_COMPRESSION) -> bytes:
+    """
+    Encode an RGB or RGBA image as PNG, without any imaging library.
+
+    Every row uses the PNG 'Up' filter (difference to the row above), which
+    is computed for the whole image at once and compresses smooth images
+    well.
+
+    Args:
+        rgb: uint8 array of shape (height, width, 3) or (height, width, 4),
+            first row at the top
+        compression: zlib compression level
+
+    Returns:
+        The PNG file contents
+    """
+    rgb = np.ascontiguousarray(rgb, dtype=np.uint8)
+    if rgb.ndim != 3 or rgb.shape[2] not in (3, 4) or 0 in rgb.shape:
+        raise ValueError(f"Expected a non-empty (height, width, 3 or 4) image, got shape {rgb.shape}")
+    height, width, channels = rgb.shape
+
+    rows = rgb.reshape(height, width * channels)
+    filtered = np.empty((height, 1 + width * channels), dtype=np.uint8)
+    filtered[:, 0] = 2  # filter type 'Up'
+    filtered[:, 1:] = rows
+    filtered[1:, 1:] -= rows[:-1]  # wraps modulo 256, as PNG requires
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2 if channels == 3 else 6, 0, 0, 0)
+    return (PNG_SIGNATURE
+            + _png_chunk(b"IHDR", header)
+            + _png_chunk(b"IDAT", zlib.compress(filtered.tobytes(), compression))
+            + _png_chunk(b"IEND", b""))
+
+
+def encode_webp(rgb: np.ndarray, quality: int = WEBP_QUALITY) -> bytes:
+    """
+    Encode an RGB image as lossy WebP (requires Pillow with WebP support).
+
+    Args:
+        rgb: uint8 array of shape (height, width, 3), first row at the top
+        quality: WebP quality (0-100)
+
+    Returns:
+        The WebP file contents
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        raise ValueError("WebP output requires Pillow")
+    buffer = io.BytesIO()
+    try:
+        Image.fromarray(np.ascontiguousarray(rgb, dtype=np.uint8)).save(buffer, format="WEBP", quality=quality)
+    except (KeyError, OSError) as e:
+        raise ValueError(f"WebP output is not available: {e}")
+    return buffer.getvalue()
+
+
+# Image format -> (MIME type, encoder)
+IMAGE_FORMATS = {
+    "png": ("image/png", encode_png),
+    "webp": ("image/webp", encode_webp),
+}
+
+
+def encode_image(rgb: np.ndarray, image_format: str = "png") -> Tuple[bytes, str]:
+    """
+    Encode an RGB image in one of IMAGE_FORMATS.
+
+    Args:
+        rgb: uint8 array of shape (height, width, 3), first row at the top
+        image_format: 'png' or 'webp'
+
+    Returns:
+        A tuple of (file contents, MIME type)
+    """
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f"Unknown image format '{image_format}'; expected one of {sorted(IMAGE_FORMATS)}")
+    mimetype, encoder = IMAGE_FORMATS[image_format]
+    return encoder(rgb), mimetype
@@ -1,8 +1,15 @@
+import os
 import numpy as np
-import matplotlib.pyplot as plt
-import plotly.graph_objects as go
-from typing import Callable, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Callable, Optional, Tuple, Union
 from ..core.tau_plane import TauPlane
+from .coloring import domain_coloring_values
+from .image import encode_image
+
+# Matplotlib and Plotly are imported by the methods that use them; each
+# costs far more to import than the rest of the package
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    import plotly.graph_objects as go
 
 class TauPlotter:
     """
@@ -25,7 +32,7 @@ class TauPlotter:
                       show_unit_circle: bool = True,
                       show_liminal_circle: bool = False,
                       epsilon: Optional[float] = None,
-                      figsize: Tuple[int, int] = (10, 10)) -> plt.Figure:
+                      figsize: Tuple[int, int] = (10, 10)) -> "plt.Figure":
         """
         Plot the basic τ-plane grid.
         
@@ -41,7 +48,7 @@ class TauPlotter:
         Returns:
             Matplotlib figure
         """
-        tau_x, tau_y = self.tau_plane.create_tau_grid(tau_min, tau_max, points)
+        import matplotlib.pyplot as plt
         
         fig, ax = plt.subplots(figsize=figsize)
         
@@ -82,7 +89,7 @@ class TauPlotter:
                                   show_unit_circle: bool = True,
                                   show_liminal_circle: bool = False,
                                   epsilon: Optional[float] = None,
-                                  figsize: Tuple[int, int] = (12, 10)) -> plt.Figure:
+                                  figsize: Tuple[int, int] = (12, 10)) -> "plt.Figure":
         """
         Plot a function in the τ-plane using domain coloring.
         
@@ -100,16 +107,20 @@ class TauPlotter:
         Returns:
             Matplotlib figure with domain coloring
         """
-        # Create tau grid
-        tau_x, tau_y = self.tau_plane.create_tau_grid(tau_min, tau_max, points)
-        tau = tau_x + 1j * tau_y
+        import matplotlib.pyplot as plt
+        # Grid axes; the function is evaluated block by block so that only
+        # the phase and magnitude grids are ever held in full
+        tau_x, tau_y = self.tau_plane.create_tau_grid(tau_min, tau_max, points, sparse=True)
+        tau_x, tau_y = tau_x.ravel(), tau_y.ravel()
+        phase = np.empty((len(tau_y), len(tau_x)))
+        magnitude = np.empty_like(phase)
         
-        # Apply the function to complex tau values
-        z = func(tau)
-        
-        # Calculate phase and magnitude for domain coloring
-        phase = np.angle(z)
-        magnitude = np.abs(z)
+        # Apply the function to complex tau values, then calculate phase and
+        # magnitude for domain coloring
+        for rows, cols, tau in self.tau_plane.iter_tau_blocks(tau_min, tau_max, points):
+            z = func(tau)
+            phase[rows, cols] = np.angle(z)
+            magnitude[rows, cols] = np.abs(z)
         
         # Create plots
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figsize)
@@ -158,11 +169,59 @@ class TauPlotter:
         
         return fig
     
+    def domain_coloring_image(self,
+                              func: Callable[[np.ndarray], np.ndarray],
+                              tau_min: float = -5.0,
+                              tau_max: float = 5.0,
+                              points: int = 1000) -> np.ndarray:
+        """
+        Render a function in the τ-plane as a domain-colored image.
+        
+        Hue follows the phase and brightness bands the decades of the
+        magnitude. The image is computed directly with NumPy, block by
+        block, which is far faster and lighter than pcolormesh.
+        
+        Args:
+            func: The function to plot, should accept complex input and return complex output
+            tau_min: Minimum τ value
+            tau_max: Maximum τ value
+            points: Number of points (pixels) per dimension
+            
+        Returns:
+            uint8 RGB array of shape (height, width, 3) with the largest τ_y in the top row
+        """
+        size = len(self.tau_plane.tau_axis(tau_min, tau_max, points))
+        rgb = np.empty((size, size, 3), dtype=np.uint8)
+        for rows, cols, tau in self.tau_plane.iter_tau_blocks(tau_min, tau_max, points):
+            rgb[rows, cols] = domain_coloring_values(func(tau))
+        return rgb[::-1]
+    
+    def save_domain_coloring(self,
+                             path: str,
+                             func: Callable[[np.ndarray], np.ndarray],
+                             tau_min: float = -5.0,
+                             tau_max: float = 5.0,
+                             points: int = 1000) -> None:
+        """
+        Save the domain_coloring_image of a function as PNG or WebP (by file extension).
+        
+        Args:
+            path: Output file ending in .png or .webp
+            func: The function to plot, should accept complex input and return complex output
+            tau_min: Minimum τ value
+            tau_max: Maximum τ value
+            points: Number of points (pixels) per dimension
+        """
+        image_format = os.path.splitext(path)[1].lower().lstrip('.')
+        payload, _ = encode_image(self.domain_coloring_image(func, tau_min, tau_max, points), image_format)
+        with open(path, 'wb') as f:
+            f.write(payload)
+    
     def interactive_tau_plane(self,
                               func: Callable[[np.ndarray], np.ndarray],
                               tau_min: float = -5.0,
                               tau_max: float = 5.0,
-                              points: int = 100) -> go.Figure:
+                              points: int = 100) -> "go.Figure":
         """
         Create an interactive plot of the τ-plane using Plotly.
         
@@ -175,9 +234,11 @@ class TauPlotter:
         Returns:
             Plotly figure for interactive exploration
         """
-        # Create tau grid
-        tau_x, tau_y = self.tau_plane.create_tau_grid(tau_min, tau_max, points)
+        import plotly.graph_objects as go
+        # Create tau grid (broadcast axes: the complex grid is the only dense array)
+        tau_x, tau_y = self.tau_plane.create_tau_grid(tau_min, tau_max, points, sparse=True)
         tau = tau_x + 1j * tau_y
+        tau_x, tau_y = tau_x.ravel(), tau_y.ravel()
         
         # Apply the function to the complex tau values
         z = func(tau)
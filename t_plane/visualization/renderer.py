@@ -0,0 +1,199 @@
+"""
+Out-of-core rendering of large τ-plane images.
+
+The grid of TauPlane.create_tau_grid is evaluated tile by tile into
+np.memmap-backed .npy files in an output directory:
+
+    render.json         the render parameters
+    phase.npy           float32 arg f, indexed [y, x] with y ascending
+    log_magnitude.npy   float32 log10 |f|
+    rgb.npy             uint8 domain coloring, shape (ny, nx, 3)
+    tiles_done.npy      bool per tile, set once the tile is on disk
+
+Files are flushed after every row of tiles before those tiles are marked
+done, so an interrupted render resumes from the last completed row. Memory
+use is bounded by the tile size, not the image size.
+
+Render from the command line with:
+
+    python -m t_plane.visualization.renderer poster --zeta --points 20000
+    python -m t_plane.visualization.renderer poster --function "z**3-1" --points 20000
+"""
+import argparse
+import json
+import os
+import numpy as np
+from numpy.lib.format import open_memmap
+from typing import Any, Callable, Dict, Optional
+
+from ..core.tau_plane import TauPlane
+from .coloring import domain_coloring
+
+# Edge length in points of the square tiles evaluated at once
+RENDER_TILE_SIZE = 1024
+
+MANIFEST = "render.json"
+
+
+def _open_array(path: str, shape, dtype, resume: bool) -> np.memmap:
+    if resume:
+        array = open_memmap(path, mode="r+")
+        if array.shape != tuple(shape) or array.dtype != np.dtype(dtype):
+            raise ValueError(f"{path} does not match the render parameters")
+        return array
+    return open_memmap(path, mode="w+", dtype=dtype, shape=tuple(shape))
+
+
+def render_to_disk(func: Callable[[np.ndarray], np.ndarray],
+                   output_dir: str,
+                   tau_min: float = -3.0,
+                   tau_max: float = 3.0,
+                   points: int = 4096,
+                   tile_size: int = RENDER_TILE_SIZE,
+                   tau_plane: Optional[TauPlane] = None,
+                   description: str = "",
+                   evaluator=None,
+                   progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+    """
+    Render func over the τ grid to memory-mapped files, resuming a previous run.
+
+    If output_dir already holds a render with the same parameters, the
+    tiles it completed are skipped; a render with different parameters is
+    an error.
+
+    Args:
+        func: Vectorized function of complex τ to render
+        output_dir: Directory for the output files (created if missing)
+        tau_min: Minimum τ value
+        tau_max: Maximum τ value
+        points: Number of points per dimension (see TauPlane.create_tau_grid)
+        tile_size: Edge length in points of the tiles evaluated at once
+        tau_plane: TauPlane defining the grid (default TauPlane())
+        description: Identifies func in the manifest, so that a resumed
+            render cannot silently mix two functions
+        evaluator: Optional GridEvaluator used to evaluate each tile
+        progress: Called as progress(tiles_done, tiles_total) after each row of tiles
+
+    Returns:
+        The manifest: the render parameters and the output shape
+    """
+    if tile_size < 1:
+        raise ValueError("tile_size must be positive")
+    tau_plane = tau_plane or TauPlane()
+    size = len(tau_plane.tau_axis(tau_min, tau_max, points))
+    tile_rows = -(-size // tile_size)
+    manifest = {
+        'description': description,
+        'tau_min': tau_min,
+        'tau_max': tau_max,
+        'points': points,
+        'delta': tau_plane.delta,
+        'tile_size': tile_size,
+        'shape': [size, size],
+    }
+
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST)
+    resume = os.path.exists(manifest_path)
+    if resume:
+        with open(manifest_path) as f:
+            previous = json.load(f)
+        if previous != manifest:
+            raise ValueError(f"{output_dir} holds a different render; use a new directory")
+
+    phase = _open_array(os.path.join(output_dir, "phase.npy"), (size, size), np.float32, resume)
+    log_magnitude = _open_array(os.path.join(output_dir, "log_magnitude.npy"), (size, size), np.float32, resume)
+    rgb = _open_array(os.path.join(output_dir, "rgb.npy"), (size, size, 3), np.uint8, resume)
+    done = _open_array(os.path.join(output_dir, "tiles_done.npy"), (tile_rows, tile_rows), np.bool_, resume)
+    if not resume:
+        # Written last: a manifest means the arrays exist
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+
+    blocks = tau_plane.iter_tau_blocks(tau_min, tau_max, points,
+                                       block_shape=(tile_size, tile_size), dtype=np.complex128)
+    row_tiles = []
+    for rows, cols, tau in blocks:
+        tile = (rows.start // tile_size, cols.start // tile_size)
+        if not done[tile]:
+            with np.errstate(all='ignore'):
+                values = evaluator.evaluate(func, tau) if evaluator is not None else func(tau)
+                values = np.asarray(values, dtype=complex)
+                tile_phase = np.angle(values)
+                tile_log_magnitude = np.log10(np.maximum(np.abs(values), 1e-10))
+            phase[rows, cols] = tile_phase
+            log_magnitude[rows, cols] = tile_log_magnitude
+            rgb[rows, cols] = domain_coloring(tile_phase, tile_log_magnitude)
+            row_tiles.append(tile)
+
+        if cols.stop == size:
+            # End of a row of tiles: checkpoint
+            if row_tiles:
+                for array in (phase, log_magnitude, rgb):
+                    array.flush()
+                for finished in row_tiles:
+                    done[finished] = True
+                done.flush()
+                row_tiles = []
+            if progress is not None:
+                progress(int(done.sum()), done.size)
+
+    return manifest
+
+
+class _ExpressionInTau:
+    """A function string of z evaluated at z = 1/τ; picklable for worker processes."""
+
+    def __init__(self, function_str: str, tau_plane: TauPlane):
+        self.function_str = function_str
+        self.tau_plane = tau_plane
+
+    def __call__(self, tau: np.ndarray) -> np.ndarray:
+        from ..core.expression import compile_expression
+        return compile_expression(self.function_str)(self.tau_plane.from_tau(tau, on_zero='nan'))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a τ-plane image to memory-mapped .npy files.")
+    parser.add_argument("output_dir", help="output directory (re-run to resume)")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--function", help="function of z, e.g. 'z**3-1'")
+    source.add_argument("--zeta", action="store_true", help="render the Riemann zeta function")
+    parser.add_argument("--points", type=int, default=4096, help="points per dimension")
+    parser.add_argument("--tau-min", type=float, default=-3.0)
+    parser.add_argument("--tau-max", type=float, default=3.0)
+    parser.add_argument("--tile-size", type=int, default=RENDER_TILE_SIZE)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes per tile (default 1: evaluate in this process)")
+    args = parser.parse_args(argv)
+
+    tau_plane = TauPlane(delta=1e-3)
+    if args.zeta:
+        from ..analysis.riemann import RiemannAnalysis
+        func = RiemannAnalysis(tau_plane).zeta_in_tau_plane
+        description = "zeta"
+    else:
+        from ..core.expression import compile_expression
+        compile_expression(args.function)  # report invalid input before rendering
+        func = _ExpressionInTau(args.function, tau_plane)
+        description = args.function
+
+    evaluator = None
+    if args.workers > 1:
+        from ..core.parallel import GridEvaluator
+        evaluator = GridEvaluator(workers=args.workers)
+
+    def report(done, total):
+        print(f"\r{done}/{total} tiles", end="", flush=True)
+
+    try:
+        manifest = render_to_disk(func, args.output_dir, args.tau_min, args.tau_max, args.points,
+                                  args.tile_size, tau_plane, description, evaluator, report)
+    finally:
+        if evaluator is not None:
+            evaluator.shutdown()
+    print(f"\nRendered {manifest['shape'][1]}x{manifest['shape'][0]} to {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
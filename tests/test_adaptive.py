@@ -0,0 +1,24 @@
+import numpy as np
+from t_plane.core.adaptive import adaptive_sample
+
+def test_adaptive_sample_refines_near_pole():
+    """Test that cells are refined around a pole and left coarse elsewhere."""
+    pole = 0.7 + 0.3j
+    samples = adaptive_sample(lambda tau: 1 / (tau - pole), -2.0, 2.0, base=8, max_depth=5, budget=5000)
+    x, y, width = samples.cells()
+    centers = (x + width / 2) + 1j * (y + width / 2)
+    smallest = width == width.min()
+    assert width.min() < width.max()
+    assert np.all(np.abs(centers[smallest] - pole) < 0.5)
+    assert samples.evaluations <= 5000
+
+def test_adaptive_sample_matches_uniform_grid():
+    """Test that the rasterized quadtree reproduces a smooth function."""
+    func = lambda tau: np.exp(tau) + tau**2
+    samples = adaptive_sample(func, -1.0, 1.0, base=8, max_depth=4)
+    tau_axis, values = samples.to_grid(50)
+    tau_x, tau_y = np.meshgrid(tau_axis, tau_axis)
+    expected = func(tau_x + 1j * tau_y)
+    assert values.shape == (50, 50)
+    assert np.allclose(values, expected, rtol=0.02, atol=0.05)
+    assert samples.evaluations < 50 * 50
@@ -0,0 +1,49 @@
+import threading
+import time
+
+import pytest
+
+from t_plane.interactive.admission import AdmissionController, Overloaded
+
+def test_limit_and_fifo_queue():
+    """Test that a class runs at most its limit at once and admits waiters in arrival order."""
+    controller = AdmissionController({'zeta': 1}, queue_size=4)
+    holder = controller.acquire('zeta')
+    order = []
+
+    def request(name):
+        with controller.acquire('zeta') as admission:
+            order.append((name, admission.wait))
+
+    threads = []
+    for name in ('first', 'second'):
+        threads.append(threading.Thread(target=request, args=(name,)))
+        threads[-1].start()
+        while controller.stats()['zeta']['waiting'] < len(threads):
+            time.sleep(0.001)
+    time.sleep(0.02)
+    holder.release()
+    for thread in threads:
+        thread.join()
+    assert [name for name, _ in order] == ['first', 'second']
+    assert all(wait >= 0.02 for _, wait in order)
+    assert controller.stats()['zeta']['running'] == 0
+
+def test_full_queue_and_timeout_are_rejected():
+    """Test that requests beyond the queue, or waiting too long, raise Overloaded."""
+    controller = AdmissionController({'plot': 1, 'analysis': 1}, queue_size=0, max_wait=0.01)
+    holder = controller.acquire('plot')
+    with pytest.raises(Overloaded) as rejected:
+        controller.acquire('plot')
+    assert rejected.value.retry_after >= 1
+    # Other classes are unaffected
+    controller.acquire('analysis').release()
+    holder.release()
+
+    controller = AdmissionController({'plot': 1}, queue_size=1, max_wait=0.01)
+    holder = controller.acquire('plot')
+    with pytest.raises(Overloaded, match='timed out'):
+        controller.acquire('plot')
+    assert controller.stats()['plot'] == dict(controller.stats()['plot'], waiting=0, rejected=1)
+    holder.release()
+    controller.acquire('plot').release()
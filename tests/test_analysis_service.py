@@ -0,0 +1,69 @@
+import threading
+import time
+
+from t_plane.interactive.analysis_service import AnalysisService
+
+def test_analysis_timeout_returns_partial_results():
+    """Test that sub-analyses exceeding the time limit are reported, not awaited."""
+    service = AnalysisService(max_workers=1, timeout=0.01)
+    try:
+        result = service.analyze('sin(z)/z^3 + exp(z^2)')
+        assert result['status']['domain_properties'] == 'ok'
+        assert result['status']['special_values'] == 'timeout'
+        assert result['domain_properties']['description'] == 'Meromorphic function with possible poles'
+        assert result['cached'] is False
+    finally:
+        service.shutdown()
+
+def test_analysis_cached_by_normalized_expression():
+    """Test that spellings with the same normalized form share one cached analysis."""
+    service = AnalysisService(max_workers=1, timeout=60)
+    try:
+        first = service.analyze('z^3 - 3*z')
+        second = service.analyze('z**3  -  3*z')
+        assert first['cached'] is False
+        assert second['cached'] is True
+        assert len(first['critical_points']) == 2
+        assert second['critical_points'] == first['critical_points']
+    finally:
+        service.shutdown()
+
+def test_timeout_does_not_disturb_concurrent_request():
+    """Test that one request timing out (even while parsing) leaves a concurrent one intact and is not cached."""
+    service = AnalysisService(max_workers=8, timeout=5)
+    results = {}
+
+    def analyze(name, function_str):
+        start = time.perf_counter()
+        results[name] = (service.analyze(function_str), time.perf_counter() - start)
+
+    try:
+        # Start all eight workers first, so cold SymPy imports do not eat the time limit
+        warmup = [threading.Thread(target=analyze, args=(name, 'z')) for name in ('a', 'b')]
+        for thread in warmup:
+            thread.start()
+        for thread in warmup:
+            thread.join()
+        threads = [threading.Thread(target=analyze, args=('stuck', '9^9^9^9')),
+                   threading.Thread(target=analyze, args=('quick', 'z^3 - 3*z'))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stuck, stuck_seconds = results['stuck']
+        quick, _ = results['quick']
+        assert stuck['status']['critical_points'] == 'timeout' and stuck_seconds < 8
+        assert set(quick['status'].values()) == {'ok'}
+        assert len(quick['critical_points']) == 2
+        assert service.analyze('z^3 - 3*z')['cached'] is True
+        assert service._cache_get('9**9**9**9') is None
+    finally:
+        service.shutdown()
+
+def test_unparseable_function_reports_error():
+    """Test that input SymPy cannot parse gets the analysis error response."""
+    service = AnalysisService(max_workers=2, timeout=30)
+    try:
+        assert service.analyze('z +* 2')['error'].startswith('Analysis failed')
+    finally:
+        service.shutdown()
@@ -0,0 +1,176 @@
+import numpy as np
+import pytest
+from app import app
+from t_plane.interactive.encoding import decode_binary
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    return app.test_client()
+
+def test_plot_data_binary_matches_json(client):
+    """Test that format=binary carries the same grids as the JSON response."""
+    query = '/api/plot_data?plot_type=general_func&function=z^2%2B1&points=16&plane=w_plane'
+    as_json = client.get(query).get_json()
+    as_binary = decode_binary(client.get(query + '&format=binary&dtype=float64').data)
+    assert as_binary['function'] == as_json['function']
+    for field in ['tau_x', 'phase', 'magnitude', 'w_x', 'w_y']:
+        assert np.allclose(as_binary[field], np.array(as_json[field]), equal_nan=True)
+
+def test_tile_served_from_cache(client):
+    """Test that a registered function's tile is computed once and then cached."""
+    from app import tile_cache
+    key = client.get('/api/tile_function?function=z^3').get_json()['hash']
+    url = f'/api/tile/tau_plane/{key}/2/-1/3?format=binary'
+    first = client.get(url)
+    hits = tile_cache.stats()['hits']
+    second = client.get(url)
+    assert first.status_code == 200
+    assert first.data == second.data
+    assert tile_cache.stats()['hits'] == hits + 1
+    tile = decode_binary(first.data)
+    assert tile['phase'].shape == (len(tile['tau_y']), len(tile['tau_x']))
+
+def test_tile_unknown_function(client):
+    """Test that unregistered function hashes are rejected."""
+    assert client.get('/api/tile/tau_plane/0123456789abcdef/0/0/0').status_code == 404
+
+def test_plot_data_progressive_stream(client):
+    """Test that progressive=true streams levels ending with the full grid."""
+    import json
+    response = client.get('/api/plot_data?plot_type=general_func&function=z*z&points=130&progressive=true')
+    assert response.mimetype == 'text/event-stream'
+    events = [json.loads(line[len('data: '):]) for line in response.get_data(as_text=True).splitlines()
+              if line.startswith('data: ')]
+    assert [event['stride'] for event in events] == [4, 2, 1]
+    assert events[-1]['final'] and len(events[-1]['phase']) == 130
+
+def test_plot_data_locate_zeros(client):
+    """Test that locate_zeros=true reports zeros and poles of a user function."""
+    query = '/api/plot_data?plot_type=general_func&function=(z-2)/(z%2B1j)&points=60&locate_zeros=true'
+    points = client.get(query).get_json()['zeros_and_poles']
+    kinds = sorted((p['type'], round(p['z_real'], 6), round(p['z_imag'], 6)) for p in points)
+    assert kinds == [('pole', 0.0, -1.0), ('zero', 2.0, 0.0)]
+
+def test_plot_data_server_timing_and_metrics(client):
+    """Test that plot_data reports its stages in Server-Timing and /metrics."""
+    response = client.get('/api/plot_data?plot_type=general_func&function=z*z&points=20&plane=w_plane')
+    stages = [entry.split(';')[0] for entry in response.headers['Server-Timing'].split(', ')]
+    assert stages == ['grid', 'w_transform', 'metadata', 'evaluate', 'fields', 'tolist', 'jsonify', 'total']
+    text = client.get('/metrics').get_data(as_text=True)
+    assert '# TYPE tau_plane_plot_stage_seconds histogram' in text
+    assert 'tau_plane_plot_stage_seconds_count{stage="evaluate",plot_type="general_func",plane="w_plane"}' in text
+
+def test_metrics_disabled_keeps_serving_counters(client, monkeypatch):
+    """Test that disabling stage metrics leaves the admission and coalescing counters in /metrics."""
+    import app as app_module
+    monkeypatch.setattr(app_module.plot_metrics, 'enabled', False)
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    text = response.get_data(as_text=True)
+    assert 'tau_plane_plot_stage_seconds' not in text
+    assert 'tau_plane_admission_running' in text and 'tau_plane_coalesced_leaders_total' in text
+    assert 'tau_plane_superseded_requests_total' in text
+
+def test_plot_data_origin_is_nan(client):
+    """Test that the τ-plane origin (infinity) is sent as NaN rather than failing."""
+    data = client.get('/api/plot_data?plot_type=general_func&function=z*z&points=11').get_json()
+    assert np.isnan(data['phase'][5][5])
+    assert np.isfinite(data['phase'][5][6])
+
+def test_plot_image_png(client):
+    """Test that plot_image returns a PNG of the requested size and rejects the w-plane."""
+    import struct
+    response = client.get('/api/plot_image?plot_type=general_func&function=z**3-1&points=64')
+    assert response.mimetype == 'image/png'
+    assert struct.unpack('>II', response.data[16:24]) == (64, 64)
+    assert client.get('/api/plot_image?plane=w_plane').status_code == 400
+
+def test_plot_data_viewport_pan(client):
+    """Test that a panned viewport request reuses the previous grid of its view."""
+    base = '/api/plot_data?plot_type=general_func&function=z*z&points=41&viewport=true&view_id=pan'
+    first = client.get(base + '&tau_min=-2&tau_max=2').get_json()
+    assert first['reused_fraction'] == 0.0
+    panned = client.get(base + '&tau_min=-1.79&tau_max=2.21&tau_y_min=-2&tau_y_max=2').get_json()
+    assert panned['reused_fraction'] == 39 / 41
+    assert np.isclose(panned['tau_x'][0], -1.8)
+
+def test_plot_batch_matches_single_plots(client):
+    """Test that plot_batch returns the same grids as separate plot_data requests."""
+    jobs = [{'function': 'z**2+1', 'plane': plane} for plane in ('tau_plane', 'z_plane', 'w_plane')]
+    jobs += [{'plot_type': 'zeta', 'plane': 'tau_plane', 'fields': ['phase']}, {'function': 'z+'}]
+    data = client.post('/api/plot_batch', json={'points': 21, 'jobs': jobs}).get_json()
+    for index, plane in enumerate(('tau_plane', 'z_plane', 'w_plane')):
+        single = client.get(f'/api/plot_data?plot_type=general_func&function=z**2%2B1&points=21&plane={plane}').get_json()
+        assert np.allclose(single['magnitude'], data[f'jobs.{index}.magnitude'], equal_nan=True)
+    assert 'jobs.3.phase' in data and 'jobs.3.magnitude' not in data
+    assert 'error' in data['jobs'][4]
+    assert client.post('/api/plot_batch', json={'jobs': []}).status_code == 400
+    assert client.post('/api/plot_batch', json={'points': 5000, 'jobs': jobs}).status_code == 400
+
+def test_overloaded_class_gets_503(client, monkeypatch):
+    """Test that a full work class is rejected with Retry-After while others are served."""
+    import app as app_module
+    from t_plane.interactive.admission import AdmissionController
+    controller = AdmissionController({'plot': 1, 'zeta': 1, 'analysis': 1}, queue_size=0)
+    monkeypatch.setattr(app_module, 'admission_controller', controller)
+    with controller.acquire('zeta'):
+        busy = client.get('/api/plot_data?plot_type=zeta&points=10')
+        assert busy.status_code == 503 and int(busy.headers['Retry-After']) >= 1
+        served = client.get('/api/plot_data?plot_type=general_func&function=z&points=10')
+        assert served.status_code == 200 and float(served.headers['X-Queue-Wait']) >= 0
+    assert 'queue;dur=' in served.headers.getlist('Server-Timing')[-1]
+    assert 'tau_plane_admission_rejected_total{work_class="zeta"} 1' in client.get('/metrics').get_data(as_text=True)
+
+def test_superseded_request_is_cancelled(client, monkeypatch):
+    """Test that a request whose client sent a newer one stops with 409."""
+    import threading
+    import app as app_module
+    from t_plane.interactive.cancellation import ClientRequests
+    requests = ClientRequests()
+    first = requests.start('tab')
+    assert requests.start('tab') is not first and first.is_set()
+    assert requests.stats() == {'active': 1, 'cancelled': 1}
+
+    superseded = threading.Event()
+    superseded.set()
+    monkeypatch.setattr(app_module.client_requests, 'start', lambda client_id: superseded)
+    query = '/api/plot_data?plot_type=zeta&points=150&num_zeros=0'
+    assert client.get(query + '&client_id=tab').status_code == 409
+    assert client.get(query).status_code == 200
+
+def test_oversized_zero_window_fails_fast(client):
+    """Test that zero windows that are too large, too high or malformed are rejected before any search."""
+    import time
+    base = '/api/plot_data?plot_type=zeta&points=10'
+    start = time.perf_counter()
+    for window in ['1e6&zeros_t_max=1.02e6', '0&zeros_t_max=2e6', '1e9&zeros_t_max=1.00000001e9',
+                   '50&zeros_t_max=10', 'nan&zeros_t_max=10']:
+        response = client.get(f'{base}&zeros_t_min={window}')
+        assert response.status_code == 400
+    assert time.perf_counter() - start < 2
+    assert len(client.get(f'{base}&zeros_t_min=10&zeros_t_max=50').get_json()['zeros']['x']) == 10
+
+def test_adaptive_sampling_rejects_rectangular_view(client):
+    """Test that adaptive sampling refuses a y-range it would ignore."""
+    base = '/api/plot_data?plot_type=general_func&function=z*z&points=20&sampling=adaptive&budget=200'
+    assert client.get(base + '&tau_y_min=0&tau_y_max=1').status_code == 400
+    assert client.get(base + '&viewport=true').status_code == 400
+    assert client.get(base + '&tau_y_min=-3&tau_y_max=3').status_code == 200
+
+def test_analyze_flag_points_to_analysis_endpoint(client):
+    """Test that plot_data leaves symbolic analysis to /api/analyze."""
+    data = client.get('/api/plot_data?plot_type=general_func&function=z^3&points=10&analyze=true').get_json()
+    assert 'analysis' not in data
+    assert data['analysis_url'] == '/api/analyze?function=z%5E3'
+
+def test_coalescing_key_normalizes_function(client, monkeypatch):
+    """Test that spellings of one expression share a coalescing key."""
+    import app as app_module
+    keys = []
+    do = app_module.plot_flights.do
+    monkeypatch.setattr(app_module.plot_flights, 'do',
+                        lambda key, func, cancel=None: keys.append(key) or do(key, func, cancel))
+    for function in ['z^2', 'z**2', 'z  **  2']:
+        assert client.get(f'/api/plot_data?plot_type=general_func&points=10&function={function}').status_code == 200
+    assert len(keys) == 3 and len(set(keys)) == 1
@@ -0,0 +1,33 @@
+import numpy as np
+from t_plane.analysis.argument_principle import locate_zeros_and_poles, winding_numbers
+
+def test_winding_numbers_count_zeros_and_poles():
+    """Test that cell winding numbers are +1 around a zero and -1 around a pole."""
+    axis = np.linspace(-1, 1, 21)
+    x, y = np.meshgrid(axis, axis)
+    tau = x + 1j * y
+    phase = np.angle((tau - 0.33 - 0.27j) / (tau + 0.52 + 0.41j))
+    winding = winding_numbers(phase)
+    assert winding.sum() == 0
+    assert np.count_nonzero(winding) == 2
+    assert winding[np.unravel_index(np.argmax(winding), winding.shape)] == 1
+
+def test_locate_zeros_and_poles_with_multiplicity():
+    """Test located zeros and poles of a rational function in τ, z and w coordinates."""
+    func = lambda tau: (1 / tau - 2) ** 2 * (1 / tau + 0.5j) / (1 / tau - 0.9)
+    axis = np.linspace(-2.9, 3.1, 77)
+    points = locate_zeros_and_poles(func, axis, axis)
+    found = {(p['type'], p['multiplicity'], round(p['z_real'], 8), round(p['z_imag'], 8))
+             for p in points if p['z_real'] is not None}
+    assert found == {('zero', 2, 2.0, 0.0), ('zero', 1, 0.0, -0.5), ('pole', 1, 0.9, 0.0)}
+    zero = next(p for p in points if p['multiplicity'] == 2)
+    assert np.isclose(zero['w_real'], np.log(0.5))
+
+def test_locate_zeros_transcendental():
+    """Test that zeros of sin(1/τ) are found without symbolic solving."""
+    axis = np.linspace(-1.5, 1.5, 101)
+    points = locate_zeros_and_poles(lambda tau: np.sin(1 / tau), axis, axis)
+    z = np.array([p['z_real'] for p in points])
+    assert len(points) >= 4
+    assert np.allclose(z / np.pi, np.round(z / np.pi), atol=1e-10)
+    assert all(p['type'] == 'zero' and p['multiplicity'] == 1 for p in points)
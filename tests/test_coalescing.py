@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+
+from t_plane.core.parallel import EvaluationCancelled
+from t_plane.interactive.coalescing import SingleFlight
+
+def _start_followers(flights, key, func, results, count, cancel=None):
+    """Start count threads calling flights.do(key, func, cancel) and wait until they are all waiting."""
+    def follow():
+        try:
+            results.append(flights.do(key, func, cancel))
+        except Exception as e:
+            results.append(e)
+    waiting = flights.stats()['coalesced'] + count
+    threads = [threading.Thread(target=follow) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    while flights.stats()['coalesced'] < waiting:
+        time.sleep(0.001)
+    return threads
+
+def test_concurrent_calls_share_one_computation():
+    """Test that calls arriving while the leader runs get its result without recomputing."""
+    flights = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def compute(cancel):
+        calls.append(1)
+        release.wait()
+        return 'grid'
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flights.do('view', compute)))
+    leader.start()
+    while flights.stats()['in_flight'] == 0:
+        time.sleep(0.001)
+    followers = _start_followers(flights, 'view', compute, results, 3)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join()
+    assert len(calls) == 1
+    assert sorted(results, key=lambda r: r[1]) == [('grid', False)] + [('grid', True)] * 3
+    # Finished flights are not cached
+    assert flights.do('view', lambda cancel: 'new') == ('new', False)
+    assert flights.stats() == {'leaders': 2, 'coalesced': 3, 'in_flight': 0}
+
+def test_leader_error_reaches_followers():
+    """Test that followers see the leader's exception."""
+    flights = SingleFlight()
+    release = threading.Event()
+
+    def fail(cancel):
+        release.wait()
+        raise ValueError("bad function")
+
+    results = []
+    leader = threading.Thread(target=lambda: pytest.raises(ValueError, flights.do, 'k', fail))
+    leader.start()
+    while flights.stats()['in_flight'] == 0:
+        time.sleep(0.001)
+    followers = _start_followers(flights, 'k', fail, results, 2)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join()
+    assert [type(r) for r in results] == [ValueError, ValueError]
+
+def test_flight_cancelled_only_when_every_caller_is():
+    """Test that cancelled followers stop waiting and the leader is cancelled only when all callers are."""
+    flights = SingleFlight()
+    leader_cancel, follower_cancel, other_cancel = threading.Event(), threading.Event(), threading.Event()
+    flight_cancels = []
+
+    def compute(cancel):
+        flight_cancels.append(cancel)
+        while not cancel.is_set():
+            time.sleep(0.001)
+        return 'cancelled'
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flights.do('view', compute, leader_cancel)))
+    leader.start()
+    while not flight_cancels:
+        time.sleep(0.001)
+    follower = _start_followers(flights, 'view', compute, results, 1, follower_cancel)
+    other = _start_followers(flights, 'view', compute, [], 2, other_cancel)
+    leader_cancel.set()
+    follower_cancel.set()
+    for thread in follower:
+        thread.join()
+    assert [type(r) for r in results] == [EvaluationCancelled]
+    # Another caller still wants the result
+    assert not flight_cancels[0].is_set() and leader.is_alive()
+    other_cancel.set()
+    for thread in [leader] + other:
+        thread.join()
+    assert results[1] == ('cancelled', False)
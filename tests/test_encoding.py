@@ -0,0 +1,29 @@
+import struct
+import numpy as np
+from t_plane.interactive.encoding import decode_binary, encode_binary, ALIGNMENT
+
+def test_binary_roundtrip():
+    """Test that arrays and metadata survive a binary encode/decode."""
+    result = {
+        'type': 'zeta',
+        'tau_x': np.linspace(-1, 1, 5),
+        'phase': np.arange(15, dtype=float).reshape(3, 5),
+        'mask': np.array([[1, 0, 1]], dtype=np.uint8),
+        'zeros': {'x': [0.1], 'y': [0.2]},
+    }
+    decoded = decode_binary(encode_binary(result, 'float64'))
+    assert decoded['type'] == 'zeta'
+    assert decoded['zeros'] == {'x': [0.1], 'y': [0.2]}
+    assert np.array_equal(decoded['tau_x'], result['tau_x'])
+    assert np.array_equal(decoded['phase'], result['phase'])
+    assert decoded['mask'].dtype == np.uint8
+
+def test_binary_buffers_are_aligned():
+    """Test that every buffer starts on an aligned offset for typed-array views."""
+    result = {'a': np.ones(3, dtype=np.uint8), 'b': np.ones((2, 3))}
+    payload = encode_binary(result, 'float32')
+    (header_length,) = struct.unpack_from('<I', payload)
+    assert (4 + header_length) % ALIGNMENT == 0
+    decoded = decode_binary(payload)
+    assert decoded['b'].dtype == np.float32
+    assert np.array_equal(decoded['b'], np.ones((2, 3)))
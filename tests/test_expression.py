@@ -0,0 +1,46 @@
+import time
+
+import numpy as np
+import pytest
+from t_plane.core.expression import compile_expression, cache_info
+
+def test_compile_expression_evaluates():
+    """Test that compiled expressions evaluate with NumPy semantics."""
+    z = np.array([1.0 + 1.0j, 2.0 - 0.5j])
+    f = compile_expression("sin(z)^2 + exp(z)/z - pi")
+    assert np.allclose(f(z), np.sin(z)**2 + np.exp(z) / z - np.pi)
+
+def test_compile_expression_constant_broadcasts():
+    """Test that a constant expression still returns a full grid."""
+    z = np.ones((3, 4), dtype=complex)
+    assert compile_expression("2*e")(z).shape == (3, 4)
+
+def test_compile_expression_rejects_unsafe_input():
+    """Test that names, attributes and calls outside the whitelist are rejected."""
+    for bad in ["__import__('os')", "z.real", "np.sin(z)", "zz + 1", "sin", "sin(z, key=1)", "'a'"]:
+        with pytest.raises(ValueError):
+            compile_expression(bad)
+
+def test_compile_expression_cache_hits():
+    """Test that equivalent spellings share one cache entry."""
+    before = cache_info()
+    first = compile_expression("z^3 +  1")
+    second = compile_expression("z**3 + 1")
+    after = cache_info()
+    assert first is second
+    assert after["hits"] == before["hits"] + 1
+
+def test_conjugate_symmetry_is_inferred():
+    """Test that expressions with real coefficients are marked conjugate-symmetric, and others not."""
+    z = np.array([0.3 + 1.7j, -2.0 + 0.5j, 1.1 - 0.4j])
+    for source in ["z**3 - 2*z + 1", "sin(z)/z", "2**z", "log(z)*pi", "sqrt(z) + abs(z)"]:
+        f = compile_expression(source)
+        assert f.conjugate_symmetric
+        np.testing.assert_allclose(f(np.conj(z)), np.conj(f(z)))
+    for source in ["z + 1j", "exp(1j*z)", "(-2)**z", "(-8)**(1/3) * z"]:
+        assert not compile_expression(source).conjugate_symmetric
+    # Decided from the tree: compiling never evaluates constant sub-expressions
+    start = time.perf_counter()
+    assert compile_expression("z + 9**9**8").conjugate_symmetric
+    assert compile_expression("z * (-2)**9**9**8") is not None
+    assert time.perf_counter() - start < 1
@@ -0,0 +1,45 @@
+import struct
+import zlib
+import numpy as np
+import pytest
+from t_plane.visualization.coloring import domain_coloring, domain_coloring_values
+from t_plane.visualization.image import encode_image, encode_png
+
+def decode_png(data):
+    """Minimal decoder for the PNGs written by encode_png (8-bit, 'Up' filter)."""
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    position, chunks = 8, {}
+    while position < len(data):
+        length, = struct.unpack(">I", data[position:position + 4])
+        kind = data[position + 4:position + 8]
+        payload = data[position + 8:position + 8 + length]
+        crc, = struct.unpack(">I", data[position + 8 + length:position + 12 + length])
+        assert crc == zlib.crc32(kind + payload)
+        chunks[kind] = chunks.get(kind, b"") + payload
+        position += 12 + length
+    width, height, depth, color_type = struct.unpack(">IIBB", chunks[b"IHDR"][:10])
+    channels = 3 if color_type == 2 else 4
+    rows = np.frombuffer(zlib.decompress(chunks[b"IDAT"]), dtype=np.uint8).reshape(height, -1)
+    assert np.all(rows[:, 0] == 2)
+    return np.cumsum(rows[:, 1:], axis=0, dtype=np.uint8).reshape(height, width, channels)
+
+def test_png_roundtrip():
+    """Test that encode_png stores RGB and RGBA images losslessly."""
+    rng = np.random.default_rng(0)
+    for channels in (3, 4):
+        image = rng.integers(0, 256, size=(17, 23, channels), dtype=np.uint8)
+        assert np.array_equal(decode_png(encode_png(image)), image)
+    with pytest.raises(ValueError):
+        encode_png(np.zeros((4, 4), dtype=np.uint8))
+
+def test_domain_coloring_hues():
+    """Test that phase 0, 2π/3 and -2π/3 map to red, green and blue hues."""
+    colors = domain_coloring(np.array([0.0, 2 * np.pi / 3, -2 * np.pi / 3, np.nan]), np.full(4, -0.001))
+    assert [int(np.argmax(c)) for c in colors[:3]] == [0, 1, 2]
+    assert colors[3].tolist() == [0, 0, 0]
+    assert domain_coloring_values(np.array([[1 + 0j, 0j]])).shape == (1, 2, 3)
+
+def test_encode_image_rejects_unknown_format():
+    """Test that only the supported image formats are accepted."""
+    with pytest.raises(ValueError):
+        encode_image(np.zeros((2, 2, 3), dtype=np.uint8), 'gif')
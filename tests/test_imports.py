@@ -0,0 +1,23 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def loaded_heavy_modules(module):
+    """Import module in a fresh interpreter and list the heavy libraries it loaded."""
+    probe = (f"import json, sys, {module}; "
+             "print(json.dumps([m for m in ('sympy', 'scipy', 'mpmath', 'matplotlib', 'plotly') "
+             "if m in sys.modules]))")
+    output = subprocess.run([sys.executable, '-c', probe], cwd=ROOT,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+def test_app_import_defers_heavy_libraries():
+    """Test that importing the web app loads none of the heavy optional libraries."""
+    assert loaded_heavy_modules('app') == []
+
+def test_plotter_import_defers_plotting_libraries():
+    """Test that importing the plotter does not load Matplotlib or Plotly."""
+    assert loaded_heavy_modules('t_plane.visualization.plotter') == []
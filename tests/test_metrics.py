@@ -0,0 +1,31 @@
+from t_plane.interactive.metrics import NULL_TIMER, PlotMetrics, StageTimer
+
+def test_histogram_buckets_are_cumulative():
+    """Test that bucket counts are cumulative and end with +Inf equal to the count."""
+    metrics = PlotMetrics(buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.5, 5.0):
+        timer = StageTimer()
+        timer.stages.append(('evaluate', seconds))
+        metrics.observe(timer, 'zeta', 'tau_plane')
+    lines = metrics.render().splitlines()
+    labels = 'stage="evaluate",plot_type="zeta",plane="tau_plane"'
+    assert f'tau_plane_plot_stage_seconds_bucket{{{labels},le="0.1"}} 1' in lines
+    assert f'tau_plane_plot_stage_seconds_bucket{{{labels},le="1.0"}} 2' in lines
+    assert f'tau_plane_plot_stage_seconds_bucket{{{labels},le="+Inf"}} 3' in lines
+    assert f'tau_plane_plot_stage_seconds_count{{{labels}}} 3' in lines
+    assert f'tau_plane_plot_stage_seconds_sum{{{labels}}} 5.55' in lines
+
+def test_unknown_labels_collapse_to_other():
+    """Test that unexpected plot types and planes do not create new series."""
+    metrics = PlotMetrics()
+    metrics.observe(StageTimer(), 'made_up', 'nowhere')
+    assert 'plot_type="other",plane="other"' in metrics.render()
+
+def test_disabled_metrics_record_nothing():
+    """Test that a disabled registry hands out the no-op timer and stays empty."""
+    metrics = PlotMetrics(enabled=False)
+    timer = metrics.timer()
+    timer.lap('grid')
+    metrics.observe(timer, 'zeta', 'tau_plane')
+    assert timer is NULL_TIMER and timer.server_timing() is None
+    assert '_count' not in metrics.render()
@@ -0,0 +1,102 @@
+import threading
+import numpy as np
+import pytest
+from t_plane.analysis.zeta import zeta
+from t_plane.core.parallel import EvaluationCancelled, GridEvaluator, SharedGrid
+
+def _reject(tau):
+    raise ValueError("rejected")
+
+@pytest.fixture
+def tau_grid():
+    axis = np.linspace(-2, 2, 40)
+    tau_x, tau_y = np.meshgrid(axis, axis)
+    return tau_x + 1j * tau_y
+
+def test_row_blocks_cover_grid():
+    """Test that row blocks are contiguous and cover every row exactly once."""
+    blocks = GridEvaluator(workers=3).row_blocks(41)
+    assert blocks[0][0] == 0 and blocks[-1][1] == 41
+    assert all(stop == start for (_, stop), (start, _) in zip(blocks, blocks[1:]))
+
+@pytest.mark.parametrize('backend', ['thread', 'process'])
+def test_parallel_matches_serial(backend, tau_grid):
+    """Test that block-parallel evaluation reproduces a single serial call."""
+    evaluator = GridEvaluator(workers=2, backend=backend, min_points=0)
+    try:
+        with SharedGrid(tau_grid.shape) as output:
+            values = evaluator.evaluate(zeta, 1 / tau_grid, out=output)
+            assert values is output.array
+            np.testing.assert_allclose(values, zeta(1 / tau_grid), rtol=1e-12)
+        plain = evaluator.evaluate(np.exp, tau_grid)
+        np.testing.assert_allclose(plain, np.exp(tau_grid))
+    finally:
+        evaluator.shutdown()
+
+def test_parallel_propagates_errors(tau_grid):
+    """Test that an exception raised in a worker reaches the caller."""
+    evaluator = GridEvaluator(workers=2, backend='process', min_points=0)
+    try:
+        with pytest.raises(ValueError, match="rejected"):
+            evaluator.evaluate(_reject, tau_grid)
+    finally:
+        evaluator.shutdown()
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_cancel_stops_between_blocks(workers, tau_grid):
+    """Test that setting the cancel flag drops the blocks not yet started."""
+    evaluator = GridEvaluator(workers=workers, backend='thread', min_points=0)
+    cancel = threading.Event()
+    evaluated = []
+
+    def cancel_after_first_block(tau):
+        evaluated.append(len(tau))
+        cancel.set()
+        return tau
+
+    try:
+        with pytest.raises(EvaluationCancelled):
+            evaluator.evaluate(cancel_after_first_block, tau_grid, cancel=cancel)
+        assert sum(evaluated) < tau_grid.shape[0]
+        with pytest.raises(EvaluationCancelled):
+            evaluator.evaluate(np.exp, tau_grid[:2, :2], cancel=cancel)
+    finally:
+        evaluator.shutdown()
+
+def test_conjugate_symmetric_grid_evaluates_half(tau_grid):
+    """Test that a declared symmetry evaluates only the upper rows and mirrors the rest."""
+    evaluator = GridEvaluator(workers=1)
+    rows = []
+
+    def counted_zeta(tau):
+        rows.append(tau.shape[0])
+        return zeta(1 / tau)
+
+    values = evaluator.evaluate(counted_zeta, tau_grid, conjugate_symmetric=True)
+    assert sum(rows) == tau_grid.shape[0] // 2
+    np.testing.assert_allclose(values, zeta(1 / tau_grid), rtol=1e-9)
+    # A grid that is not symmetric about the real axis is evaluated in full
+    rows.clear()
+    evaluator.evaluate(counted_zeta, tau_grid[1:], conjugate_symmetric=True)
+    assert sum(rows) == tau_grid.shape[0] - 1
+
+def test_conjugate_symmetric_writes_into_shared_output(tau_grid, monkeypatch):
+    """Test that a symmetric process evaluation fills the caller's SharedGrid without another output segment."""
+    evaluator = GridEvaluator(workers=2, backend='process', min_points=0)
+    try:
+        with SharedGrid(tau_grid.shape) as output:
+            created = []
+            original_init = SharedGrid.__init__
+
+            def counting_init(self, *args, **kwargs):
+                created.append(args)
+                original_init(self, *args, **kwargs)
+
+            monkeypatch.setattr(SharedGrid, '__init__', counting_init)
+            values = evaluator.evaluate(zeta, 1 / tau_grid, out=output, conjugate_symmetric=True)
+            # Only the shared input grid
+            assert len(created) == 1
+            assert values is output.array
+            np.testing.assert_allclose(values, zeta(1 / tau_grid), rtol=1e-9)
+    finally:
+        evaluator.shutdown()
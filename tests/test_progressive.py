@@ -0,0 +1,21 @@
+import numpy as np
+from t_plane.interactive.progressive import progressive_evaluate, refinement_strides
+
+def test_refinement_strides():
+    """Test that strides halve down to 1 starting near the base resolution."""
+    assert refinement_strides(300) == [8, 4, 2, 1]
+    assert refinement_strides(20) == [1]
+
+def test_progressive_evaluate_reuses_samples():
+    """Test that every grid point is evaluated exactly once across levels."""
+    axis = np.linspace(-1, 1, 65)
+    tau_x, tau_y = np.meshgrid(axis, axis)
+    tau = tau_x + 1j * tau_y
+    evaluated = []
+    def func(values):
+        evaluated.append(len(values))
+        return values ** 2
+    levels = [(stride, values.copy()) for stride, values in progressive_evaluate(func, tau, [4, 2, 1])]
+    assert sum(evaluated) == tau.size
+    assert np.allclose(levels[0][1][::4, ::4], tau[::4, ::4] ** 2)
+    assert np.allclose(levels[-1][1], tau ** 2)
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from t_plane.core.tau_plane import TauPlane
+from t_plane.visualization.coloring import domain_coloring
+from t_plane.visualization.renderer import render_to_disk
+
+def cubic(tau):
+    return tau ** 3 - 1
+
+def test_render_matches_direct_evaluation(tmp_path):
+    """Test that the tiled render equals evaluating the whole grid at once."""
+    tau_plane = TauPlane(delta=0.05)
+    manifest = render_to_disk(cubic, str(tmp_path), -2.0, 2.0, 50, tile_size=16, tau_plane=tau_plane)
+    tau_x, tau_y = tau_plane.create_tau_grid(-2.0, 2.0, 50)
+    values = cubic(tau_x + 1j * tau_y)
+    phase = np.load(tmp_path / 'phase.npy')
+    assert list(phase.shape) == manifest['shape'] == list(values.shape)
+    assert np.allclose(phase, np.angle(values), atol=1e-6)
+    log_magnitude = np.load(tmp_path / 'log_magnitude.npy')
+    assert np.allclose(log_magnitude, np.log10(np.abs(values)), atol=1e-5)
+    assert np.array_equal(np.load(tmp_path / 'rgb.npy'), domain_coloring(phase, log_magnitude))
+
+def test_render_resumes_after_interruption(tmp_path):
+    """Test that a rerun only evaluates the tiles an interrupted render did not finish."""
+    calls = []
+    def counting(tau):
+        calls.append(tau.shape)
+        return cubic(tau)
+    def failing(tau):
+        if len(calls) == 4:
+            raise RuntimeError("interrupted")
+        return counting(tau)
+    with pytest.raises(RuntimeError):
+        render_to_disk(failing, str(tmp_path), -2.0, 2.0, 40, tile_size=16)
+    # 3×3 tiles: the first row of tiles was checkpointed before the failure
+    assert np.load(tmp_path / 'tiles_done.npy').sum() == 3
+    
+    calls.clear()
+    render_to_disk(counting, str(tmp_path), -2.0, 2.0, 40, tile_size=16)
+    assert len(calls) == 6
+    full = tmp_path / 'full'
+    render_to_disk(cubic, str(full), -2.0, 2.0, 40, tile_size=16)
+    assert np.array_equal(np.load(tmp_path / 'rgb.npy'), np.load(full / 'rgb.npy'))
+
+def test_render_refuses_different_parameters(tmp_path):
+    """Test that resuming into a directory with another render is an error."""
+    render_to_disk(cubic, str(tmp_path), -2.0, 2.0, 20, tile_size=16)
+    with pytest.raises(ValueError):
+        render_to_disk(cubic, str(tmp_path), -2.0, 2.0, 30, tile_size=16)
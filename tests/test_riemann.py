@@ -0,0 +1,30 @@
+import mpmath as mp
+import numpy as np
+from t_plane.analysis.riemann import RiemannAnalysis
+from t_plane.core.tau_plane import TauPlane
+
+def test_zeta_in_tau_plane_complex():
+    """Test that ζ(1/τ) is evaluated correctly for complex τ."""
+    riemann = RiemannAnalysis(TauPlane(delta=1e-2))
+    tau_x, tau_y = riemann.tau_plane.create_tau_grid(-3.0, 3.0, 20)
+    tau = tau_x + 1j * tau_y
+    result = riemann.zeta_in_tau_plane(tau)
+    expected = np.array([complex(mp.zeta(1 / complex(t))) for t in tau.ravel()]).reshape(tau.shape)
+    assert result.shape == tau.shape
+    assert np.allclose(result, expected, rtol=1e-12, atol=0)
+
+def test_zeta_in_tau_plane_high_precision():
+    """Test that requesting more digits than float64 holds returns mpmath values."""
+    riemann = RiemannAnalysis()
+    result = riemann.zeta_in_tau_plane(np.array([0.5, 0.25j]), digits=30)
+    assert result.dtype == object
+    with mp.workdps(30):
+        assert abs(result[0] - mp.pi**2 / 6) < mp.mpf(10)**-28
+
+def test_calculate_zeros_t_matches_mpmath():
+    """Test that computed zero heights agree with mpmath beyond the old 15-entry list."""
+    riemann = RiemannAnalysis()
+    zeros = riemann.calculate_zeros_t(60)
+    assert len(zeros) == 60
+    for k in (1, 15, 16, 60):
+        assert abs(zeros[k - 1] - float(mp.zetazero(k).imag)) < 1e-8
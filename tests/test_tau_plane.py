@@ -74,3 +74,57 @@ def test_liminal_circle():
     x, y = tau_plane.liminal_circle()
     distances = np.sqrt(x**2 + y**2)
     assert np.allclose(distances, 10 * tau_plane.delta)
+
+def test_to_tau_zero_policies():
+    """Test that on_zero maps z = 0 to NaN or infinity instead of raising."""
+    tau_plane = TauPlane()
+    z = np.array([2.0 + 0j, 0j, -4.0 + 0j])
+    assert np.allclose(tau_plane.to_tau(z, on_zero='nan'), [0.5, np.nan, -0.25], equal_nan=True)
+    assert np.isinf(tau_plane.to_tau(z, on_zero='inf')[1])
+    assert np.isnan(tau_plane.from_tau(0.0, on_zero='nan'))
+    with pytest.raises(ValueError):
+        tau_plane.to_tau(z, on_zero='ignore')
+
+def test_to_tau_out_and_dtype():
+    """Test in-place, out= and complex64 transforms across chunk boundaries."""
+    tau_plane = TauPlane()
+    z = np.linspace(1, 2, 1001) + 1j * np.linspace(-1, 1, 1001)
+    expected = 1.0 / z
+    
+    single = tau_plane.to_tau(z, dtype=np.complex64, chunk_size=100)
+    assert single.dtype == np.complex64
+    assert np.allclose(single, expected, rtol=1e-6)
+    
+    out = np.empty_like(z)
+    assert tau_plane.to_tau(z, out=out, chunk_size=7) is out
+    assert np.allclose(out, expected)
+    
+    in_place = z.copy()
+    tau_plane.from_tau(in_place, out=in_place, chunk_size=64)
+    assert np.allclose(in_place, expected)
+    
+    strided = np.empty((1001, 2), dtype=complex)[:, 0]
+    tau_plane.to_tau(z, out=strided)
+    assert np.allclose(strided, expected)
+    
+    with pytest.raises(ValueError):
+        tau_plane.to_tau(z, out=np.empty(5, dtype=complex))
+
+def test_sparse_grid_broadcasts_to_dense():
+    """Test that the sparse grid broadcasts to the dense meshgrids."""
+    tau_plane = TauPlane(delta=0.1)
+    tau_x, tau_y = tau_plane.create_tau_grid(-2.0, 3.0, 50)
+    sparse_x, sparse_y = tau_plane.create_tau_grid(-2.0, 3.0, 50, sparse=True)
+    assert sparse_x.shape == (1, tau_x.shape[1]) and sparse_y.shape == (tau_y.shape[0], 1)
+    assert np.array_equal(sparse_x + 1j * sparse_y, tau_x + 1j * tau_y)
+
+@pytest.mark.parametrize('block_shape', [(7, None), (16, 9), (1000, 1000)])
+def test_iter_tau_blocks_cover_grid(block_shape):
+    """Test that the blocks tile the grid exactly, in any block shape."""
+    tau_plane = TauPlane(delta=0.1)
+    tau_x, tau_y = tau_plane.create_tau_grid(-2.0, 3.0, 50)
+    assembled = np.full(tau_x.shape, np.nan, dtype=complex)
+    for rows, cols, tau in tau_plane.iter_tau_blocks(-2.0, 3.0, 50, block_shape=block_shape):
+        assert np.all(np.isnan(assembled[rows, cols]))
+        assembled[rows, cols] = tau
+    assert np.array_equal(assembled, tau_x + 1j * tau_y)
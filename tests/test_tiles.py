@@ -0,0 +1,24 @@
+import numpy as np
+from t_plane.interactive.tiles import TileCache, tile_axes
+
+def test_tile_axes_are_contiguous():
+    """Test that neighbouring tiles join seamlessly and never sample τ = 0."""
+    left_x, _ = tile_axes(2, -1, 0, size=8)
+    right_x, _ = tile_axes(2, 0, 0, size=8)
+    step = right_x[1] - right_x[0]
+    assert np.isclose(right_x[0] - left_x[-1], step)
+    assert np.all(left_x < 0) and np.all(right_x > 0)
+
+def test_tile_cache_evicts_least_recently_used():
+    """Test that the tile cache stays within its memory budget."""
+    tile = {'phase': np.zeros(100)}  # 800 bytes
+    cache = TileCache(max_bytes=2000)
+    cache.put('a', tile)
+    cache.put('b', tile)
+    assert cache.get('a') is tile
+    cache.put('c', tile)
+    assert cache.get('b') is None
+    assert cache.get('a') is tile
+    stats = cache.stats()
+    assert stats['bytes'] <= 2000
+    assert stats['evictions'] == 1
@@ -0,0 +1,49 @@
+import numpy as np
+from t_plane.interactive.viewport import ViewportCache
+
+def grid(tau_x, tau_y):
+    tau = tau_x[np.newaxis, :] + 1j * tau_y[:, np.newaxis]
+    return tau ** 2 + 1
+
+def counting(evaluated):
+    def evaluate_grid(tau_x, tau_y):
+        evaluated.append(len(tau_x) * len(tau_y))
+        return grid(tau_x, tau_y)
+    return evaluate_grid
+
+def test_pan_evaluates_only_uncovered_strips():
+    """Test that a pan snaps onto the cached lattice and evaluates only new samples."""
+    cache = ViewportCache()
+    evaluated = []
+    axis = np.linspace(-3, 3, 61)
+    cache.evaluate('view', axis, axis, counting(evaluated))
+    
+    # Pan by 5.3 steps right and 2 steps down
+    tau_x, tau_y = cache.align('view', axis + 0.53, axis - 0.2)
+    assert np.allclose(tau_x, axis + 0.5) and np.allclose(tau_y, axis - 0.2)
+    evaluated.clear()
+    values, reused = cache.evaluate('view', tau_x, tau_y, counting(evaluated))
+    assert sum(evaluated) == 61 * 61 - 56 * 59
+    assert reused == 56 * 59 / 61 ** 2
+    assert np.allclose(values, grid(tau_x, tau_y))
+
+def test_zoom_or_disjoint_view_is_recomputed():
+    """Test that views with another spacing or no overlap are evaluated in full."""
+    cache = ViewportCache()
+    axis = np.linspace(-3, 3, 61)
+    cache.evaluate('view', axis, axis, grid)
+    zoomed = np.linspace(-2, 2, 61)
+    assert cache.align('view', zoomed, zoomed)[0] is zoomed
+    assert cache.evaluate('view', zoomed, zoomed, grid)[1] == 0.0
+    far = zoomed + 100
+    assert cache.evaluate('view', far, far, grid)[1] == 0.0
+
+def test_viewport_cache_budget():
+    """Test that least recently used views are evicted beyond the memory budget."""
+    axis = np.linspace(-1, 1, 32)
+    cache = ViewportCache(max_bytes=2 * (32 * 32 * 16 + 2 * 32 * 8))
+    for key in 'abc':
+        cache.evaluate(key, axis, axis, grid)
+    assert cache.stats()['views'] == 2
+    assert cache.evaluate('a', axis, axis, grid)[1] == 0.0
+    assert cache.evaluate('c', axis, axis, grid)[1] == 1.0
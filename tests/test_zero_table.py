@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from t_plane.analysis.riemann import RiemannAnalysis
+from t_plane.analysis.zero_table import ZeroTable, build_zero_table, write_zero_table
+from t_plane.analysis.zeros import ZeroFinder
+
+def test_build_zero_table_in_chunks(tmp_path):
+    """Test that a table built in small chunks matches the zero finder."""
+    path = str(tmp_path / 'zeros.tzt')
+    count = build_zero_table(path, t_max=2000.0, chunk=100)
+    table = ZeroTable(path)
+    expected = ZeroFinder().zeros_between(0.0, 2000.0)
+    assert count == len(table) == len(expected)
+    assert isinstance(table.heights, np.memmap)
+    assert np.array_equal(table.heights, expected)
+
+def test_zero_table_window_binary_search(tmp_path):
+    """Test window queries across index blocks against np.searchsorted."""
+    path = str(tmp_path / 'zeros.tzt')
+    heights = np.cumsum(np.full(1000, 0.5)) + 10.0
+    write_zero_table(path, np.array_split(heights, 7), index_stride=16)
+    table = ZeroTable(path)
+    assert len(table.index) == 1000 // 16 + 1
+    for t_min, t_max in [(0.0, 5.0), (10.5, 10.5), (42.25, 317.0), (100.0, 1e9)]:
+        start = np.searchsorted(heights, t_min, side='left')
+        stop = np.searchsorted(heights, t_max, side='right')
+        assert np.array_equal(table.window(t_min, t_max), heights[start:stop])
+
+def test_write_zero_table_rejects_unsorted(tmp_path):
+    """Test that heights must be strictly ascending across chunks."""
+    with pytest.raises(ValueError):
+        write_zero_table(str(tmp_path / 'bad.tzt'), [np.array([1.0, 2.0]), np.array([2.0])])
+
+def test_riemann_zero_window_uses_table(tmp_path):
+    """Test that RiemannAnalysis answers covered windows from the table, in τ coordinates."""
+    path = str(tmp_path / 'zeros.tzt')
+    build_zero_table(path, count=50)
+    riemann = RiemannAnalysis(zero_table=path)
+    tau_x, tau_y = riemann.zeros_in_tau_window(20.0, 40.0)
+    t = np.array(riemann.zero_table.window(20.0, 40.0))
+    assert len(t) == 5
+    assert np.allclose(tau_x + 1j * tau_y, 1 / (0.5 + 1j * t))
+    assert riemann.calculate_zeros_t(50) == riemann.zero_table.heights.tolist()
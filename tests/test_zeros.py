@@ -0,0 +1,31 @@
+import mpmath as mp
+import numpy as np
+from t_plane.analysis.zeros import ZeroFinder, gram_points, riemann_siegel_z, theta
+
+def test_riemann_siegel_z_matches_mpmath():
+    """Test Hardy's Z on both sides of the Riemann–Siegel switch-over height."""
+    t = np.array([20.0, 150.5, 999.0, 1500.25, 20000.0])
+    expected = np.array([float(mp.siegelz(x)) for x in t])
+    assert np.allclose(riemann_siegel_z(t), expected, rtol=0, atol=1e-7)
+
+def test_gram_points_solve_theta():
+    """Test that θ(g_n) = nπ at the computed Gram points."""
+    n = np.array([-1, 0, 1, 100, 5000])
+    assert np.allclose(theta(gram_points(n)), n * np.pi, rtol=0, atol=1e-9)
+
+def test_zero_count_matches_riemann_von_mangoldt():
+    """Test that no zeros are missed between 1000 zeros, including close pairs."""
+    finder = ZeroFinder()
+    zeros = finder.first_zeros(1000)
+    assert np.all(np.diff(zeros) > 0)
+    assert abs(zeros[-1] - float(mp.zetazero(1000).imag)) < 1e-7
+    assert np.array_equal(finder.zeros_between(zeros[9], zeros[19]), zeros[9:20])
+
+def test_zeros_between_high_window():
+    """Test a window above the contiguous cache against mpmath."""
+    finder = ZeroFinder(prefix_limit=100.0)
+    zeros = finder.zeros_between(5000.0, 5010.0)
+    assert zeros[0] >= 5000.0 and zeros[-1] <= 5010.0
+    for t in zeros:
+        assert abs(float(mp.siegelz(t))) < 1e-7
+    assert abs(len(zeros) - (theta(5010.0) - theta(5000.0)) / np.pi) < 2
@@ -0,0 +1,29 @@
+import mpmath as mp
+import numpy as np
+import pytest
+from t_plane.analysis.zeta import zeta
+
+def test_zeta_special_values():
+    """Test known values of the zeta function."""
+    assert abs(zeta(2) - np.pi**2 / 6) < 1e-14
+    assert abs(zeta(0) + 0.5) < 1e-14
+    assert abs(zeta(-1) + 1 / 12) < 1e-14
+    assert abs(zeta(-2)) < 1e-14
+    assert np.isinf(zeta(1))
+
+def test_zeta_matches_mpmath():
+    """Test the vectorized evaluator against mpmath across the plane."""
+    rng = np.random.default_rng(0)
+    s = rng.uniform(-20, 20, 200) + 1j * rng.uniform(-50, 50, 200)
+    expected = np.array([complex(mp.zeta(complex(p))) for p in s])
+    result = zeta(s)
+    assert np.allclose(result, expected, rtol=1e-12, atol=0)
+
+def test_zeta_preserves_shape_and_nan():
+    """Test that grid shape is preserved and NaN inputs stay NaN."""
+    s = np.array([[2.0, np.nan], [0.5 + 14.134725142j, 3j]])
+    result, error = zeta(s, return_error=True)
+    assert result.shape == s.shape
+    assert np.isnan(result[0, 1])
+    assert abs(result[1, 0]) < 1e-8
+    assert np.all(error[np.isfinite(result)] < 1e-12)